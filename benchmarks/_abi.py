@@ -0,0 +1,40 @@
+"""
+ABI shared by the benchmarks: functions of a few parameters, with an event every 10 functions.
+"""
+
+import json
+from collections.abc import Sequence
+from typing import Any
+
+
+def make_abi(
+    entries: int, extra_inputs: Sequence[dict[str, Any]] = (), events: bool = True
+) -> str:
+    abi: list[dict[str, Any]] = []
+    for i in range(entries):
+        abi.append(
+            {
+                "inputs": [
+                    {"internalType": "address", "name": "owner", "type": "address"},
+                    {"internalType": "uint256", "name": f"value{i}", "type": "uint256"},
+                    *extra_inputs,
+                ],
+                "name": f"function{i}",
+                "outputs": [{"internalType": "bool", "name": "", "type": "bool"}],
+                "stateMutability": "view" if i % 2 else "nonpayable",
+                "type": "function",
+            }
+        )
+        if events and i % 10 == 0:
+            abi.append(
+                {
+                    "anonymous": False,
+                    "inputs": [
+                        {"indexed": True, "name": "from", "type": "address"},
+                        {"indexed": False, "name": "value", "type": "uint256"},
+                    ],
+                    "name": f"Event{i}",
+                    "type": "event",
+                }
+            )
+    return json.dumps(abi)
@@ -0,0 +1,92 @@
+"""
+Benchmark importing the shipped example modules with each `--abi-embedding`,
+compiled from source on every import and from `__pycache__` bytecode.
+Import time and allocated memory only cover the generated module, web3 is imported beforehand.
+
+usage: python benchmarks/bench_abi_embedding.py [--repeat 5]
+"""
+
+import argparse
+import importlib.util
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from py_contract_codegen.modules.code_generator import ContractCodeGenerator
+from py_contract_codegen.modules.constants import TEMPLATE_PATH
+from py_contract_codegen.modules.enums import ABIEmbedding, Bytecode
+
+EXAMPLES_PATH = (
+    Path(__file__).parent.parent / "src/py_contract_codegen/generated/contract"
+)
+EXAMPLES = ("usdt", "uniswap_v3", "crypto_kitties")
+
+IMPORT_SCRIPT = """
+import importlib.util, json, sys, time, tracemalloc
+import web3, web3.contract.contract, web3.types, hexbytes
+spec = importlib.util.spec_from_file_location("example", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+tracemalloc.start()
+start = time.perf_counter()
+spec.loader.exec_module(module)
+elapsed = time.perf_counter() - start
+current, _ = tracemalloc.get_traced_memory()
+print(json.dumps([elapsed, current]))
+"""
+
+
+def example_abi(name: str) -> str:
+    spec = importlib.util.spec_from_file_location(name, EXAMPLES_PATH / f"{name}.py")
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return json.dumps(module.ABI)
+
+
+def measure_import(path: Path, from_source: bool, repeat: int) -> tuple[float, int]:
+    # an empty pycache prefix hides the bytecode written next to the module
+    flags = (
+        ["-B", "-X", f"pycache_prefix={path.parent / 'none'}"] if from_source else []
+    )
+    runs = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, *flags, "-c", IMPORT_SCRIPT, str(path)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        runs.append(json.loads(result.stdout))
+    elapsed, current = min(runs)
+    return elapsed, current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name in EXAMPLES:
+            abi_content = example_abi(name)
+            for abi_embedding in ABIEmbedding:
+                out_file = Path(tmp_dir) / abi_embedding.value / f"{name}.py"
+                ContractCodeGenerator(
+                    abi_content=abi_content,
+                    template_path=TEMPLATE_PATH,
+                    abi_embedding=abi_embedding,
+                    bytecode=Bytecode.unchecked_hash,
+                ).generate_file(out_file)
+                source, source_mem = measure_import(out_file, True, args.repeat)
+                cached, cached_mem = measure_import(out_file, False, args.repeat)
+                print(
+                    f"{name:<15} {abi_embedding.value:<8} {out_file.stat().st_size / 1024:7.1f} KiB"
+                    f"  source {source * 1000:6.2f} ms {source_mem / 1024:7.1f} KiB"
+                    f"  bytecode {cached * 1000:6.2f} ms {cached_mem / 1024:7.1f} KiB"
+                )
+
+
+if __name__ == "__main__":
+    main()
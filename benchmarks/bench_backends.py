@@ -0,0 +1,73 @@
+"""
+Benchmark rendering a module with the Jinja templates, with the Jinja templates formatted by black,
+and with the `ast` backend, which lays its output out like black without running it.
+The `ast` output is checked to be the same as the formatted Jinja output.
+
+usage: python benchmarks/bench_backends.py [--entries 2000] [--repeat 5]
+"""
+
+import argparse
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from _abi import make_abi
+
+from py_contract_codegen.modules.code_generator import ContractCodeGenerator
+from py_contract_codegen.modules.constants import TEMPLATE_PATH
+from py_contract_codegen.modules.enums import Backend
+from py_contract_codegen.modules.ir import ContractIR
+
+# inputs added to every function, so some signatures are long enough to be split
+EXTRA_INPUTS = [
+    {"internalType": "bytes32[]", "name": "proof", "type": "bytes32[]"},
+]
+
+
+def measure(func: Callable[[], Any], repeat: int) -> tuple[float, int]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--entries", type=int, default=2_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    abi_content = make_abi(args.entries, EXTRA_INPUTS)
+    # parse once, so only rendering is measured
+    ir = ContractIR.from_abi(abi_content)
+    outputs = {}
+    for label, backend, format_output in (
+        ("jinja", Backend.jinja, False),
+        ("jinja+black", Backend.jinja, True),
+        ("ast", Backend.ast, False),
+    ):
+        generator = ContractCodeGenerator(
+            abi_content=abi_content,
+            template_path=TEMPLATE_PATH,
+            ir=ir,
+            backend=backend,
+            format_output=format_output,
+        )
+        elapsed, peak = measure(generator.generate, args.repeat)
+        outputs[label] = generator.generate()
+        print(
+            f"{label:<12} {elapsed * 1000:8.1f} ms  peak {peak / 2**20:6.1f} MiB"
+            f"  {len(outputs[label].splitlines()):>8} lines"
+        )
+    assert outputs["ast"] == outputs["jinja+black"], "ast output differs from black's"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark `format_abi_for_python` against the previous `json.dumps` + regex rewrite.
+
+usage: python benchmarks/bench_format_abi.py [--entries 10000] [--repeat 5]
+"""
+
+import argparse
+import json
+import re
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from py_contract_codegen.modules.abi import format_abi_for_python
+
+REPLACE_PATTERN = re.compile(r"\b(true|false|null)\b")
+KEYWORDS = {"true": "True", "false": "False", "null": "None"}
+
+
+def format_abi_with_regex(abi: list[dict[str, Any]]) -> str:
+    abi_json = json.dumps(abi, indent=4)
+    return REPLACE_PATTERN.sub(lambda m: KEYWORDS[m.group(1)], abi_json)
+
+
+def make_abi(entries: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "constant": i % 2 == 0,
+            "inputs": [
+                {"internalType": "address", "name": "owner", "type": "address"},
+                {"internalType": "uint256", "name": f"value{i}", "type": "uint256"},
+            ],
+            "name": f"function{i}",
+            "outputs": [{"internalType": "bool", "name": "", "type": "bool"}],
+            "payable": False,
+            "stateMutability": "nonpayable",
+            "type": "function",
+        }
+        for i in range(entries)
+    ]
+
+
+def measure(
+    func: Callable[[list[dict[str, Any]]], str], abi: list[dict[str, Any]], repeat: int
+) -> tuple[float, int]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(abi)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    func(abi)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--entries", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    abi = make_abi(args.entries)
+    assert format_abi_for_python(abi) == format_abi_with_regex(abi)
+    for name, func in (
+        ("json.dumps + regex", format_abi_with_regex),
+        ("format_abi_for_python", format_abi_for_python),
+    ):
+        elapsed, peak = measure(func, abi, args.repeat)
+        print(f"{name:<24} {elapsed * 1000:8.1f} ms  peak {peak / 2**20:6.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
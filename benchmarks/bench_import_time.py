@@ -0,0 +1,47 @@
+"""
+Benchmark import time of the CLI and the modules it loads lazily, with `python -X importtime`.
+
+usage: python benchmarks/bench_import_time.py [--repeat 5]
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+
+MODULES = (
+    "py_contract_codegen.cli",
+    "py_contract_codegen.modules.client",
+    "py_contract_codegen.modules.code_generator",
+    "py_contract_codegen.modules.etherscan",
+)
+IMPORT_TIME_LINE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \| (\S+)")
+
+
+def import_time_us(module: str) -> int:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # sum the cumulative time of top-level imports, leaving out interpreter startup (`site`)
+    return sum(
+        int(m.group(1))
+        for m in map(IMPORT_TIME_LINE.match, result.stderr.splitlines())
+        if m and m.group(2) != "site"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for module in MODULES:
+        best = min(import_time_us(module) for _ in range(args.repeat))
+        print(f"{module:<45} {best / 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark building the template context with `dataclasses.asdict(ABIParser)` against `ABIParser.render_view`,
+and rendering a module from each.
+
+usage: python benchmarks/bench_render_context.py [--entries 2000] [--repeat 5]
+"""
+
+import argparse
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict
+from functools import partial
+from typing import Any
+
+from _abi import make_abi
+
+from py_contract_codegen.modules.abi import ABIParser
+from py_contract_codegen.modules.constants import TEMPLATE_PATH
+from py_contract_codegen.modules.enums import TargetLib
+from py_contract_codegen.modules.templates import get_template
+
+
+def asdict_context(parser: ABIParser) -> dict[str, Any]:
+    context = asdict(parser)
+    context["contract_class_name"] = "BenchContract"
+    return context
+
+
+def view_context(parser: ABIParser) -> dict[str, Any]:
+    return parser.render_view().context("BenchContract")
+
+
+def measure(func: Callable[[], Any], repeat: int) -> tuple[float, int]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--entries", type=int, default=2_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    abi_parser = ABIParser(abi=make_abi(args.entries))
+    template = get_template(TEMPLATE_PATH, TargetLib.web3_v7)
+    assert template.render(asdict_context(abi_parser)) == template.render(
+        view_context(abi_parser)
+    )
+
+    def render(build_context: Callable[[ABIParser], dict[str, Any]]) -> str:
+        return template.render(build_context(abi_parser))
+
+    for name, build_context in (
+        ("asdict", asdict_context),
+        ("render_view", view_context),
+    ):
+        elapsed, peak = measure(partial(build_context, abi_parser), args.repeat)
+        print(
+            f"{name + ' context':<20} {elapsed * 1000:8.1f} ms  peak {peak / 2**20:6.1f} MiB"
+        )
+        elapsed, peak = measure(partial(render, build_context), args.repeat)
+        print(
+            f"{name + ' render':<20} {elapsed * 1000:8.1f} ms  peak {peak / 2**20:6.1f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
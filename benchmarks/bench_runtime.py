@@ -0,0 +1,89 @@
+"""
+Benchmark the classes generated for the shipped examples against those generated with `--runtime`:
+creating an instance for one address and for new addresses with the same `Web3`,
+and building a `transfer` transaction function through the generated method.
+
+usage: python benchmarks/bench_runtime.py [--number 50] [--repeat 5]
+"""
+
+import argparse
+import importlib.util
+import json
+import tempfile
+import timeit
+from functools import partial
+from pathlib import Path
+
+from web3 import Web3
+
+from py_contract_codegen.modules.code_generator import ContractCodeGenerator
+from py_contract_codegen.modules.constants import TEMPLATE_PATH
+from py_contract_codegen.modules.enums import Bytecode
+
+EXAMPLES_PATH = (
+    Path(__file__).parent.parent / "src/py_contract_codegen/generated/contract"
+)
+EXAMPLES = ("usdt", "uniswap_v3", "crypto_kitties")
+ADDRESS = "0x0000000000000000000000000000000000000001"
+
+
+def load(path: Path):
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def best(statement, number: int, repeat: int) -> float:
+    return min(timeit.repeat(statement, number=number, repeat=repeat)) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    w3 = Web3()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name in EXAMPLES:
+            abi_content = json.dumps(load(EXAMPLES_PATH / f"{name}.py").ABI)
+            for runtime in (False, True):
+                label = "runtime" if runtime else "default"
+                out_file = Path(tmp_dir) / f"{name}_{label}.py"
+                ContractCodeGenerator(
+                    abi_content=abi_content,
+                    template_path=TEMPLATE_PATH,
+                    contract_class_name="Contract",
+                    bytecode=Bytecode.unchecked_hash,
+                    runtime=runtime,
+                ).generate_file(out_file)
+                cls = load(out_file).Contract
+                addresses = iter(
+                    Web3.to_checksum_address(f"0x{i:040x}")
+                    for i in range(2, 2 + args.number * args.repeat)
+                )
+                same = best(partial(cls, ADDRESS, w3), args.number, args.repeat)
+                new = best(
+                    lambda cls=cls, addresses=addresses: cls(next(addresses), w3),
+                    args.number,
+                    args.repeat,
+                )
+                line = (
+                    f"{name:<15} {label:<8} create {same * 1000:7.3f} ms"
+                    f"  new address {new * 1000:7.3f} ms"
+                )
+                contract = cls(ADDRESS, w3)
+                if hasattr(contract, "transfer"):
+                    transfer = best(
+                        partial(contract.transfer, ADDRESS, 1),
+                        args.number,
+                        args.repeat,
+                    )
+                    line += f"  transfer {transfer * 1e6:7.1f} us"
+                print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark a module with every method against a `--stub` module, for a contract with many functions:
+import time and memory from `__pycache__` bytecode, creating a contract, and the first and later calls of a method.
+web3 is imported beforehand, so only the generated module is measured.
+
+usage: python benchmarks/bench_stub.py [--entries 500] [--repeat 5]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from _abi import make_abi
+
+from py_contract_codegen.modules.code_generator import ContractCodeGenerator
+from py_contract_codegen.modules.constants import TEMPLATE_PATH
+from py_contract_codegen.modules.enums import Bytecode
+
+MEASURE_SCRIPT = """
+import importlib.util, json, sys, time, tracemalloc
+import web3, web3.contract.contract, web3.types, hexbytes
+w3 = web3.Web3()
+spec = importlib.util.spec_from_file_location("bench", sys.argv[1])
+times = []
+# time the import without tracing memory, then trace a second import of the module
+module = importlib.util.module_from_spec(spec)
+start = time.perf_counter()
+spec.loader.exec_module(module)
+times.append(time.perf_counter() - start)
+traced = importlib.util.module_from_spec(spec)
+tracemalloc.start()
+spec.loader.exec_module(traced)
+memory, _ = tracemalloc.get_traced_memory()
+tracemalloc.stop()
+start = time.perf_counter()
+contract = module.Contract("0x0000000000000000000000000000000000000001", w3)
+times.append(time.perf_counter() - start)
+for _ in range(2):
+    start = time.perf_counter()
+    contract.function1
+    times.append(time.perf_counter() - start)
+print(json.dumps([times[0], memory, *times[1:]]))
+"""
+
+
+def measure(path: Path, repeat: int) -> list[float]:
+    runs = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", MEASURE_SCRIPT, str(path)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        runs.append(json.loads(result.stdout))
+    # best of each measure
+    return [min(values) for values in zip(*runs)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--entries", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    abi_content = make_abi(args.entries, events=False)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for stub in (False, True):
+            out_file = Path(tmp_dir) / ("stub" if stub else "full") / "contract.py"
+            ContractCodeGenerator(
+                abi_content=abi_content,
+                template_path=TEMPLATE_PATH,
+                contract_class_name="Contract",
+                bytecode=Bytecode.unchecked_hash,
+                stub=stub,
+            ).generate_file(out_file)
+            imported, memory, created, first_access, second_access = measure(
+                out_file, args.repeat
+            )
+            print(
+                f"{'stub' if stub else 'full':<5} import {imported * 1000:7.2f} ms {memory / 2**20:6.2f} MiB"
+                f"  create {created * 1000:7.2f} ms"
+                f"  first access {first_access * 1e6:7.1f} us  then {second_access * 1e6:5.2f} us"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,127 @@
+import json
 import sys
+import time
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
 from typing_extensions import Annotated
 
-from py_contract_codegen.modules.code_generator import (
-    DEFAULT_CONTRACT_CLASS_NAME,
-    ContractCodeGenerator,
+from py_contract_codegen import __version__
+from py_contract_codegen.modules.client import (
+    SOCKET_ENV_VAR,
+    default_socket_path,
+    is_own_socket,
+    request_generation,
 )
-from py_contract_codegen.modules.enums import Network, TargetLib
-from py_contract_codegen.modules.etherscan import get_abi
+from py_contract_codegen.modules.constants import DEFAULT_CONTRACT_CLASS_NAME
+from py_contract_codegen.modules.enums import (
+    ABIEmbedding,
+    ArtifactFormat,
+    Backend,
+    Bytecode,
+    Network,
+    TargetLib,
+)
+from py_contract_codegen.modules.options import GenerateOptions
+from py_contract_codegen.modules.profiling import (
+    TIME_DIGITS,
+    Profiler,
+    merge_reports,
+    profile_report,
+    profile_stage,
+)
+
+if TYPE_CHECKING:
+    from py_contract_codegen.modules.batch import BatchResult
+    from py_contract_codegen.modules.pruning import MemberFilter
+    from py_contract_codegen.modules.watch import Watcher
 
-TEMPLATE_PATH = Path(__file__).resolve().parent / "template"
+# NOTE: Modules depending on jinja2, eth_abi or httpx are imported where they are used,
+# so commands that don't need them (and `gen` forwarding to the daemon) start fast.
+# `tests/test_startup.py` enforces this.
 
 app = typer.Typer()
 
 
+def _echo_result(result: "BatchResult") -> None:
+    if not result.ok:
+        typer.echo(
+            f"Failed to generate {result.job.abi_path}: {result.error}", err=True
+        )
+    elif not result.cached:
+        typer.echo(f"Regenerated {result.job.out_file}")
+
+
+def _forward_to_daemon(
+    socket_path: Path,
+    abi_content: str,
+    class_name: str | None,
+    out_file: Path | None,
+    options: GenerateOptions,
+) -> bool:
+    """
+    Generate code on a running codegen daemon.
+    Returns False when no daemon is listening on `socket_path`.
+    """
+    if not is_own_socket(socket_path):
+        return False
+    request = {
+        "abi": abi_content,
+        "class_name": class_name,
+        "target_lib": options.target_libs[0].value,
+        "backend": options.backend.value,
+        "format": options.format_output,
+        "bytecode": options.bytecode.value if options.bytecode else None,
+        "abi_embedding": options.abi_embedding.value,
+        "stub": options.stub,
+        "runtime": options.runtime,
+        "out_file": str(out_file.resolve()) if out_file else None,
+        "cache_dir": str(options.cache_dir.resolve()) if options.cache_dir else None,
+    }
+    try:
+        response = request_generation(socket_path, request)
+    except (ConnectionError, FileNotFoundError):
+        return False
+    if out_file is None:
+        typer.echo(response["code"])
+    elif response["generated"]:
+        typer.echo(f"Generated code saved to {out_file}")
+    else:
+        typer.echo(f"Generated code is up to date in {out_file}")
+    return True
+
+
+def _member_filter(
+    include: list[str] | None, exclude: list[str] | None, used_in: list[Path] | None
+) -> "MemberFilter | None":
+    if not (include or exclude or used_in):
+        return None
+    from py_contract_codegen.modules.pruning import MemberFilter, collect_used_names
+
+    return MemberFilter(
+        include=tuple(include or ()),
+        exclude=tuple(exclude or ()),
+        used_names=collect_used_names(used_in) if used_in else None,
+    )
+
+
+def _watch(watcher: "Watcher") -> None:
+    watcher.prime()
+    typer.echo("Watching for ABI changes. Press Ctrl+C to stop.")
+    try:
+        watcher.run(on_result=_echo_result)
+    except KeyboardInterrupt:
+        pass
+
+
 @app.command()
 def version():
     """
     Show the version of the code generator.
     """
-    typer.echo("Python Contract Code Generator v0.1.2")
+    typer.echo(f"Python Contract Code Generator v{__version__}")
 
 
 @app.command()
@@ -45,41 +144,437 @@ def gen(
         help="Contract Class Name to save the generated code. If not provided, use `GeneratedContract`",
     ),
     target_lib: Annotated[
-        TargetLib, typer.Option(help="Target library and version")
-    ] = TargetLib.web3_v7,
+        list[TargetLib],
+        typer.Option(
+            help="Target library and version. Repeat to generate several targets from one parse, "
+            "saved as `<out-file stem>_<target>.py`"
+        ),
+    ] = [TargetLib.web3_v7],
     network: Annotated[
         Network, typer.Option(help="Ethereum network for fetching ABI")
     ] = Network.mainnet,
+    backend: Annotated[
+        Backend,
+        typer.Option(
+            help="Code generation backend: Jinja templates, or `ast` for code laid out like black formats it"
+        ),
+    ] = Backend.jinja,
+    format_output: bool = typer.Option(
+        False,
+        "--format",
+        help="Format the generated code in-process with black (`pip install 'py-contract-codegen[format]'`)",
+    ),
+    abi_embedding: Annotated[
+        ABIEmbedding,
+        typer.Option(
+            help="How modules embed the ABI: a Python literal, or decoded on first use from a minified JSON string "
+            "or from a `.abi.json` file next to the module"
+        ),
+    ] = ABIEmbedding.literal,
+    stub: bool = typer.Option(
+        False,
+        help="Write the method signatures to a `.pyi` stub next to the module, "
+        "whose class compiles each method on first access. For contracts with many functions",
+    ),
+    runtime: bool = typer.Option(
+        False,
+        help="Delegate construction, calls and events of the generated classes to `py_contract_codegen.runtime`, "
+        "so they get its optimizations by upgrading the package. The generated code then requires it at runtime",
+    ),
+    bytecode: Annotated[
+        Optional[Bytecode],
+        typer.Option(
+            help="Also write the `__pycache__` bytecode of `--out-file` with this invalidation mode, "
+            "so its first import doesn't compile it"
+        ),
+    ] = None,
+    cache_dir: Optional[Path] = typer.Option(
+        None,
+        help="Directory for the generation cache. If the inputs haven't changed, `--out-file` is left untouched",
+    ),
+    include: Annotated[
+        Optional[list[str]],
+        typer.Option(
+            help="Only generate the functions and events with this name, signature (`transfer(address,uint256)`) "
+            "or selector (`0xa9059cbb`). Repeatable"
+        ),
+    ] = None,
+    exclude: Annotated[
+        Optional[list[str]],
+        typer.Option(
+            help="Don't generate the functions and events with this name, signature or selector. Repeatable"
+        ),
+    ] = None,
+    used_in: Annotated[
+        Optional[list[Path]],
+        typer.Option(
+            help="Only generate the functions and events used in the Python files under this path, "
+            "in addition to `--include`. Repeatable"
+        ),
+    ] = None,
+    profile: bool = typer.Option(
+        False,
+        help="Print the wall time and peak memory of each stage of the generation, and the ABI size, as JSON to stderr. "
+        "Generation isn't forwarded to the daemon",
+    ),
+    profile_memory: bool = typer.Option(
+        True,
+        help="Trace the peak memory of the stages with `--profile`. "
+        "Tracing slows down allocations, imports and formatting the most, so turn it off for accurate times",
+    ),
+    watch: bool = typer.Option(
+        False,
+        help="Keep running and regenerate `--out-file` whenever the content of `--abi-path` changes",
+    ),
+    socket: Optional[Path] = typer.Option(
+        None,
+        envvar=SOCKET_ENV_VAR,
+        help="Unix socket of the codegen daemon started by `serve`. If a daemon is listening, generation is forwarded to it",
+    ),
+    daemon: bool = typer.Option(
+        True, help="Forward generation to a running codegen daemon"
+    ),
 ):
     """
     Generate Python code from an Ethereum ABI file.
     """
+    profiler = Profiler(trace_memory=profile_memory).start() if profile else None
     try:
         abi_content = None
         if abi_path:
-            with open(abi_path, "r") as f:
+            with profile_stage("read"), open(abi_path, "r") as f:
                 abi_content = f.read()
         elif abi_stdin:
-            abi_content = sys.stdin.read()
+            with profile_stage("read"):
+                abi_content = sys.stdin.read()
         elif contract_address:
-            abi_content = get_abi(contract_address, network)
+            with profile_stage("import"):
+                from py_contract_codegen.modules.etherscan import get_abi
+
+            with profile_stage("fetch"):
+                abi_content = get_abi(contract_address, network)
         if abi_content is None:
             raise ValueError("No ABI content provided")
-        generator = ContractCodeGenerator(
-            abi_content=abi_content,
-            template_path=TEMPLATE_PATH,
-            contract_class_name=class_name,
-            target_lib=target_lib,
+        if watch and not (abi_path and out_file):
+            raise ValueError("`--watch` requires `--abi-path` and `--out-file`")
+        if len(target_lib) > 1 and not out_file:
+            raise ValueError("Multiple `--target-lib` require `--out-file`")
+        if bytecode and not out_file:
+            raise ValueError("`--bytecode` requires `--out-file`")
+        if abi_embedding == ABIEmbedding.sidecar and not out_file:
+            raise ValueError("`--abi-embedding sidecar` requires `--out-file`")
+        if stub and not out_file:
+            raise ValueError("`--stub` requires `--out-file`")
+        options = GenerateOptions(
+            target_libs=tuple(target_lib),
+            backend=backend,
+            format_output=format_output,
+            bytecode=bytecode,
+            abi_embedding=abi_embedding,
+            stub=stub,
+            runtime=runtime,
+            member_filter=_member_filter(include, exclude, used_in),
+            cache_dir=cache_dir,
         )
-        generated_code = generator.generate()
+        if options.member_filter:
+            abi_content = options.member_filter.apply(abi_content)
+        if (
+            daemon
+            and not watch
+            and not profile
+            and len(target_lib) == 1
+            and _forward_to_daemon(
+                socket or default_socket_path(),
+                abi_content,
+                class_name,
+                out_file,
+                options,
+            )
+        ):
+            return
+
+        with profile_stage("import"):
+            from py_contract_codegen.modules.code_generator import (
+                ContractCodeGenerator,
+                generate_targets,
+            )
 
         if out_file:
-            with out_file.open("w") as f:
-                f.write(generated_code)
-            typer.echo(f"Generated code saved to {out_file}")
+            if generate_targets(abi_content, class_name, out_file, options):
+                typer.echo(f"Generated code saved to {out_file}")
+            else:
+                typer.echo(f"Generated code is up to date in {out_file}")
         else:
-            typer.echo(generated_code)
+            generator = ContractCodeGenerator.from_options(
+                abi_content, class_name, target_lib[0], options
+            )
+            generator.generate_to(sys.stdout)
+            sys.stdout.write("\n")
+
+    except Exception as e:
+        typer.echo(f"An error occurred: {str(e)}", err=True)
+        raise typer.Exit(code=1)
+    finally:
+        if profiler is not None:
+            profiler.stop()
+    if profiler is not None:
+        report = profile_report(profiler, abi_content)
+        typer.echo(json.dumps(report, indent=2), err=True)
+
+    if watch and abi_path and out_file:
+        from py_contract_codegen.modules.batch import BatchJob
+        from py_contract_codegen.modules.watch import Watcher
 
+        job = BatchJob(
+            abi_path=abi_path,
+            out_file=out_file,
+            contract_class_name=class_name or DEFAULT_CONTRACT_CLASS_NAME,
+        )
+        _watch(Watcher(collect_jobs=lambda: [job], options=options))
+
+
+@app.command("gen-batch")
+def gen_batch(
+    abi_dir: Optional[Path] = typer.Option(
+        None,
+        help="Directory of ABI files (`*.json`, `*.abi`). If not provided, `--manifest` must be set",
+    ),
+    manifest: Optional[Path] = typer.Option(
+        None,
+        help="JSON manifest listing `abi_path` with optional `class_name` and `out_file` per entry",
+    ),
+    artifacts: Optional[Path] = typer.Option(
+        None,
+        help="Compiler artifacts: Foundry `out/` or Hardhat `artifacts/` directory, or solc `--standard-json` output file",
+    ),
+    artifact_format: Annotated[
+        ArtifactFormat, typer.Option(help="Format of `--artifacts`")
+    ] = ArtifactFormat.foundry,
+    out_dir: Optional[Path] = typer.Option(
+        None,
+        help="Directory to save the generated code. Required with `--abi-dir` and `--artifacts`",
+    ),
+    target_lib: Annotated[
+        list[TargetLib],
+        typer.Option(
+            help="Target library and version. Repeat to generate several targets from one parse, "
+            "saved as `<out-file stem>_<target>.py`"
+        ),
+    ] = [TargetLib.web3_v7],
+    backend: Annotated[
+        Backend,
+        typer.Option(
+            help="Code generation backend: Jinja templates, or `ast` for code laid out like black formats it"
+        ),
+    ] = Backend.jinja,
+    format_output: bool = typer.Option(
+        False,
+        "--format",
+        help="Format the generated code in-process with black, loaded once per worker (`pip install 'py-contract-codegen[format]'`)",
+    ),
+    abi_embedding: Annotated[
+        ABIEmbedding,
+        typer.Option(
+            help="How modules embed the ABI: a Python literal, or decoded on first use from a minified JSON string "
+            "or from a `.abi.json` file next to the module"
+        ),
+    ] = ABIEmbedding.literal,
+    stub: bool = typer.Option(
+        False,
+        help="Write the method signatures to a `.pyi` stub next to the module, "
+        "whose class compiles each method on first access. For contracts with many functions",
+    ),
+    runtime: bool = typer.Option(
+        False,
+        help="Delegate construction, calls and events of the generated classes to `py_contract_codegen.runtime`, "
+        "so they get its optimizations by upgrading the package. The generated code then requires it at runtime",
+    ),
+    bytecode: Annotated[
+        Optional[Bytecode],
+        typer.Option(
+            help="Also write the `__pycache__` bytecode of every output with this invalidation mode, "
+            "so their first import doesn't compile them"
+        ),
+    ] = None,
+    package: bool = typer.Option(
+        False,
+        help="Generate `--out-dir` as a package with one module per distinct ABI and every contract class in `__init__.py`. "
+        "Contracts sharing an ABI share its module and class",
+    ),
+    workers: Optional[int] = typer.Option(
+        None,
+        help="Number of worker processes. If not provided, use the number of CPUs",
+    ),
+    cache_dir: Optional[Path] = typer.Option(
+        None,
+        help="Directory for the generation cache. Unchanged contracts are skipped and their outputs left untouched",
+    ),
+    include: Annotated[
+        Optional[list[str]],
+        typer.Option(
+            help="Only generate the functions and events with this name, signature (`transfer(address,uint256)`) "
+            "or selector (`0xa9059cbb`). Repeatable"
+        ),
+    ] = None,
+    exclude: Annotated[
+        Optional[list[str]],
+        typer.Option(
+            help="Don't generate the functions and events with this name, signature or selector. Repeatable"
+        ),
+    ] = None,
+    used_in: Annotated[
+        Optional[list[Path]],
+        typer.Option(
+            help="Only generate the functions and events used in the Python files under this path, "
+            "in addition to `--include`. Repeatable"
+        ),
+    ] = None,
+    profile: bool = typer.Option(
+        False,
+        help="Print the wall time and peak memory of each stage of every contract and their totals, "
+        "with the ABI sizes, as JSON to stderr",
+    ),
+    profile_memory: bool = typer.Option(
+        True,
+        help="Trace the peak memory of the stages with `--profile`. "
+        "Tracing slows down allocations, imports and formatting the most, so turn it off for accurate times",
+    ),
+    watch: bool = typer.Option(
+        False,
+        help="Keep running and regenerate the outputs whose ABI content changed",
+    ),
+):
+    """
+    Generate Python code for many ABI files or compiler artifacts in parallel.
+    """
+    from py_contract_codegen.modules.artifacts import collect_jobs_from_artifacts
+    from py_contract_codegen.modules.batch import (
+        collect_jobs_from_dir,
+        collect_jobs_from_manifest,
+        generate_batch,
+    )
+    from py_contract_codegen.modules.package import generate_package
+    from py_contract_codegen.modules.watch import Watcher
+
+    start = time.perf_counter()
+    try:
+        options = GenerateOptions(
+            target_libs=tuple(target_lib),
+            backend=backend,
+            format_output=format_output,
+            bytecode=bytecode,
+            abi_embedding=abi_embedding,
+            stub=stub,
+            runtime=runtime,
+            member_filter=_member_filter(include, exclude, used_in),
+            cache_dir=cache_dir,
+            profile=profile,
+            profile_memory=profile_memory,
+        )
+        if abi_dir:
+            if out_dir is None:
+                raise ValueError("`--out-dir` is required with `--abi-dir`")
+            collect_jobs = partial(collect_jobs_from_dir, abi_dir, out_dir)
+        elif manifest:
+            collect_jobs = partial(collect_jobs_from_manifest, manifest, out_dir)
+        elif artifacts:
+            if out_dir is None:
+                raise ValueError("`--out-dir` is required with `--artifacts`")
+            if watch:
+                raise ValueError("`--watch` is not supported with `--artifacts`")
+            collect_jobs = partial(
+                collect_jobs_from_artifacts, artifacts, artifact_format, out_dir
+            )
+        else:
+            raise ValueError("No ABI directory, manifest or artifacts provided")
+        if package:
+            if out_dir is None:
+                raise ValueError("`--package` requires `--out-dir`")
+            if len(target_lib) > 1:
+                raise ValueError("`--package` supports a single `--target-lib`")
+            if watch:
+                raise ValueError("`--watch` is not supported with `--package`")
+            results = generate_package(
+                collect_jobs(), out_dir, options, max_workers=workers
+            )
+        else:
+            results = generate_batch(collect_jobs(), options, max_workers=workers)
+    except Exception as e:
+        typer.echo(f"An error occurred: {str(e)}", err=True)
+        raise typer.Exit(code=1)
+
+    failures = [r for r in results if not r.ok]
+    for result in failures:
+        typer.echo(
+            f"Failed to generate {result.job.abi_path}: {result.error}", err=True
+        )
+    cached = sum(r.cached for r in results)
+    typer.echo(
+        f"Generated {len(results) - len(failures)}/{len(results)} contracts ({cached} unchanged)"
+    )
+    if profile:
+        # stages of the contracts run in parallel, their total time exceeds the batch wall time
+        contracts = [
+            {
+                "abi_path": str(r.job.abi_path),
+                "out_file": str(r.job.out_file),
+                **r.profile,
+            }
+            for r in results
+            if r.profile is not None
+        ]
+        report = {
+            "wall_time": round(time.perf_counter() - start, TIME_DIGITS),
+            "total": merge_reports(contracts),
+            "contracts": contracts,
+        }
+        typer.echo(json.dumps(report, indent=2), err=True)
+    if watch:
+        _watch(Watcher(collect_jobs=collect_jobs, options=options))
+    elif failures:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def stream():
+    """
+    Generate code for newline-delimited JSON requests on stdin, writing one JSON response line per request to stdout.
+    Request: `{"abi": ..., "class_name": ..., "target_lib": ..., "id": ...}`, where only `abi` is required.
+    """
+    from py_contract_codegen.modules.stream import process_stream
+
+    summary = process_stream(sys.stdin, sys.stdout)
+    if summary.failures:
+        typer.echo(
+            f"Failed to generate {summary.failures}/{summary.requests} requests",
+            err=True,
+        )
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def serve(
+    socket: Optional[Path] = typer.Option(
+        None,
+        envvar=SOCKET_ENV_VAR,
+        help="Unix socket to listen on. If not provided, use a per-user socket in `$XDG_RUNTIME_DIR` or the temp directory",
+    ),
+):
+    """
+    Run a codegen daemon that keeps the generator warm, so `gen` can forward to it.
+    """
+    from py_contract_codegen.modules.server import serve as serve_daemon
+
+    socket_path = socket or default_socket_path()
+    try:
+        serve_daemon(
+            socket_path,
+            on_ready=lambda: typer.echo(
+                f"Codegen daemon listening on {socket_path}. Press Ctrl+C to stop."
+            ),
+        )
+    except KeyboardInterrupt:
+        pass
     except Exception as e:
         typer.echo(f"An error occurred: {str(e)}", err=True)
         raise typer.Exit(code=1)
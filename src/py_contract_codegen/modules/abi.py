@@ -1,8 +1,10 @@
 import json
-import re
 from dataclasses import dataclass, field
+from functools import lru_cache
+from io import StringIO
+from json.encoder import encode_basestring_ascii
 from keyword import kwlist
-from typing import Any, TypedDict
+from typing import Any, Callable, NamedTuple, TypedDict
 
 from eth_abi.exceptions import ParseError
 from eth_abi.grammar import BasicType, TupleType, normalize, parse
@@ -21,43 +23,138 @@ from py_contract_codegen.modules.exceptions import (
     InvalidJSONError,
     UnknownABITypeError,
 )
+from py_contract_codegen.modules.profiling import profile_stage
+
+INDENT = " " * 4
+
+
+def _write_python_literal(value: Any, write: Callable[[str], Any], level: int) -> None:
+    if isinstance(value, str):
+        write(encode_basestring_ascii(value))
+    elif value is None:
+        write("None")
+    elif value is True:
+        write("True")
+    elif value is False:
+        write("False")
+    elif isinstance(value, (int, float)):
+        write(repr(value))
+    elif isinstance(value, dict):
+        if not value:
+            write("{}")
+            return
+        inner_indent = "\n" + INDENT * (level + 1)
+        write("{")
+        for i, (key, item) in enumerate(value.items()):
+            write(inner_indent if i == 0 else "," + inner_indent)
+            write(encode_basestring_ascii(str(key)))
+            write(": ")
+            _write_python_literal(item, write, level + 1)
+        write("\n" + INDENT * level + "}")
+    elif isinstance(value, (list, tuple)):
+        if not value:
+            write("[]")
+            return
+        inner_indent = "\n" + INDENT * (level + 1)
+        write("[")
+        for i, item in enumerate(value):
+            write(inner_indent if i == 0 else "," + inner_indent)
+            _write_python_literal(item, write, level + 1)
+        write("\n" + INDENT * level + "]")
+    else:
+        raise TypeError(
+            f"Object of type {type(value).__name__} is not ABI serializable"
+        )
 
-REPLACE_PATTERN = re.compile(r"\b(true|false|null)\b")
 
+def format_abi_for_python(abi: list[dict[str, Any]]) -> str:
+    """
+    format ABI to python literal for template.
+    Walks the ABI once, laid out like `json.dumps(abi, indent=4)`.
+    """
+    buffer = StringIO()
+    _write_python_literal(abi, buffer.write, 0)
+    return buffer.getvalue()
 
-def replace_keywords(match):
-    keyword = match.group(1)
-    if keyword == "true":
-        return "True"
-    elif keyword == "false":
-        return "False"
-    else:  # null
-        return "None"
 
+TYPE_CACHE_SIZE = 4096
 
-def format_abi_for_python(abi: list[dict[str, Any]]):
+
+def _build_basic_python_types() -> dict[str, str]:
     """
-    format ABI to python dict for template
+    Python types of the ABI types that don't need parsing.
     """
-    abi_json = json.dumps(abi, indent=4)
-    abi_python = REPLACE_PATTERN.sub(replace_keywords, abi_json)
-    return abi_python
+    basic_types = {
+        "address": "ChecksumAddress",
+        "bool": "bool",
+        "string": "str",
+        "bytes": "bytes",
+        "function": "bytes",  # `function` type is represented as `bytes`
+        "uint": "int",
+        "int": "int",
+        "fixed": "float",
+        "ufixed": "float",
+    }
+    for bits in range(8, 257, 8):
+        basic_types[f"uint{bits}"] = "int"
+        basic_types[f"int{bits}"] = "int"
+    for size in range(1, 33):
+        basic_types[f"bytes{size}"] = "bytes"
+    return basic_types
+
+
+BASIC_PYTHON_TYPES = _build_basic_python_types()
+
+
+class TypeCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
 
 
 class ABITypeConverter:
     """
     EVM ABI types to Python types converter.
+    Resolved types are shared process-wide: basic types are precomputed at import,
+    and the others are kept in a bounded LRU cache.
     ref: https://docs.soliditylang.org/en/latest/abi-spec.html
     """
 
+    _basic_type_hits = 0
+
     @classmethod
     def get_python_type(cls, abi_type: str) -> str:
+        python_type = BASIC_PYTHON_TYPES.get(abi_type)
+        if python_type is not None:
+            cls._basic_type_hits += 1
+            return python_type
+        return cls._resolve_python_type(abi_type)
+
+    @staticmethod
+    @lru_cache(maxsize=TYPE_CACHE_SIZE)
+    def _resolve_python_type(abi_type: str) -> str:
         try:
             normalized_type = parse(normalize(abi_type))
-            return cls._convert_type(normalized_type)
+            return ABITypeConverter._convert_type(normalized_type)
         except ParseError:
             return "Any"
 
+    @classmethod
+    def cache_info(cls) -> TypeCacheInfo:
+        info = cls._resolve_python_type.cache_info()
+        return TypeCacheInfo(
+            hits=info.hits + cls._basic_type_hits,
+            misses=info.misses,
+            maxsize=len(BASIC_PYTHON_TYPES) + TYPE_CACHE_SIZE,
+            currsize=len(BASIC_PYTHON_TYPES) + info.currsize,
+        )
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        cls._resolve_python_type.cache_clear()
+        cls._basic_type_hits = 0
+
     @classmethod
     def _convert_type(cls, abi_type: ABIType) -> str:
         if isinstance(abi_type, BasicType):
@@ -74,9 +171,7 @@ class ABITypeConverter:
         match basic_type_str:
             case s if s.endswith("]"):
                 array_start = s.index("[")
-                element_type_str = s[:array_start]
-                element_type = parse(element_type_str)
-                python_element_type = cls._convert_type(element_type)
+                python_element_type = cls.get_python_type(s[:array_start])
                 return f"list[{python_element_type}]"
             case s if s.startswith(("uint", "int")):
                 return "int"
@@ -100,8 +195,7 @@ class ABITypeConverter:
         tuple_type_str = tuple_type.to_type_str()
 
         if tuple_type_str.endswith("[]"):
-            element_tuple_type = parse(tuple_type_str[:-2])
-            python_element_type = cls._convert_type(element_tuple_type)
+            python_element_type = cls.get_python_type(tuple_type_str[:-2])
             return f"list[{python_element_type}]"
 
         inner_types = [cls._convert_type(t) for t in tuple_type.components]
@@ -128,6 +222,90 @@ class ABITypedConstructor(ABIConstructor):
     converted_inputs: list[ABITypeConvertedComponent]
 
 
+@dataclass(frozen=True, slots=True)
+class ComponentRecord:
+    name: str
+    type: str
+    indexed: bool
+    python_type: str
+
+
+@dataclass(frozen=True, slots=True)
+class FunctionRecord:
+    name: str
+    stateMutability: str
+    converted_inputs: tuple[ComponentRecord, ...]
+    converted_outputs: tuple[ComponentRecord, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class EventRecord:
+    name: str
+    anonymous: bool
+    converted_inputs: tuple[ComponentRecord, ...]
+
+
+def _component_records(
+    components: list[ABITypeConvertedComponent],
+) -> tuple[ComponentRecord, ...]:
+    return tuple(
+        ComponentRecord(c["name"], c["type"], c["indexed"], c["python_type"])
+        for c in components
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class RenderView:
+    """
+    Read-only view of a parsed ABI for the templates.
+    Members are slotted records sharing the parsed strings, so nothing is deep-copied,
+    and template attribute lookups hit the records directly instead of falling back to item lookups.
+    """
+
+    content: list[dict[str, Any]]
+    formatted_content: str
+    functions: tuple[FunctionRecord, ...]
+    events: tuple[EventRecord, ...]
+
+    @classmethod
+    def build(
+        cls,
+        content: list[dict[str, Any]],
+        formatted_content: str,
+        functions: list[ABITypedFunction],
+        events: list[ABITypedEvent],
+    ) -> "RenderView":
+        return cls(
+            content=content,
+            formatted_content=formatted_content,
+            functions=tuple(
+                FunctionRecord(
+                    f["name"],
+                    f["stateMutability"],
+                    _component_records(f["converted_inputs"]),
+                    _component_records(f["converted_outputs"]),
+                )
+                for f in functions
+            ),
+            events=tuple(
+                EventRecord(
+                    e["name"],
+                    e.get("anonymous", False),
+                    _component_records(e["converted_inputs"]),
+                )
+                for e in events
+            ),
+        )
+
+    def context(self, contract_class_name: str | None) -> dict[str, Any]:
+        return {
+            "formatted_content": self.formatted_content,
+            "functions": self.functions,
+            "events": self.events,
+            "contract_class_name": contract_class_name,
+        }
+
+
 @dataclass
 class ABIParser:
     abi: str
@@ -141,8 +319,10 @@ class ABIParser:
     errors: list[ABIError] = field(default_factory=list)
 
     def __post_init__(self):
-        self.validate()
-        self.parse()
+        with profile_stage("validate"):
+            self.validate()
+        with profile_stage("parse"):
+            self.parse()
 
     def validate(self) -> None:
         if isinstance(self.abi, list):
@@ -161,6 +341,11 @@ class ABIParser:
                 raise UnknownABITypeError(f"Unknown ABI type: {item['type']}")
         self.formatted_content = format_abi_for_python(self.content)
 
+    def render_view(self) -> RenderView:
+        return RenderView.build(
+            self.content, self.formatted_content, self.functions, self.events
+        )
+
     def parse(self) -> None:
         for item in self.content:
             abi_type = ABIType[item["type"]]
@@ -184,28 +369,27 @@ class ABIParser:
     ) -> list[ABITypeConvertedComponent]:
         if not params:
             return []
+        with profile_stage("convert_types"):
+            python_types = [
+                # NOTE: type `address` is CheckSumAddress for input, but it becomes str for output.
+                "str"
+                if param["type"] == "address" and prefix == "output"
+                else ABITypeConverter.get_python_type(param["type"])
+                for param in params
+            ]
         converted_params = []
-        for i, param in enumerate(params, start=1):
+        for i, (param, python_type) in enumerate(zip(params, python_types), start=1):
             name = param.get("name")
             # check Python Reserved Keywords
             name = f"{name}_" if name in kwlist else name
             if not name:
                 name = f"{prefix}_{i}"
-            # NOTE: type `address` is CheckSumAddress for input, but it becomes str for output.
-            if param["type"] == "address" and prefix == "output":
-                converted_abi_component = ABITypeConvertedComponent(
-                    name=name,
-                    type=param["type"],
-                    indexed=param.get("indexed", False),
-                    python_type="str",
-                )
-            else:
-                converted_abi_component = ABITypeConvertedComponent(
-                    name=name,
-                    type=param["type"],
-                    indexed=param.get("indexed", False),
-                    python_type=ABITypeConverter.get_python_type(param["type"]),
-                )
+            converted_abi_component = ABITypeConvertedComponent(
+                name=name,
+                type=param["type"],
+                indexed=param.get("indexed", False),
+                python_type=python_type,
+            )
             converted_params.append(converted_abi_component)
         return converted_params
 
@@ -0,0 +1,261 @@
+import json
+import mmap
+import re
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from py_contract_codegen.modules.batch import BatchJob, class_name_from_stem
+from py_contract_codegen.modules.enums import ArtifactFormat
+
+# a complete JSON string, or a structural character
+TOKEN_PATTERN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[{}\[\]:,]', re.DOTALL)
+STRING_PATTERN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+# while skipping a nested value only brackets matter: one match runs up to the next bracket
+# outside a string, and the groups tell opening from closing without copying the matched bytes
+SKIP_PATTERN = re.compile(
+    rb'(?:[^"{}\[\]]+|"[^"\\]*(?:\\.[^"\\]*)*")*(?:([{\[])|([}\]]))', re.DOTALL
+)
+SCALAR_END_PATTERN = re.compile(rb"[,}\]]")
+WHITESPACE_PATTERN = re.compile(rb"\s*")
+
+
+class _ArrayLevel(Enum):
+    ITEM = "[]"
+
+
+# key of the levels inside arrays, which no pattern matches, not even `None`
+ARRAY_ITEM = _ArrayLevel.ITEM
+KeyPath = tuple[str | _ArrayLevel, ...]
+# `None` matches any object key
+KeyPattern = tuple[str | None, ...]
+
+BUILD_INFO_DIR = "build-info"
+
+
+@dataclass(frozen=True)
+class Artifact:
+    source: Path
+    contract_name: str
+    abi: list[dict[str, Any]]
+    # byte offsets of the ABI JSON in `source`
+    abi_span: tuple[int, int]
+
+
+def _matches(path: KeyPath, pattern: KeyPattern) -> bool:
+    return len(path) <= len(pattern) and all(
+        p == k or (p is None and k is not ARRAY_ITEM) for k, p in zip(path, pattern)
+    )
+
+
+def _skip_whitespace(data: Any, pos: int) -> int:
+    match = WHITESPACE_PATTERN.match(data, pos)
+    return match.end() if match else pos
+
+
+def _value_end(data: Any, start: int) -> int:
+    first = data[start : start + 1]
+    if first == b'"':
+        match = STRING_PATTERN.match(data, start)
+        assert match is not None
+        return match.end()
+    if first not in (b"{", b"["):
+        match = SCALAR_END_PATTERN.search(data, start)
+        return match.start() if match else len(data)
+    depth = 0
+    for match in SKIP_PATTERN.finditer(data, start):
+        if match.start(1) >= 0:
+            depth += 1
+        elif match.start(2) >= 0:
+            depth -= 1
+            if depth == 0:
+                return match.end()
+    raise ValueError("Unterminated JSON value")
+
+
+def iter_json_values(
+    data: Any, patterns: Sequence[KeyPattern]
+) -> Iterator[tuple[KeyPath, Any]]:
+    """
+    Yield `(key_path, value)` for every object value whose key path matches one of `patterns`.
+    `data` is any bytes-like object, typically an `mmap` of a large file.
+    Only matched values are decoded; every other subtree is skipped without building Python objects,
+    and scanning stops once all top-level keys named by `patterns` have been seen.
+    """
+    for key_path, start, end in iter_json_spans(data, patterns):
+        yield key_path, json.loads(bytes(data[start:end]))
+
+
+def iter_json_spans(
+    data: Any, patterns: Sequence[KeyPattern]
+) -> Iterator[tuple[KeyPath, int, int]]:
+    """
+    Yield `(key_path, start, end)` for every object value whose key path matches one of `patterns`,
+    where `data[start:end]` is the JSON of the value, see `iter_json_values`.
+    """
+    remaining_top_level = {p[0] for p in patterns if p[0] is not None}
+    stop_when_done = all(p[0] is not None for p in patterns)
+    # each level is `[is_object, current_key]`, the key of array levels is `ARRAY_ITEM`
+    stack: list[list[Any]] = []
+    expect_key = False
+    pos = 0
+    while True:
+        match = TOKEN_PATTERN.search(data, pos)
+        if match is None:
+            return
+        pos = match.end()
+        token = data[match.start() : match.start() + 1]
+        if token == b'"':
+            if expect_key:
+                stack[-1][1] = json.loads(bytes(data[match.start() : pos]))
+                expect_key = False
+        elif token == b":":
+            path = tuple(key for _, key in stack)
+            value_start = _skip_whitespace(data, pos)
+            candidates = [p for p in patterns if _matches(path, p)]
+            if any(len(p) == len(path) for p in candidates):
+                pos = _value_end(data, value_start)
+                yield path, value_start, pos
+            elif not candidates:
+                pos = _value_end(data, value_start)
+            if len(stack) == 1 and pos != match.end():
+                remaining_top_level.discard(stack[0][1])
+                if stop_when_done and not remaining_top_level:
+                    return
+        elif token in (b"{", b"["):
+            stack.append([token == b"{", None if token == b"{" else ARRAY_ITEM])
+            expect_key = token == b"{"
+        elif token in (b"}", b"]"):
+            stack.pop()
+            if len(stack) == 1:
+                remaining_top_level.discard(stack[0][1])
+                if stop_when_done and not remaining_top_level:
+                    return
+            if not stack:
+                return
+        elif token == b",":
+            expect_key = bool(stack) and stack[-1][0]
+
+
+def _iter_file_values(
+    path: Path, patterns: Sequence[KeyPattern]
+) -> Iterator[tuple[KeyPath, Any, tuple[int, int]]]:
+    with path.open("rb") as f:
+        if path.stat().st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for key_path, start, end in iter_json_spans(data, patterns):
+                yield key_path, json.loads(data[start:end]), (start, end)
+
+
+def _iter_artifact_files(artifacts_dir: Path) -> Iterator[Path]:
+    for path in sorted(artifacts_dir.rglob("*.json")):
+        if BUILD_INFO_DIR in path.relative_to(artifacts_dir).parts:
+            continue
+        if path.name.endswith(".dbg.json"):
+            continue
+        yield path
+
+
+def iter_foundry_artifacts(out_dir: Path) -> Iterator[Artifact]:
+    """
+    Foundry `out/<File>.sol/<Contract>.json`
+    """
+    for path in _iter_artifact_files(out_dir):
+        for _, abi, span in _iter_file_values(path, [("abi",)]):
+            yield Artifact(source=path, contract_name=path.stem, abi=abi, abi_span=span)
+
+
+def iter_hardhat_artifacts(artifacts_dir: Path) -> Iterator[Artifact]:
+    """
+    Hardhat `artifacts/contracts/<File>.sol/<Contract>.json`
+    """
+    for path in _iter_artifact_files(artifacts_dir):
+        values = {
+            key_path: (value, span)
+            for key_path, value, span in _iter_file_values(
+                path, [("contractName",), ("abi",)]
+            )
+        }
+        if ("abi",) not in values:
+            continue
+        contract_name, _ = values.get(("contractName",), (None, None))
+        abi, span = values[("abi",)]
+        yield Artifact(
+            source=path,
+            contract_name=contract_name or path.stem,
+            abi=abi,
+            abi_span=span,
+        )
+
+
+def iter_solc_artifacts(output_file: Path) -> Iterator[Artifact]:
+    """
+    solc `--standard-json` output: `{"contracts": {<file>: {<contract>: {"abi": ...}}}}`
+    """
+    for key_path, abi, span in _iter_file_values(
+        output_file, [("contracts", None, None, "abi")]
+    ):
+        yield Artifact(
+            source=output_file,
+            contract_name=str(key_path[2]),
+            abi=abi,
+            abi_span=span,
+        )
+
+
+def iter_artifacts(path: Path, artifact_format: ArtifactFormat) -> Iterator[Artifact]:
+    match artifact_format:
+        case ArtifactFormat.foundry:
+            return iter_foundry_artifacts(path)
+        case ArtifactFormat.hardhat:
+            return iter_hardhat_artifacts(path)
+        case ArtifactFormat.solc:
+            return iter_solc_artifacts(path)
+        case _:
+            raise ValueError(f"Unknown artifact format: {artifact_format}")
+
+
+def module_name_from_contract(contract_name: str) -> str:
+    """
+    e.g. `UniswapV3Pool` -> `uniswap_v3_pool`
+    """
+    name = re.sub(
+        r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])", "_", contract_name
+    )
+    name = re.sub(r"[^0-9A-Za-z]+", "_", name).strip("_").lower()
+    return f"_{name}" if not name or name[0].isdigit() else name
+
+
+def collect_jobs_from_artifacts(
+    path: Path,
+    artifact_format: ArtifactFormat,
+    out_dir: Path,
+    include_empty: bool = False,
+) -> list[BatchJob]:
+    """
+    Create a job for every contract in a Foundry/Hardhat artifact tree or a solc standard-json output.
+    Contracts with an empty ABI (e.g. libraries without public functions) are skipped unless `include_empty`.
+    """
+    jobs = []
+    used_names: set[str] = set()
+    for artifact in iter_artifacts(path, artifact_format):
+        if not artifact.abi and not include_empty:
+            continue
+        module_name = module_name_from_contract(artifact.contract_name)
+        unique_name, i = module_name, 1
+        while unique_name in used_names:
+            i += 1
+            unique_name = f"{module_name}_{i}"
+        used_names.add(unique_name)
+        jobs.append(
+            BatchJob(
+                abi_path=artifact.source,
+                out_file=out_dir / f"{unique_name}.py",
+                contract_class_name=class_name_from_stem(artifact.contract_name),
+                abi_span=artifact.abi_span,
+            )
+        )
+    return jobs
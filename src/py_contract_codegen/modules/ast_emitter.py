@@ -0,0 +1,603 @@
+import ast
+import io
+import tokenize
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import cache, lru_cache
+from json.encoder import encode_basestring_ascii
+from pathlib import Path
+from typing import Any
+
+from py_contract_codegen.modules.abi import (
+    ComponentRecord,
+    EventRecord,
+    FunctionRecord,
+    RenderView,
+)
+from py_contract_codegen.modules.embedding import embedded_content
+from py_contract_codegen.modules.enums import ABIEmbedding, StateMutability, TargetLib
+
+LINE_LENGTH = 88
+INDENT = " " * 4
+TYPE_IGNORE_ATTR_DEFINED = "# type: ignore[attr-defined]"
+
+IMPORTS = (
+    ("typing", ("Any", "Iterable")),
+    ("hexbytes", ("HexBytes",)),
+    ("web3", ("Web3",)),
+    ("web3.contract.contract", ("ContractFunction",)),
+    (
+        "web3.types",
+        ("ENS", "Address", "BlockIdentifier", "ChecksumAddress", "EventData"),
+    ),
+)
+
+# import of the base class of `runtime` contract classes, after `IMPORTS`
+RUNTIME_IMPORT = ("py_contract_codegen.runtime", ("ContractBase",))
+RUNTIME_BASE_CLASS = "ContractBase"
+
+# imports of the lazily decoded ABI embeddings, before `IMPORTS`
+ABI_LOADER_IMPORTS = {
+    ABIEmbedding.literal: (),
+    ABIEmbedding.json: ("import json", "from functools import cache"),
+    ABIEmbedding.sidecar: (
+        "import json",
+        "from functools import cache",
+        "from pathlib import Path",
+    ),
+}
+ABI_LOADER = """
+
+
+@cache
+def load_abi() -> list[dict[str, Any]]:
+    return json.loads({source})
+
+
+def __getattr__(name: str) -> Any:
+    # the ABI is decoded on first use, see PEP 562
+    if name == "ABI":
+        return load_abi()
+    raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")"""
+
+# keyword arguments of `get_logs` for the event filter parameters
+GET_LOGS_KEYWORDS = {
+    TargetLib.web3_v7: {"from_block": "from_block", "to_block": "to_block"},
+    TargetLib.web3_v6: {"from_block": "fromBlock", "to_block": "toBlock"},
+}
+
+CALL_STATE_MUTABILITIES = (StateMutability.view.value, StateMutability.pure.value)
+
+
+def _name(id: str) -> ast.Name:
+    return ast.Name(id=id, ctx=ast.Load())
+
+
+def _attribute(*path: str) -> ast.expr:
+    node: ast.expr = _name(path[0])
+    for attr in path[1:]:
+        node = ast.Attribute(value=node, attr=attr, ctx=ast.Load())
+    return node
+
+
+def _string(value: str) -> ast.expr:
+    return ast.Constant(value=value)
+
+
+def _unparse(node: ast.AST) -> str:
+    """
+    `ast.unparse`, with strings in double quotes like black.
+    """
+    source = ast.unparse(node)
+    # names never contain quotes, so a single quote starts a string
+    if "'" not in source:
+        return source
+    parts = []
+    end = 0
+    # unparsed expressions are on a single line
+    for token in tokenize.generate_tokens(io.StringIO(source).readline):
+        if (
+            token.type == tokenize.STRING
+            and token.string.startswith("'")
+            and '"' not in token.string
+        ):
+            parts.append(source[end : token.start[1]])
+            parts.append('"' + token.string[1:-1].replace("\\'", "'") + '"')
+            end = token.end[1]
+    parts.append(source[end:])
+    return "".join(parts)
+
+
+def _call(
+    func: ast.expr,
+    args: Sequence[ast.expr] = (),
+    keywords: dict[str, ast.expr] | None = None,
+) -> ast.Call:
+    return ast.Call(
+        func=func,
+        args=list(args),
+        keywords=[ast.keyword(arg=k, value=v) for k, v in (keywords or {}).items()],
+    )
+
+
+@lru_cache(maxsize=1024)
+def _annotation(source: str) -> ast.expr:
+    # shared between trees, never mutated
+    return ast.parse(source, mode="eval").body
+
+
+# annotations are shared nodes, so their source is only unparsed once
+_unparse_annotation = lru_cache(maxsize=1024)(ast.unparse)
+
+
+def _arguments(
+    params: Sequence[tuple[str, str]], defaults: Sequence[ast.expr] = ()
+) -> ast.arguments:
+    return ast.arguments(
+        posonlyargs=[],
+        args=[ast.arg(arg="self")]
+        + [ast.arg(arg=name, annotation=_annotation(t)) for name, t in params],
+        kwonlyargs=[],
+        kw_defaults=[],
+        defaults=list(defaults),
+    )
+
+
+def _function_def(
+    name: str, args: ast.arguments, returns: ast.expr, body: list[ast.stmt]
+) -> ast.FunctionDef:
+    return ast.FunctionDef(
+        name=name,
+        args=args,
+        body=body,
+        decorator_list=[],
+        returns=returns,
+        type_params=[],
+    )
+
+
+def _return_type(outputs: Sequence[ComponentRecord]) -> ast.expr:
+    if len(outputs) == 1:
+        return _annotation(outputs[0].python_type)
+    # `tuple[()]` is the empty tuple type
+    elements: ast.expr = ast.Tuple(
+        elts=[_annotation(o.python_type) for o in outputs], ctx=ast.Load()
+    )
+    return ast.Subscript(value=_name("tuple"), slice=elements, ctx=ast.Load())
+
+
+def build_init(
+    abi_embedding: ABIEmbedding = ABIEmbedding.literal, runtime: bool = False
+) -> ast.FunctionDef:
+    abi: ast.expr = _name("ABI")
+    if abi_embedding != ABIEmbedding.literal:
+        abi = _call(_name("load_abi"))
+    args = _arguments(
+        [
+            ("contract_address", "Address | ChecksumAddress | ENS"),
+            ("web3", "Web3"),
+        ]
+    )
+    if runtime:
+        super_init = ast.Attribute(
+            value=_call(_name("super")), attr="__init__", ctx=ast.Load()
+        )
+        return _function_def(
+            "__init__",
+            args,
+            ast.Constant(value=None),
+            [
+                ast.Expr(
+                    value=_call(
+                        super_init, [_name("contract_address"), _name("web3"), abi]
+                    )
+                )
+            ],
+        )
+    return _function_def(
+        "__init__",
+        args,
+        ast.Constant(value=None),
+        [
+            ast.Assign(
+                targets=[_attribute("self", "contract_address")],
+                value=_name("contract_address"),
+            ),
+            ast.Assign(targets=[_attribute("self", "web3")], value=_name("web3")),
+            ast.Assign(
+                targets=[_attribute("self", "contract")],
+                value=_call(
+                    _attribute("web3", "eth", "contract"),
+                    keywords={
+                        "address": _attribute("self", "contract_address"),
+                        "abi": abi,
+                    },
+                ),
+            ),
+        ],
+    )
+
+
+def build_function(function: FunctionRecord, runtime: bool = False) -> ast.FunctionDef:
+    params = [(i.name, i.python_type) for i in function.converted_inputs]
+    args = [_name(name) for name, _ in params]
+    is_call = function.stateMutability in CALL_STATE_MUTABILITIES
+    value: ast.expr
+    if runtime:
+        method = "_call_function" if is_call else "_build_function"
+        value = _call(_attribute("self", method), [_string(function.name), *args])
+    else:
+        value = _call(_attribute("self", "contract", "functions", function.name), args)
+        if is_call:
+            value = _call(ast.Attribute(value=value, attr="call", ctx=ast.Load()))
+    if is_call:
+        returns = _return_type(function.converted_outputs)
+    else:
+        returns = _name("ContractFunction")
+    return _function_def(
+        function.name, _arguments(params), returns, [ast.Return(value=value)]
+    )
+
+
+def build_event(
+    event: EventRecord, target_lib: TargetLib, runtime: bool = False
+) -> ast.FunctionDef:
+    params = [
+        ("argument_filters", "dict[str, Any] | None"),
+        ("from_block", "BlockIdentifier | None"),
+        ("to_block", "BlockIdentifier | None"),
+        ("block_hash", "HexBytes | None"),
+    ]
+    value: ast.expr
+    if runtime:
+        # the runtime passes the keywords of the installed web3 version
+        value = _call(
+            _attribute("self", "_get_event_logs"),
+            [_string(event.name), *(_name(n) for n, _ in params)],
+        )
+    else:
+        get_logs_keywords = GET_LOGS_KEYWORDS[target_lib]
+        get_logs = ast.Attribute(
+            value=_call(_attribute("self", "contract", "events", event.name)),
+            attr="get_logs",
+            ctx=ast.Load(),
+        )
+        value = _call(
+            get_logs,
+            keywords={get_logs_keywords.get(n, n): _name(n) for n, _ in params},
+        )
+    return _function_def(
+        f"get_event_{event.name}",
+        _arguments(params, [ast.Constant(value=None)] * len(params)),
+        _annotation("Iterable[EventData]"),
+        [ast.Return(value=value)],
+    )
+
+
+def _fits(line: str) -> bool:
+    return len(line) <= LINE_LENGTH
+
+
+def _bracket_lines(
+    head: str,
+    items: Sequence[str],
+    tail: str,
+    indent: str,
+    comment: str | None = None,
+    is_def: bool = False,
+) -> list[str]:
+    """
+    Black's layout for a bracket pair: everything on one line, the items on their own line,
+    or one item per line with a trailing comma.
+    """
+    joined = ", ".join(items)
+    if comment is None and _fits(f"{indent}{head}{joined}{tail}"):
+        return [f"{indent}{head}{joined}{tail}"]
+    opening = f"{indent}{head}" + (f"  {comment}" if comment else "")
+    if is_def and len(items) == 1:
+        # black adds a trailing comma to a lone parameter
+        joined += ","
+    if items and _fits(f"{indent}{INDENT}{joined}"):
+        return [opening, f"{indent}{INDENT}{joined}", f"{indent}{tail}"]
+    return (
+        [opening] + [f"{indent}{INDENT}{item}," for item in items] + [f"{indent}{tail}"]
+    )
+
+
+def _format_param(arg: ast.arg, default: ast.expr | None) -> str:
+    param = arg.arg
+    if arg.annotation is not None:
+        param += f": {_unparse_annotation(arg.annotation)}"
+        if default is not None:
+            param += f" = {_unparse(default)}"
+    elif default is not None:
+        param += f"={_unparse(default)}"
+    return param
+
+
+def _annotation_lines(
+    head: str, annotation: ast.expr, tail: str, indent: str
+) -> list[str]:
+    """
+    `head`, `annotation` and `tail` on a line, or when it doesn't fit,
+    split at the brackets of the annotation's subscript like black splits at the last brackets of a line.
+    """
+    line = f"{indent}{head}{_unparse_annotation(annotation)}{tail}"
+    if _fits(line) or not isinstance(annotation, ast.Subscript):
+        return [line]
+    opening = f"{indent}{head}{_unparse_annotation(annotation.value)}["
+    closing = f"{indent}]{tail}"
+    inner = indent + INDENT
+    if not isinstance(annotation.slice, ast.Tuple):
+        return [opening, *_annotation_lines("", annotation.slice, "", inner), closing]
+    elements = annotation.slice.elts
+    joined = ", ".join(_unparse_annotation(e) for e in elements)
+    if _fits(f"{inner}{joined}"):
+        return [opening, f"{inner}{joined}", closing]
+    lines = [opening]
+    for element in elements:
+        lines += _annotation_lines("", element, ",", inner)
+    return [*lines, closing]
+
+
+def _param_lines(arg: ast.arg, default: ast.expr | None, indent: str) -> list[str]:
+    if arg.annotation is None:
+        return [f"{indent}{_format_param(arg, default)},"]
+    tail = "," if default is None else f" = {_unparse(default)},"
+    return _annotation_lines(f"{arg.arg}: ", arg.annotation, tail, indent)
+
+
+def _format_signature(node: ast.FunctionDef, indent: str) -> list[str]:
+    args = node.args.args
+    defaults: list[ast.expr | None] = [None] * (len(args) - len(node.args.defaults))
+    defaults += node.args.defaults
+    params = [_format_param(a, d) for a, d in zip(args, defaults)]
+    returns = ""
+    if node.returns is not None:
+        returns = f" -> {_unparse_annotation(node.returns)}"
+    lines = _bracket_lines(
+        f"def {node.name}(", params, f"){returns}:", indent, is_def=True
+    )
+    if len(lines) == 1:
+        return lines
+    # a parameter line only doesn't fit with one parameter per line
+    if not all(_fits(line) for line in lines[1:-1]):
+        lines[1:-1] = [
+            line
+            for a, d in zip(args, defaults)
+            for line in _param_lines(a, d, indent + INDENT)
+        ]
+    if node.returns is not None and not _fits(lines[-1]):
+        lines[-1:] = _annotation_lines(") -> ", node.returns, ":", indent)
+    return lines
+
+
+def _has_arguments(call: ast.Call) -> bool:
+    """
+    Whether a call of `func(args).trailer()` has arguments, in itself or in the calls it's chained on.
+    """
+    while not call.args and not call.keywords:
+        if not (
+            isinstance(call.func, ast.Attribute)
+            and isinstance(call.func.value, ast.Call)
+        ):
+            return False
+        call = call.func.value
+    return True
+
+
+def _format_call_statement(
+    prefix: str, call: ast.Call, indent: str, comment: str | None
+) -> list[str]:
+    """
+    Split a too long `prefix func(args).trailer()` statement at the arguments of the outermost call with arguments.
+    """
+    trailer = ""
+    while not call.args and not call.keywords and isinstance(call.func, ast.Attribute):
+        inner = call.func.value
+        if not isinstance(inner, ast.Call):
+            break
+        trailer = f".{call.func.attr}(){trailer}"
+        call = inner
+    items = [_unparse(a) for a in call.args]
+    items += [f"{k.arg}={_unparse(k.value)}" for k in call.keywords]
+    head = f"{prefix}{_unparse(call.func)}("
+    return _bracket_lines(head, items, f"){trailer}", indent, comment)
+
+
+def _format_statement(
+    node: ast.stmt, indent: str, comment: str | None = None
+) -> list[str]:
+    # statements are unparsed through their expressions, which need no source locations
+    if isinstance(node, ast.Return) and node.value is not None:
+        prefix, value = "return ", node.value
+    elif isinstance(node, ast.Expr):
+        prefix, value = "", node.value
+    elif isinstance(node, ast.Assign):
+        prefix, value = f"{_unparse(node.targets[0])} = ", node.value
+    else:
+        raise TypeError(f"Unsupported statement: {type(node).__name__}")
+    line = f"{indent}{prefix}{_unparse(value)}"
+    if comment is None and _fits(line):
+        return [line]
+    if isinstance(value, ast.Call) and (prefix or _has_arguments(value)):
+        if not _has_arguments(value):
+            # like black, with no brackets to split at, the value goes in parentheses
+            return [
+                f"{indent}{prefix}(" + (f"  {comment}" if comment else ""),
+                f"{indent}{INDENT}{_unparse(value)}",
+                f"{indent})",
+            ]
+        return _format_call_statement(prefix, value, indent, comment)
+    return [line + (f"  {comment}" if comment else "")]
+
+
+def format_method(node: ast.FunctionDef, comment: str | None = None) -> str:
+    """
+    Lay out a method of the contract class like black does.
+    `comment` is appended to the first line of the body, which `ast` can't carry.
+    """
+    lines = _format_signature(node, INDENT)
+    for statement in node.body:
+        lines += _format_statement(statement, INDENT * 2, comment)
+    return "\n".join(lines) + "\n"
+
+
+def _inline_literal(value: Any, budget: float) -> str | None:
+    """
+    `value` on a single line, or None as soon as it's known to be longer than `budget`,
+    so a large value that has to be split is never rendered inline in full.
+    """
+    if isinstance(value, str):
+        source = encode_basestring_ascii(value)
+    elif isinstance(value, (dict, list, tuple)):
+        if isinstance(value, dict):
+            entries = [
+                (f"{encode_basestring_ascii(str(k))}: ", v) for k, v in value.items()
+            ]
+            opening, closing = "{", "}"
+        else:
+            entries = [("", v) for v in value]
+            opening, closing = "[", "]"
+        parts: list[str] = []
+        used = 2
+        for key, item in entries:
+            if parts:
+                used += 2
+            item_source = _inline_literal(item, budget - used - len(key))
+            if item_source is None:
+                return None
+            parts.append(f"{key}{item_source}")
+            used += len(key) + len(item_source)
+        source = opening + ", ".join(parts) + closing
+    else:
+        source = ast.unparse(ast.Constant(value=value))
+    return source if len(source) <= budget else None
+
+
+def _layout_literal(
+    value: Any, indent: str, prefix: str, suffix: str, lines: list[str]
+) -> None:
+    budget = LINE_LENGTH - len(indent) - len(prefix) - len(suffix)
+    source = _inline_literal(value, budget)
+    if source is None and not (isinstance(value, (dict, list, tuple)) and value):
+        source = _inline_literal(value, float("inf"))
+    if source is not None:
+        lines.append(f"{indent}{prefix}{source}{suffix}")
+        return
+    if isinstance(value, dict):
+        opening, closing = "{", "}"
+        items = [(f"{encode_basestring_ascii(str(k))}: ", v) for k, v in value.items()]
+    else:
+        opening, closing = "[", "]"
+        items = [("", v) for v in value]
+    lines.append(f"{indent}{prefix}{opening}")
+    # like black, several items go on a line each with a trailing comma, a single item is only moved to its own line
+    item_suffix = "," if len(items) > 1 else ""
+    for item_prefix, item in items:
+        _layout_literal(item, indent + INDENT, item_prefix, item_suffix, lines)
+    lines.append(f"{indent}{closing}{suffix}")
+
+
+def format_abi_literal(abi: list[dict[str, Any]]) -> str:
+    """
+    ABI as a Python literal, laid out like black formats it.
+    """
+    lines: list[str] = []
+    _layout_literal(abi, "", "ABI = ", "", lines)
+    return "\n".join(lines)[len("ABI = ") :]
+
+
+@cache
+def _module_header(abi_embedding: ABIEmbedding, runtime: bool = False) -> str:
+    imports = [
+        ast.ImportFrom(module=module, names=[ast.alias(name=n) for n in names], level=0)
+        for module, names in (*IMPORTS, *([RUNTIME_IMPORT] if runtime else []))
+    ]
+    return "\n".join(
+        [
+            "# Autogenerated file.",
+            *ABI_LOADER_IMPORTS[abi_embedding],
+            *(ast.unparse(i) for i in imports),
+        ]
+    )
+
+
+def _abi_definition(formatted_content: str, abi_embedding: ABIEmbedding) -> str:
+    if abi_embedding == ABIEmbedding.literal:
+        return f"ABI = {formatted_content}"
+    if abi_embedding == ABIEmbedding.json:
+        return f"ABI_JSON = {formatted_content}" + ABI_LOADER.format(source="ABI_JSON")
+    return 'ABI_FILE = Path(__file__).with_suffix(".abi.json")' + ABI_LOADER.format(
+        source="ABI_FILE.read_bytes()"
+    )
+
+
+@dataclass(frozen=True)
+class ASTEmitter:
+    """
+    Emit the contract module by building its methods with `ast`, laid out like black formats them,
+    so the output needs no formatter.
+    Has the same `render_*` interface as the template macros, see `ContractCodeGenerator.iter_segments`.
+    """
+
+    target_lib: TargetLib = TargetLib.web3_v7
+
+    def render_header(
+        self,
+        formatted_content: str,
+        contract_class_name: str | None,
+        abi_embedding: ABIEmbedding = ABIEmbedding.literal,
+        runtime: bool = False,
+    ) -> str:
+        bases = [RUNTIME_BASE_CLASS] if runtime else []
+        if bases:
+            class_def = "\n".join(
+                _bracket_lines(f"class {contract_class_name}(", bases, "):", "")
+            )
+        else:
+            class_def = f"class {contract_class_name}:"
+        return (
+            f"{_module_header(abi_embedding, runtime)}\n\n"
+            f"{_abi_definition(formatted_content, abi_embedding)}\n\n\n"
+            f"{class_def}\n{format_method(build_init(abi_embedding, runtime))}"
+        )
+
+    def render_function(self, function: FunctionRecord, runtime: bool = False) -> str:
+        return "\n" + format_method(build_function(function, runtime))
+
+    def render_event(self, event: EventRecord, runtime: bool = False) -> str:
+        return "\n" + format_method(
+            build_event(event, self.target_lib, runtime),
+            comment=None if runtime else TYPE_IGNORE_ATTR_DEFINED,
+        )
+
+    def render(
+        self,
+        view: RenderView,
+        contract_class_name: str | None,
+        abi_embedding: ABIEmbedding = ABIEmbedding.literal,
+        runtime: bool = False,
+    ) -> str:
+        if abi_embedding == ABIEmbedding.literal:
+            formatted_content = format_abi_literal(view.content)
+        else:
+            formatted_content = embedded_content(view.content, abi_embedding)
+        return "".join(
+            [
+                self.render_header(
+                    formatted_content, contract_class_name, abi_embedding, runtime
+                )
+            ]
+            + [self.render_function(f, runtime) for f in view.functions]
+            + [self.render_event(e, runtime) for e in view.events]
+        )
+
+
+@cache
+def emitter_source() -> str:
+    """
+    Source of this module, hashed in place of a template source for caching.
+    Read once, as it's the source of the code running.
+    """
+    return Path(__file__).read_text()
@@ -0,0 +1,193 @@
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from py_contract_codegen.modules.code_generator import generate_targets
+from py_contract_codegen.modules.enums import Backend
+from py_contract_codegen.modules.exceptions import BatchManifestError
+from py_contract_codegen.modules.formatting import load_formatter
+from py_contract_codegen.modules.options import DEFAULT_OPTIONS, GenerateOptions
+from py_contract_codegen.modules.profiling import (
+    Profiler,
+    profile_report,
+    profile_stage,
+)
+from py_contract_codegen.modules.templates import get_template
+
+ABI_FILE_SUFFIXES = (".json", ".abi")
+CLASS_NAME_SUFFIX = "Contract"
+
+
+@dataclass(frozen=True)
+class BatchJob:
+    abi_path: Path
+    out_file: Path
+    contract_class_name: str
+    # byte offsets of the ABI JSON inside `abi_path`, e.g. in a compiler artifact, see `read_job_abi`
+    abi_span: tuple[int, int] | None = None
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    job: BatchJob
+    error: str | None = None
+    cached: bool = False
+    # per-stage timings of the job, with `profile`, see `Profiler`
+    profile: dict[str, Any] | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def read_job_abi(job: BatchJob) -> str:
+    """
+    The ABI of a job: the content of `abi_path`, or only its bytes in `abi_span`.
+    """
+    if job.abi_span is None:
+        return job.abi_path.read_text()
+    start, end = job.abi_span
+    with job.abi_path.open("rb") as f:
+        f.seek(start)
+        return f.read(end - start).decode()
+
+
+def class_name_from_stem(stem: str) -> str:
+    """
+    Derive a contract class name from a file stem.
+    e.g. `uniswap_v3` -> `UniswapV3Contract`
+    """
+    parts = [p for p in re.split(r"[^0-9A-Za-z]+", stem) if p]
+    name = "".join(p[0].upper() + p[1:] for p in parts) or "Generated"
+    if name[0].isdigit():
+        name = f"_{name}"
+    if not name.endswith(CLASS_NAME_SUFFIX):
+        name = f"{name}{CLASS_NAME_SUFFIX}"
+    return name
+
+
+def collect_jobs_from_dir(abi_dir: Path, out_dir: Path) -> list[BatchJob]:
+    """
+    Create a job for every ABI file directly under `abi_dir`.
+    """
+    return [
+        BatchJob(
+            abi_path=path,
+            out_file=out_dir / f"{path.stem}.py",
+            contract_class_name=class_name_from_stem(path.stem),
+        )
+        for path in sorted(abi_dir.iterdir())
+        if path.is_file() and path.suffix in ABI_FILE_SUFFIXES
+    ]
+
+
+def collect_jobs_from_manifest(manifest: Path, out_dir: Path | None) -> list[BatchJob]:
+    """
+    Create jobs from a JSON manifest.
+    The manifest is a list of `{"abi_path": ..., "class_name": ..., "out_file": ...}`,
+    where `class_name` and `out_file` are optional.
+    Relative paths are resolved against the manifest directory.
+    """
+    try:
+        entries = json.loads(manifest.read_text())
+    except json.JSONDecodeError as e:
+        raise BatchManifestError(f"Invalid JSON in manifest: {e}")
+    if not isinstance(entries, list):
+        raise BatchManifestError("Manifest must be a list of entries")
+
+    base_dir = manifest.parent
+    jobs = []
+    for entry in entries:
+        if not isinstance(entry, dict) or "abi_path" not in entry:
+            raise BatchManifestError("Each manifest entry must have `abi_path`")
+        abi_path = base_dir / entry["abi_path"]
+        if "out_file" in entry:
+            out_file = base_dir / entry["out_file"]
+        elif out_dir is not None:
+            out_file = out_dir / f"{abi_path.stem}.py"
+        else:
+            raise BatchManifestError(
+                f"`out_file` is not set for {entry['abi_path']} and no output directory was given"
+            )
+        jobs.append(
+            BatchJob(
+                abi_path=abi_path,
+                out_file=out_file,
+                contract_class_name=entry.get("class_name")
+                or class_name_from_stem(abi_path.stem),
+            )
+        )
+    return jobs
+
+
+def _init_worker(options: GenerateOptions) -> None:
+    # warm the process-wide template registry and formatter once per worker
+    if options.backend == Backend.jinja:
+        for target_lib in options.target_libs:
+            get_template(options.template_path, target_lib)
+    if options.format_output:
+        load_formatter()
+
+
+def _run_job(job: BatchJob, options: GenerateOptions) -> BatchResult:
+    profiler = (
+        Profiler(trace_memory=options.profile_memory).start()
+        if options.profile
+        else None
+    )
+    try:
+        with profile_stage("read"):
+            abi_content = read_job_abi(job)
+        if options.member_filter:
+            abi_content = options.member_filter.apply(abi_content)
+        generated = generate_targets(
+            abi_content, job.contract_class_name, job.out_file, options
+        )
+    except Exception as e:
+        return BatchResult(job=job, error=str(e))
+    finally:
+        if profiler is not None:
+            profiler.stop()
+    return BatchResult(
+        job=job,
+        cached=not generated,
+        profile=profile_report(profiler, abi_content) if profiler else None,
+    )
+
+
+def generate_batch(
+    jobs: list[BatchJob],
+    options: GenerateOptions = DEFAULT_OPTIONS,
+    max_workers: int | None = None,
+) -> list[BatchResult]:
+    """
+    Generate code for every job over a process pool, reporting failures per job without aborting the batch.
+    Workers read their ABIs and write their outputs themselves. Results are in the same order as `jobs`.
+    """
+    if options.format_output:
+        # fail before starting the pool when the formatter isn't installed
+        load_formatter()
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(jobs)))
+
+    if max_workers == 1:
+        _init_worker(options)
+        return [_run_job(job, options) for job in jobs]
+
+    results: dict[int, BatchResult] = {}
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(options,),
+    ) as executor:
+        futures = {
+            executor.submit(_run_job, job, options): i for i, job in enumerate(jobs)
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return [results[i] for i in range(len(jobs))]
@@ -0,0 +1,35 @@
+import importlib.util
+import py_compile
+from pathlib import Path
+
+from py_contract_codegen.modules.enums import Bytecode
+
+INVALIDATION_MODES = {
+    Bytecode.timestamp: py_compile.PycInvalidationMode.TIMESTAMP,
+    Bytecode.checked_hash: py_compile.PycInvalidationMode.CHECKED_HASH,
+    Bytecode.unchecked_hash: py_compile.PycInvalidationMode.UNCHECKED_HASH,
+}
+
+
+def bytecode_path(out_file: Path) -> Path:
+    """
+    Path of the `.pyc` the running interpreter imports `out_file` from.
+    e.g. `token.py` -> `__pycache__/token.cpython-312.pyc`
+    """
+    return Path(importlib.util.cache_from_source(str(out_file)))
+
+
+def write_bytecode(out_file: Path, mode: Bytecode) -> Path:
+    """
+    Compile `out_file` into its `__pycache__` as the import system would, so the first import doesn't compile it.
+    With `unchecked_hash`, the import system never checks the `.pyc` against the source,
+    so it must be written again whenever the source changes.
+    """
+    pyc_file = bytecode_path(out_file)
+    py_compile.compile(
+        str(out_file),
+        cfile=str(pyc_file),
+        doraise=True,
+        invalidation_mode=INVALIDATION_MODES[mode],
+    )
+    return pyc_file
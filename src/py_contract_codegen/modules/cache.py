@@ -0,0 +1,86 @@
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from py_contract_codegen import __version__
+from py_contract_codegen.modules.incremental import Manifest
+
+
+def normalize_abi(abi: str | list[dict[str, Any]]) -> str:
+    """
+    Normalize ABI to a canonical JSON string, so formatting differences don't change the hash.
+    """
+    content = json.loads(abi) if isinstance(abi, str) else abi
+    return json.dumps(content, sort_keys=True, separators=(",", ":"))
+
+
+def compute_cache_key(
+    abi: str | list[dict[str, Any]],
+    template_source: str,
+    contract_class_name: str | None,
+    target_lib: str,
+) -> str:
+    """
+    Hash every input that affects the generated code.
+    """
+    hasher = hashlib.sha256()
+    for part in (
+        normalize_abi(abi),
+        template_source,
+        contract_class_name or "",
+        target_lib,
+        __version__,
+    ):
+        hasher.update(part.encode())
+        hasher.update(b"\0")
+    return hasher.hexdigest()
+
+
+def file_digest(path: Path) -> str:
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+@dataclass
+class GenerationCache:
+    """
+    On-disk cache recording which generation key produced each output file, and the manifest of its segments.
+    An output is fresh when its recorded key matches and the file is unchanged since it was written.
+    """
+
+    cache_dir: Path
+
+    def _entry_path(self, out_file: Path) -> Path:
+        name = hashlib.sha256(str(out_file.resolve()).encode()).hexdigest()
+        return self.cache_dir / f"{name}.json"
+
+    def is_fresh(self, out_file: Path, key: str) -> bool:
+        entry_path = self._entry_path(out_file)
+        try:
+            entry = json.loads(entry_path.read_text())
+            return entry["key"] == key and entry["digest"] == file_digest(out_file)
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+    def manifest(self, out_file: Path) -> Manifest | None:
+        """
+        The manifest `out_file` was last written with, checked against the file by `read_previous_segments`.
+        """
+        try:
+            entry = json.loads(self._entry_path(out_file).read_text())
+            return Manifest.from_json(entry["manifest"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def store(self, out_file: Path, key: str, manifest: Manifest | None = None) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        entry_path = self._entry_path(out_file)
+        entry: dict[str, Any] = {"key": key, "digest": file_digest(out_file)}
+        if manifest is not None:
+            entry["manifest"] = manifest.to_json()
+        tmp_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(entry))
+        os.replace(tmp_path, entry_path)
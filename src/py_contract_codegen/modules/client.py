@@ -0,0 +1,75 @@
+import json
+import os
+import socket
+import stat
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from py_contract_codegen.modules.exceptions import DaemonError
+
+SOCKET_ENV_VAR = "PY_CONTRACT_CODEGEN_SOCKET"
+DEFAULT_TIMEOUT = 60.0
+
+
+def default_socket_path() -> Path:
+    """
+    Per-user socket in `$XDG_RUNTIME_DIR`, or else in a directory of the user in the temp directory,
+    which `serve` creates readable by the user only.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "py-contract-codegen.sock"
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return Path(tempfile.gettempdir()) / f"py-contract-codegen-{uid}" / "daemon.sock"
+
+
+def is_own_socket(socket_path: Path) -> bool:
+    """
+    Whether `socket_path` is a socket owned by the current user that no other user can connect to,
+    so it was created by a daemon of this user and not by someone else listening in its place.
+    """
+    try:
+        st = socket_path.lstat()
+    except OSError:
+        return False
+    if hasattr(os, "getuid") and st.st_uid != os.getuid():
+        return False
+    return stat.S_ISSOCK(st.st_mode) and not st.st_mode & (stat.S_IRWXG | stat.S_IRWXO)
+
+
+def is_daemon_running(socket_path: Path) -> bool:
+    if not is_own_socket(socket_path):
+        return False
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(socket_path))
+    except OSError:
+        return False
+    return True
+
+
+def request_generation(
+    socket_path: Path, request: dict[str, Any], timeout: float = DEFAULT_TIMEOUT
+) -> dict[str, Any]:
+    """
+    Send one request to the codegen daemon and wait for its response.
+    This module only depends on the standard library, so clients don't pay for importing the generator.
+    """
+    if not is_own_socket(socket_path):
+        raise DaemonError(
+            f"{socket_path} is not a codegen daemon socket of the current user"
+        )
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(socket_path))
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        sock.shutdown(socket.SHUT_WR)
+        with sock.makefile("rb") as f:
+            line = f.readline()
+    if not line:
+        raise DaemonError("Codegen daemon closed the connection without a response")
+    response = json.loads(line)
+    if not response.get("ok"):
+        raise DaemonError(response.get("error", "Unknown daemon error"))
+    return response
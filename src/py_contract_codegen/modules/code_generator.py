@@ -1,12 +1,67 @@
-from dataclasses import asdict, dataclass, field
+import os
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
+from typing import Any, TextIO
 
-from jinja2 import Environment, FileSystemLoader
+from py_contract_codegen.modules.ast_emitter import (
+    ASTEmitter,
+    emitter_source,
+    format_abi_literal,
+)
+from py_contract_codegen.modules.bytecode import bytecode_path, write_bytecode
+from py_contract_codegen.modules.cache import GenerationCache, compute_cache_key
+from py_contract_codegen.modules.constants import DEFAULT_CONTRACT_CLASS_NAME
+from py_contract_codegen.modules.embedding import (
+    embedded_content,
+    sidecar_path,
+    write_sidecar,
+)
+from py_contract_codegen.modules.enums import (
+    ABIEmbedding,
+    Backend,
+    Bytecode,
+    TargetLib,
+)
+from py_contract_codegen.modules.formatting import (
+    format_member,
+    format_module,
+    load_formatter,
+)
+from py_contract_codegen.modules.incremental import (
+    Segment,
+    SegmentWriter,
+    frame_digest,
+    read_previous_segments,
+    segment_digest,
+)
+from py_contract_codegen.modules.ir import ContractIR, load_ir
+from py_contract_codegen.modules.options import DEFAULT_OPTIONS, GenerateOptions
+from py_contract_codegen.modules.profiling import profile_stage, profiled
+from py_contract_codegen.modules.stub import (
+    render_runtime,
+    render_stub,
+    stub_path,
+    write_stub,
+)
+from py_contract_codegen.modules.templates import get_template, get_template_name
 
-from py_contract_codegen.modules.abi import ABIParser
-from py_contract_codegen.modules.enums import TargetLib
+# template sources read by `_template_source`, by path, along with their modification time
+_template_sources: dict[Path, tuple[int, str]] = {}
 
-DEFAULT_CONTRACT_CLASS_NAME = "GeneratedContract"
+
+def _read_template(path: Path) -> str:
+    """
+    Read a template source, again only once the file is modified.
+    """
+    mtime = path.stat().st_mtime_ns
+    entry = _template_sources.get(path)
+    if entry is not None and entry[0] == mtime:
+        return entry[1]
+    source = path.read_text()
+    _template_sources[path] = (mtime, source)
+    return source
 
 
 @dataclass
@@ -15,15 +70,352 @@ class ContractCodeGenerator:
     template_path: Path
     contract_class_name: str | None = field(default=DEFAULT_CONTRACT_CLASS_NAME)
     target_lib: TargetLib = field(default=TargetLib.web3_v7)
+    # parsed ABI shared between targets, parsed from `abi_content` on first use when not given
+    ir: ContractIR | None = field(default=None, repr=False)
+    backend: Backend = field(default=Backend.jinja)
+    # format the output in-process
+    format_output: bool = field(default=False)
+    # also write the `__pycache__` bytecode of files written by `generate_file`
+    bytecode: Bytecode | None = field(default=None)
+    # how the module embeds the ABI, see `ABIEmbedding`
+    abi_embedding: ABIEmbedding = field(default=ABIEmbedding.literal)
+    # write the class methods to a `.pyi` stub, the module compiles them on first access, see `render_runtime`
+    stub: bool = field(default=False)
+    # delegate construction, calls and events to `py_contract_codegen.runtime`
+    runtime: bool = field(default=False)
+
+    @classmethod
+    def from_options(
+        cls,
+        abi_content: str,
+        contract_class_name: str | None,
+        target_lib: TargetLib,
+        options: GenerateOptions,
+        ir: ContractIR | None = None,
+    ) -> "ContractCodeGenerator":
+        return cls(
+            abi_content=abi_content,
+            template_path=options.template_path,
+            contract_class_name=contract_class_name,
+            target_lib=target_lib,
+            ir=ir,
+            backend=options.backend,
+            format_output=options.format_output,
+            bytecode=options.bytecode,
+            abi_embedding=options.abi_embedding,
+            stub=options.stub,
+            runtime=options.runtime,
+        )
 
     def __post_init__(self):
-        template_loader = FileSystemLoader(self.template_path)
-        self.env = Environment(loader=template_loader)
-        target_lib = f"contract.{self.target_lib.value}.jinja2"
-        self.template = self.env.get_template(target_lib)
+        # segments rendered and reused by the last `generate_file`, None if it wasn't split into segments
+        self.last_write: SegmentWriter | None = None
+        self.template_name = get_template_name(self.target_lib)
+        # templates and the formatter are loaded once per process
+        with profile_stage("setup"):
+            if self.backend == Backend.ast:
+                self.emitter: ASTEmitter | None = ASTEmitter(self.target_lib)
+            else:
+                self.emitter = None
+                self.template = get_template(self.template_path, self.target_lib)
+            # identity of the formatter used on the output, None if it isn't formatted
+            self.formatter: str | None = None
+            if self.format_output:
+                _, self.formatter = load_formatter()
+
+    def parse(self) -> ContractIR:
+        if self.ir is None:
+            self.ir = ContractIR.from_abi(self.abi_content)
+        return self.ir
+
+    def _build_context(self) -> dict[str, Any]:
+        view = self.parse().render_view()
+        context = view.context(self.contract_class_name)
+        if self.abi_embedding != ABIEmbedding.literal:
+            context["abi_embedding"] = self.abi_embedding.value
+            context["formatted_content"] = embedded_content(
+                view.content, self.abi_embedding
+            )
+        if self.runtime:
+            context["runtime"] = True
+        return context
 
     def generate(self) -> str:
-        abi_data = ABIParser(abi=self.abi_content)
-        context = asdict(abi_data)
-        context["contract_class_name"] = self.contract_class_name
-        return self.template.render(context)
+        if self.formatter is not None:
+            return "".join(self.iter_generate())
+        if self.emitter is not None:
+            return self.emitter.render(
+                self.parse().render_view(),
+                self.contract_class_name,
+                self.abi_embedding,
+                self.runtime,
+            )
+        return self.template.render(self._build_context())
+
+    def iter_generate(self) -> Iterator[str]:
+        """
+        Generate code as chunks, without building the whole module in memory.
+        The ABI is parsed before the first chunk is yielded.
+        """
+        if self.emitter is not None or self.formatter is not None:
+            # formatted output is produced one segment at a time,
+            # or formatted as a whole when the template has no segments
+            segments = self.iter_segments()
+            if segments is None:
+                return iter(
+                    [format_module(self.template.render(self._build_context()))]
+                )
+            return (segment.render() for segment in segments)
+        return self.template.generate(self._build_context())
+
+    def generate_to(self, fp: TextIO) -> None:
+        """
+        Write generated code to `fp` incrementally.
+        """
+        write = profiled(fp.write, "write")
+        with profile_stage("render"):
+            for chunk in self.iter_generate():
+                write(chunk)
+
+    def iter_segments(self) -> Iterator[Segment] | None:
+        """
+        Split the module into the header and one segment per function and event, in render order.
+        Returns None when the template doesn't define the `render_*` macros.
+        """
+        if self.emitter is not None:
+            return self._iter_segments(
+                self.emitter,
+                self.parse(),
+                self.contract_class_name,
+                self.formatter is not None,
+                self.abi_embedding,
+                self.runtime,
+            )
+        module = self.template.module
+        macros = ("render_header", "render_function", "render_event")
+        if not all(hasattr(module, name) for name in macros):
+            return None
+        ir = self.parse()
+        return self._iter_segments(
+            module,
+            ir,
+            self.contract_class_name,
+            self.formatter is not None,
+            self.abi_embedding,
+            self.runtime,
+        )
+
+    @staticmethod
+    def _iter_segments(
+        module: Any,
+        ir: ContractIR,
+        contract_class_name: str | None,
+        formatted: bool = False,
+        abi_embedding: ABIEmbedding = ABIEmbedding.literal,
+        runtime: bool = False,
+    ) -> Iterator[Segment]:
+        # digests come from the parsed members, the blocks are rendered from their records
+        view = ir.render_view()
+        if formatted:
+            # each block is formatted on its own, which gives the same text as formatting the whole module
+            module = _FormattedModule(module)
+        header_args: list[Any] = [contract_class_name]
+        # options are only passed when needed, so templates whose macros don't take them keep working
+        if abi_embedding != ABIEmbedding.literal or runtime:
+            header_args.append(abi_embedding.value)
+        member_args: list[Any] = []
+        if runtime:
+            header_args.append(True)
+            member_args.append(True)
+        if abi_embedding != ABIEmbedding.literal:
+            formatted_content = embedded_content(view.content, abi_embedding)
+        elif isinstance(module, ASTEmitter):
+            formatted_content = format_abi_literal(view.content)
+        else:
+            formatted_content = view.formatted_content
+        yield Segment(
+            digest=segment_digest("header", [formatted_content, *header_args]),
+            render=lambda: module.render_header(formatted_content, *header_args),
+        )
+        for function, function_record in zip(ir.functions, view.functions):
+            yield Segment(
+                digest=segment_digest("function", function),
+                render=partial(module.render_function, function_record, *member_args),
+            )
+        for event, event_record in zip(ir.events, view.events):
+            yield Segment(
+                digest=segment_digest("event", event),
+                render=partial(module.render_event, event_record, *member_args),
+            )
+
+    def _template_source(self) -> str:
+        if self.emitter is not None:
+            source = emitter_source()
+        else:
+            source = _read_template(self.template_path / self.template_name)
+        if self.formatter is not None:
+            # outputs of another formatter (or none) are neither fresh nor reused
+            source += f"\0{self.formatter}"
+        return source
+
+    def _options_source(self) -> str:
+        # the template or emitter source, along with the options that change its output
+        source = self._template_source()
+        if self.abi_embedding != ABIEmbedding.literal:
+            source += f"\0abi_embedding={self.abi_embedding.value}"
+        if self.stub:
+            source += "\0stub"
+        if self.runtime:
+            source += "\0runtime"
+        return source
+
+    def _companion_files(self, out_file: Path) -> list[Path]:
+        # files written along with `out_file`, which isn't up to date without them
+        files = []
+        if self.abi_embedding == ABIEmbedding.sidecar:
+            files.append(sidecar_path(out_file))
+        if self.stub:
+            files.append(stub_path(out_file))
+        return files
+
+    def cache_key(self) -> str:
+        return compute_cache_key(
+            abi=self.abi_content,
+            template_source=self._options_source(),
+            contract_class_name=self.contract_class_name,
+            target_lib=self.target_lib.value,
+        )
+
+    def generate_file(
+        self, out_file: Path, cache: GenerationCache | None = None
+    ) -> bool:
+        """
+        Generate code into `out_file`.
+        Returns False when the cache shows `out_file` is already up to date, in which case it is left untouched.
+        Otherwise, with `cache`, only the functions and events that changed since the previous generation of `out_file`
+        are rendered, the others are copied from it.
+        With `bytecode`, the `__pycache__` bytecode of `out_file` is written too, or only when it's missing if up to date.
+        With `ABIEmbedding.sidecar`, the ABI file next to `out_file` is written too, and with `stub` its `.pyi` stub.
+        """
+        key = None
+        if cache is not None:
+            with profile_stage("cache"):
+                key = self.cache_key()
+                fresh = cache.is_fresh(out_file, key) and all(
+                    path.exists() for path in self._companion_files(out_file)
+                )
+            if fresh:
+                if self.bytecode is not None and not bytecode_path(out_file).exists():
+                    with profile_stage("bytecode"):
+                        write_bytecode(out_file, self.bytecode)
+                return False
+            if self.ir is None:
+                self.ir = load_ir(self.abi_content, cache.cache_dir)
+        # a stub and its module are split from the whole module, so they're rendered in full
+        segments = None if self.stub or cache is None else self.iter_segments()
+        writer = None
+        if segments is not None and cache is not None:
+            frame = frame_digest(self._options_source(), self.target_lib.value)
+            with profile_stage("read_previous"):
+                previous = read_previous_segments(
+                    out_file, frame, cache.manifest(out_file)
+                )
+            writer = SegmentWriter(frame, previous)
+        out_file.parent.mkdir(parents=True, exist_ok=True)
+        if self.abi_embedding == ABIEmbedding.sidecar:
+            content = self.parse().content
+            with profile_stage("write"):
+                write_sidecar(out_file, content)
+        runtime = None
+        if self.stub:
+            with profile_stage("render"):
+                source = self.generate()
+                stub = render_stub(source, self.contract_class_name)
+                if self.format_output:
+                    # signatures that fit on a line may not once their body is `...`
+                    stub = format_module(stub)
+            with profile_stage("write"):
+                write_stub(out_file, stub)
+            with profile_stage("render"):
+                runtime = render_runtime(source, self.contract_class_name)
+        # write next to `out_file` and swap it in, so a failed render never leaves a partial file
+        tmp_file = out_file.with_name(f".{out_file.name}.{os.getpid()}.tmp")
+        with profile_stage("write"):
+            try:
+                # rendering is interleaved with the writes, which are accounted apart
+                with tmp_file.open("w") as f, profile_stage("render"):
+                    write = profiled(f.write, "write")
+                    if runtime is not None:
+                        write(runtime)
+                    elif segments is not None and writer is not None:
+                        writer.write(segments, write)
+                    else:
+                        for chunk in self.iter_generate():
+                            write(chunk)
+                os.replace(tmp_file, out_file)
+            finally:
+                tmp_file.unlink(missing_ok=True)
+        self.last_write = writer
+        if self.bytecode is not None:
+            with profile_stage("bytecode"):
+                write_bytecode(out_file, self.bytecode)
+        if cache is not None and key is not None:
+            with profile_stage("cache"):
+                cache.store(out_file, key, writer.manifest if writer else None)
+        return True
+
+
+@dataclass(frozen=True)
+class _FormattedModule:
+    """
+    The `render_*` macros of a template module, with their output formatted.
+    """
+
+    module: Any
+
+    def render_header(self, formatted_content: str, *args: Any) -> str:
+        return format_module(self.module.render_header(formatted_content, *args))
+
+    def render_function(self, function: Any, *args: Any) -> str:
+        return format_member(self.module.render_function(function, *args))
+
+    def render_event(self, event: Any, *args: Any) -> str:
+        return format_member(self.module.render_event(event, *args))
+
+
+def target_out_file(out_file: Path, target_lib: TargetLib) -> Path:
+    """
+    Output file of one of several targets.
+    e.g. `token.py` -> `token_web3_v6.py`
+    """
+    return out_file.with_name(f"{out_file.stem}_{target_lib.value}{out_file.suffix}")
+
+
+def generate_targets(
+    abi_content: str,
+    contract_class_name: str | None,
+    out_file: Path,
+    options: GenerateOptions = DEFAULT_OPTIONS,
+) -> bool:
+    """
+    Parse the ABI once and generate it for every target of `options`.
+    With a single target the output is `out_file`, otherwise see `target_out_file`.
+    With `options.cache_dir`, the parsed ABI is also cached on disk, so later runs skip parsing.
+    Returns False when every output was already up to date.
+    """
+    cache = options.cache()
+    ir = None
+    generated = False
+    for target_lib in options.target_libs:
+        generator = ContractCodeGenerator.from_options(
+            abi_content, contract_class_name, target_lib, options, ir=ir
+        )
+        target_file = (
+            out_file
+            if len(options.target_libs) == 1
+            else target_out_file(out_file, target_lib)
+        )
+        if generator.generate_file(target_file, cache=cache):
+            generated = True
+        ir = generator.ir
+    return generated
@@ -0,0 +1,4 @@
+from pathlib import Path
+
+DEFAULT_CONTRACT_CLASS_NAME = "GeneratedContract"
+TEMPLATE_PATH = Path(__file__).resolve().parent.parent / "template"
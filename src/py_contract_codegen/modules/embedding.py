@@ -0,0 +1,41 @@
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from py_contract_codegen.modules.enums import ABIEmbedding
+
+SIDECAR_SUFFIX = ".abi.json"
+
+
+def minify_abi(content: list[dict[str, Any]]) -> str:
+    return json.dumps(content, separators=(",", ":"))
+
+
+def sidecar_path(out_file: Path) -> Path:
+    """
+    ABI file loaded by a module generated with `ABIEmbedding.sidecar`.
+    e.g. `token.py` -> `token.abi.json`
+    """
+    return out_file.with_suffix(SIDECAR_SUFFIX)
+
+
+def embedded_content(content: list[dict[str, Any]], abi_embedding: ABIEmbedding) -> str:
+    """
+    What the module header embeds in place of the formatted ABI literal:
+    the minified ABI as a string literal, or nothing when the ABI is in a sidecar file.
+    """
+    if abi_embedding == ABIEmbedding.json:
+        return repr(minify_abi(content))
+    return ""
+
+
+def write_sidecar(out_file: Path, content: list[dict[str, Any]]) -> Path:
+    path = sidecar_path(out_file)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(minify_abi(content))
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return path
@@ -6,6 +6,11 @@ class TargetLib(str, Enum):
     web3_v6 = "web3_v6"
 
 
+class Backend(str, Enum):
+    jinja = "jinja"
+    ast = "ast"
+
+
 class ABIType(Enum):
     function = auto()
     event = auto()
@@ -25,3 +30,21 @@ class StateMutability(str, Enum):
 class Network(str, Enum):
     mainnet = "mainnet"
     sepolia = "sepolia"
+
+
+class ArtifactFormat(str, Enum):
+    foundry = "foundry"
+    hardhat = "hardhat"
+    solc = "solc"
+
+
+class Bytecode(str, Enum):
+    timestamp = "timestamp"
+    checked_hash = "checked_hash"
+    unchecked_hash = "unchecked_hash"
+
+
+class ABIEmbedding(str, Enum):
+    literal = "literal"
+    json = "json"
+    sidecar = "sidecar"
@@ -16,3 +16,15 @@ class UnknownABITypeError(ABIParserError):
 
 class EtherscanAPIError(Exception):
     """Raised when the etherscan API errors."""
+
+
+class BatchManifestError(Exception):
+    """Raised when the batch manifest is invalid."""
+
+
+class DaemonError(Exception):
+    """Raised when the codegen daemon fails to handle a request."""
+
+
+class FormatterNotInstalledError(Exception):
+    """Raised when formatting is requested but the formatter is not installed."""
@@ -0,0 +1,47 @@
+from collections.abc import Callable
+from functools import lru_cache
+
+from py_contract_codegen.modules.exceptions import FormatterNotInstalledError
+from py_contract_codegen.modules.profiling import profile_stage
+
+# a member segment is an indented method, formatted as the body of a stand-in class
+_CLASS_LINE = "class _:\n"
+
+
+@lru_cache(maxsize=None)
+def load_formatter() -> tuple[Callable[[str], str], str]:
+    """
+    The in-process formatter and its identity, loaded once per process.
+    The identity changes with the formatter version, so outputs formatted by another version aren't reused.
+    """
+    try:
+        import black
+    except ImportError:
+        raise FormatterNotInstalledError(
+            "`--format` requires black: pip install 'py-contract-codegen[format]'"
+        )
+    mode = black.Mode()
+
+    def format_code(code: str) -> str:
+        return black.format_str(code, mode=mode)
+
+    return format_code, f"black {black.__version__}"
+
+
+def format_module(code: str) -> str:
+    """
+    Format a whole generated module.
+    """
+    format_code, _ = load_formatter()
+    with profile_stage("format"):
+        return format_code(code)
+
+
+def format_member(code: str) -> str:
+    """
+    Format the segment of one function or event: a method of the contract class preceded by a blank line.
+    """
+    format_code, _ = load_formatter()
+    with profile_stage("format"):
+        formatted = format_code(_CLASS_LINE + code.lstrip("\n"))
+    return "\n" + formatted[len(_CLASS_LINE) :]
@@ -0,0 +1,128 @@
+import hashlib
+import json
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from py_contract_codegen import __version__
+
+MANIFEST_VERSION = 1
+SEGMENT_DIGEST_SIZE = 16
+
+
+def segment_digest(kind: str, data: Any) -> str:
+    """
+    Digest of everything a segment of the generated module is rendered from.
+    """
+    payload = json.dumps([kind, data], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()[:SEGMENT_DIGEST_SIZE]
+
+
+def frame_digest(template_source: str, target_lib: str) -> str:
+    """
+    Digest of the inputs shared by every segment.
+    Segments of a previous generation are only reused when this is unchanged.
+    """
+    payload = "\0".join((template_source, target_lib, __version__))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class Segment:
+    """
+    A block of the generated module, e.g. the header or one contract function.
+    The block is rendered lazily, only when a previous generation can't provide it.
+    """
+
+    digest: str
+    render: Callable[[], str]
+
+
+@dataclass(frozen=True)
+class Manifest:
+    """
+    Stored in the generation cache along with its output file: the `(digest, length)` of every segment in order,
+    so a later generation can reuse the unchanged segments without rendering them.
+    """
+
+    frame: str
+    body_digest: str
+    segments: tuple[tuple[str, int], ...]
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "version": MANIFEST_VERSION,
+            "frame": self.frame,
+            "body": self.body_digest,
+            "segments": self.segments,
+        }
+
+    @classmethod
+    def from_json(cls, content: Any) -> "Manifest | None":
+        try:
+            if content["version"] != MANIFEST_VERSION:
+                return None
+            return cls(
+                frame=content["frame"],
+                body_digest=content["body"],
+                segments=tuple((str(d), int(n)) for d, n in content["segments"]),
+            )
+        except (ValueError, KeyError, TypeError):
+            return None
+
+
+def read_previous_segments(
+    out_file: Path, frame: str, manifest: Manifest | None
+) -> dict[str, str]:
+    """
+    Map segment digests to their text in a previously generated `out_file`, split by its `manifest`.
+    Nothing is reused when the file is missing, was generated with a different frame, or was edited since.
+    """
+    if manifest is None or manifest.frame != frame:
+        return {}
+    try:
+        body = out_file.read_text()
+    except (OSError, UnicodeDecodeError):
+        return {}
+    if len(body) != sum(n for _, n in manifest.segments):
+        return {}
+    if hashlib.sha256(body.encode()).hexdigest() != manifest.body_digest:
+        return {}
+    previous = {}
+    offset = 0
+    for digest, length in manifest.segments:
+        previous[digest] = body[offset : offset + length]
+        offset += length
+    return previous
+
+
+@dataclass
+class SegmentWriter:
+    """
+    Write segments, reusing the text of `previous` segments with the same digest,
+    and record the manifest of what was written.
+    """
+
+    frame: str
+    previous: dict[str, str]
+    rendered: int = 0
+    reused: int = 0
+    manifest: Manifest | None = None
+
+    def write(self, segments: Iterable[Segment], write: Callable[[str], Any]) -> None:
+        hasher = hashlib.sha256()
+        written = []
+        for segment in segments:
+            text = self.previous.get(segment.digest)
+            if text is None:
+                text = segment.render()
+                self.rendered += 1
+            else:
+                self.reused += 1
+            write(text)
+            hasher.update(text.encode())
+            written.append((segment.digest, len(text)))
+        self.manifest = Manifest(
+            frame=self.frame, body_digest=hasher.hexdigest(), segments=tuple(written)
+        )
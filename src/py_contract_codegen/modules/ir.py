@@ -0,0 +1,92 @@
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from py_contract_codegen import __version__
+from py_contract_codegen.modules.abi import (
+    ABIParser,
+    ABITypedConstructor,
+    ABITypedEvent,
+    ABITypedFunction,
+    RenderView,
+)
+from py_contract_codegen.modules.profiling import profile_stage
+
+IR_CACHE_DIR_NAME = "ir"
+
+
+@dataclass
+class ContractIR:
+    """
+    The parsed ABI and everything the backends need from it, independent of the target library.
+    Parse once with `from_abi`, then render it for any number of targets.
+    It round-trips through JSON, so it can be cached on disk.
+    """
+
+    content: list[dict[str, Any]]
+    formatted_content: str
+    functions: list[ABITypedFunction] = field(default_factory=list)
+    events: list[ABITypedEvent] = field(default_factory=list)
+    constructors: list[ABITypedConstructor] = field(default_factory=list)
+    fallbacks: list[dict[str, Any]] = field(default_factory=list)
+    receives: list[dict[str, Any]] = field(default_factory=list)
+    errors: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_abi(cls, abi_content: str) -> "ContractIR":
+        parser = ABIParser(abi=abi_content)
+        return cls(
+            content=parser.content,
+            formatted_content=parser.formatted_content,
+            functions=parser.functions,
+            events=parser.events,
+            constructors=parser.constructors,
+            fallbacks=[dict(f) for f in parser.fallbacks],
+            receives=[dict(r) for r in parser.receives],
+            errors=[dict(e) for e in parser.errors],
+        )
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, content: str) -> "ContractIR":
+        return cls(**json.loads(content))
+
+    def render_view(self) -> RenderView:
+        with profile_stage("render_view"):
+            return RenderView.build(
+                self.content, self.formatted_content, self.functions, self.events
+            )
+
+
+def ir_cache_key(abi_content: str) -> str:
+    """
+    Hash of the raw ABI content, so a cached IR is found without parsing the ABI.
+    """
+    hasher = hashlib.sha256(abi_content.encode())
+    hasher.update(b"\0" + __version__.encode())
+    return hasher.hexdigest()
+
+
+def load_ir(abi_content: str, cache_dir: Path | None = None) -> ContractIR:
+    """
+    Load the IR of `abi_content` from `cache_dir`, parsing and storing it on a miss.
+    """
+    if cache_dir is None:
+        return ContractIR.from_abi(abi_content)
+    with profile_stage("ir_cache"):
+        ir_path = cache_dir / IR_CACHE_DIR_NAME / f"{ir_cache_key(abi_content)}.json"
+        try:
+            return ContractIR.from_json(ir_path.read_text())
+        except (OSError, ValueError, TypeError):
+            pass
+        ir = ContractIR.from_abi(abi_content)
+        ir_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = ir_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(ir.to_json())
+        os.replace(tmp_path, ir_path)
+        return ir
@@ -0,0 +1,125 @@
+import hashlib
+import importlib.util
+import json
+import keyword
+import marshal
+import os
+from pathlib import Path
+from types import CodeType
+from typing import Any
+
+from py_contract_codegen.modules.code_generator import ContractCodeGenerator
+from py_contract_codegen.modules.constants import (
+    DEFAULT_CONTRACT_CLASS_NAME,
+    TEMPLATE_PATH,
+)
+from py_contract_codegen.modules.enums import Backend, TargetLib
+from py_contract_codegen.modules.ir import load_ir
+
+CODE_CACHE_DIR_NAME = "code"
+# classes kept in memory, the first loaded is dropped first
+MAX_LOADED_CONTRACTS = 1024
+# `__module__` of the loaded classes
+LOADED_MODULE_NAME = "py_contract_codegen.loaded"
+
+# by `_code_key`
+_loaded: dict[str, type] = {}
+# `_code_key` by the arguments it was computed from, so loading the same ABI again doesn't even hash it.
+# Lists are keyed by their id, and kept along with the key so the id isn't reused while it's kept.
+_code_keys: dict[tuple[Any, ...], tuple[str | list[dict[str, Any]], str]] = {}
+
+
+def _code_key(generator: ContractCodeGenerator) -> str:
+    """
+    Hash of the compiled code of a generator: of its normalized ABI, options and the interpreter version,
+    since code objects are only valid for the interpreter version that compiled them.
+    """
+    return hashlib.sha256(
+        (generator.cache_key() + importlib.util.MAGIC_NUMBER.hex()).encode()
+    ).hexdigest()
+
+
+def _compile(
+    generator: ContractCodeGenerator, key: str, cache_dir: Path | None
+) -> CodeType:
+    """
+    Compile the generated module, loading the code object from `cache_dir` when it was compiled before.
+    """
+    filename = f"<{LOADED_MODULE_NAME}.{generator.contract_class_name}>"
+    if cache_dir is None:
+        return compile(generator.generate(), filename, "exec")
+    code_path = cache_dir / CODE_CACHE_DIR_NAME / f"{key}.bin"
+    try:
+        code = marshal.loads(code_path.read_bytes())
+        if isinstance(code, CodeType):
+            return code
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    generator.ir = load_ir(generator.abi_content, cache_dir)
+    code = compile(generator.generate(), filename, "exec")
+    code_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = code_path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_bytes(marshal.dumps(code))
+    os.replace(tmp_path, code_path)
+    return code
+
+
+def load_contract(
+    abi: str | list[dict[str, Any]],
+    class_name: str = DEFAULT_CONTRACT_CLASS_NAME,
+    target_lib: TargetLib = TargetLib.web3_v7,
+    backend: Backend = Backend.jinja,
+    cache_dir: Path | None = None,
+) -> type:
+    """
+    Generate the contract class of `abi` and return it, without writing or importing a module.
+    Classes are kept in memory by the hash of their normalized ABI and options,
+    so loading the same ABI again, however it's formatted, only hashes it,
+    and loading the same ABI string, or the same list object, again doesn't even hash it.
+    A list must then not be modified once loaded.
+    With `cache_dir`, the compiled code is also cached on disk by the same hash and shared between processes.
+    e.g. `load_contract(abi, "Token")(contract_address, web3).balanceOf(owner)`
+    """
+    arguments = (
+        abi if isinstance(abi, str) else id(abi),
+        class_name,
+        target_lib,
+        backend,
+    )
+    entry = _code_keys.get(arguments)
+    if entry is not None and (isinstance(abi, str) or entry[0] is abi):
+        cls = _loaded.get(entry[1])
+        if cls is not None:
+            return cls
+    if not class_name.isidentifier() or keyword.iskeyword(class_name):
+        raise ValueError(f"Invalid class name: {class_name!r}")
+    generator = ContractCodeGenerator(
+        abi_content=abi if isinstance(abi, str) else json.dumps(abi),
+        template_path=TEMPLATE_PATH,
+        contract_class_name=class_name,
+        target_lib=target_lib,
+        backend=backend,
+    )
+    key = _code_key(generator)
+    if len(_code_keys) >= MAX_LOADED_CONTRACTS:
+        del _code_keys[next(iter(_code_keys))]
+    _code_keys[arguments] = (abi, key)
+    cls = _loaded.get(key)
+    if cls is not None:
+        return cls
+    code = _compile(generator, key, cache_dir)
+    namespace: dict[str, Any] = {"__name__": LOADED_MODULE_NAME}
+    exec(code, namespace)
+    cls = namespace[class_name]
+    if len(_loaded) >= MAX_LOADED_CONTRACTS:
+        del _loaded[next(iter(_loaded))]
+    _loaded[key] = cls
+    return cls
+
+
+def clear_loaded_contracts() -> None:
+    """
+    Drop the classes kept in memory. Code cached on disk is kept.
+    """
+    _loaded.clear()
+    _code_keys.clear()
@@ -0,0 +1,53 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from py_contract_codegen.modules.cache import GenerationCache
+from py_contract_codegen.modules.constants import TEMPLATE_PATH
+from py_contract_codegen.modules.enums import (
+    ABIEmbedding,
+    Backend,
+    Bytecode,
+    TargetLib,
+)
+
+if TYPE_CHECKING:
+    from py_contract_codegen.modules.pruning import MemberFilter
+
+# NOTE: Imported by the CLI at startup, so it mustn't import jinja2 or eth_abi, see `tests/test_startup.py`.
+
+
+@dataclass(frozen=True)
+class GenerateOptions:
+    """
+    Options of a generation, shared by every contract of a batch, package or watch.
+    Immutable, so the same options are safely passed to every worker process.
+    """
+
+    template_path: Path = TEMPLATE_PATH
+    # each ABI is parsed once and generated for every target, see `generate_targets`
+    target_libs: tuple[TargetLib, ...] = (TargetLib.web3_v7,)
+    backend: Backend = Backend.jinja
+    # format the outputs in-process
+    format_output: bool = False
+    # also write the `__pycache__` bytecode of the outputs
+    bytecode: Bytecode | None = None
+    # how the modules embed the ABI, see `ABIEmbedding`
+    abi_embedding: ABIEmbedding = ABIEmbedding.literal
+    # write the class methods to a `.pyi` stub, see `render_runtime`
+    stub: bool = False
+    # delegate construction, calls and events to `py_contract_codegen.runtime`
+    runtime: bool = False
+    # only generate the selected functions and events of every ABI
+    member_filter: "MemberFilter | None" = None
+    # outputs whose inputs haven't changed are skipped and left untouched, see `GenerationCache`
+    cache_dir: Path | None = None
+    # time each stage of every job, and trace its memory with `profile_memory`, see `Profiler`
+    profile: bool = False
+    profile_memory: bool = True
+
+    def cache(self) -> GenerationCache | None:
+        return GenerationCache(self.cache_dir) if self.cache_dir is not None else None
+
+
+DEFAULT_OPTIONS = GenerateOptions()
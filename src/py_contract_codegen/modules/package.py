@@ -0,0 +1,226 @@
+import hashlib
+import json
+import os
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from py_contract_codegen.modules.batch import (
+    BatchJob,
+    BatchResult,
+    generate_batch,
+    read_job_abi,
+)
+from py_contract_codegen.modules.bytecode import bytecode_path, write_bytecode
+from py_contract_codegen.modules.cache import normalize_abi
+from py_contract_codegen.modules.embedding import sidecar_path
+from py_contract_codegen.modules.exceptions import ABIParserError
+from py_contract_codegen.modules.options import DEFAULT_OPTIONS, GenerateOptions
+from py_contract_codegen.modules.pruning import MemberFilter
+from py_contract_codegen.modules.stub import stub_path
+
+PACKAGE_INIT = "__init__.py"
+ABI_MODULE_PREFIX = "abi_"
+ABI_DIGEST_SIZE = 12
+ABI_MODULE_PATTERN = re.compile(
+    rf"{ABI_MODULE_PREFIX}[0-9a-f]{{{ABI_DIGEST_SIZE}}}\.py"
+)
+
+
+@dataclass(frozen=True)
+class PackageModule:
+    """
+    The module of one distinct ABI in a generated package, shared by every contract with that ABI.
+    Its class is named after the first contract by class name, the others are aliases of it.
+    """
+
+    name: str
+    # the first job with this ABI, which the module is generated from
+    source: BatchJob
+    jobs: tuple[BatchJob, ...]
+
+    @property
+    def class_name(self) -> str:
+        return self.jobs[0].contract_class_name
+
+
+def abi_digest(abi_content: str) -> str:
+    """
+    Hash of the canonical ABI, so ABIs differing only in formatting or key order share a module.
+    """
+    return hashlib.sha256(normalize_abi(abi_content).encode()).hexdigest()[
+        :ABI_DIGEST_SIZE
+    ]
+
+
+def group_jobs(
+    jobs: Sequence[BatchJob],
+    member_filter: MemberFilter | None = None,
+) -> tuple[list[PackageModule], dict[int, BatchResult]]:
+    """
+    Group jobs by their canonical ABI, after dropping the members not selected by `member_filter`.
+    Returns the package modules in name order,
+    and the results of the jobs that can't be part of the package by their index in `jobs`.
+    """
+    groups: dict[str, tuple[BatchJob, list[BatchJob]]] = {}
+    failures = {}
+    class_names: set[str] = set()
+    for i, job in enumerate(jobs):
+        if job.contract_class_name in class_names:
+            failures[i] = BatchResult(
+                job=job, error=f"Duplicate class name {job.contract_class_name}"
+            )
+            continue
+        try:
+            abi_content = read_job_abi(job)
+            if member_filter:
+                abi_content = member_filter.apply(abi_content)
+            name = f"{ABI_MODULE_PREFIX}{abi_digest(abi_content)}"
+        except OSError as e:
+            failures[i] = BatchResult(job=job, error=str(e))
+            continue
+        except ValueError as e:
+            failures[i] = BatchResult(job=job, error=f"Invalid JSON in ABI: {e}")
+            continue
+        except ABIParserError as e:
+            failures[i] = BatchResult(job=job, error=str(e))
+            continue
+        class_names.add(job.contract_class_name)
+        groups.setdefault(name, (job, []))[1].append(job)
+    modules = [
+        PackageModule(
+            name=name,
+            source=source,
+            jobs=tuple(sorted(group, key=lambda j: j.contract_class_name)),
+        )
+        for name, (source, group) in sorted(groups.items())
+    ]
+    return modules, failures
+
+
+INIT_GETATTR = """
+
+def __getattr__(name: str) -> Any:
+    # import the module of a contract on first access, see PEP 562
+    try:
+        module_name, class_name = _CONTRACTS[name]
+    except KeyError:
+        message = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(message) from None
+    cls = getattr(import_module(f".{module_name}", __name__), class_name)
+    globals()[name] = cls
+    return cls
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_CONTRACTS})
+"""
+
+
+def render_init(modules: Sequence[PackageModule]) -> str:
+    """
+    The package `__init__.py`: every contract class, as an alias of the class of its ABI module.
+    Modules are imported lazily with a module `__getattr__`,
+    so importing one contract doesn't import the others.
+    Static type checkers see the imports in the `TYPE_CHECKING` block instead.
+    """
+    imports = []
+    contracts = []
+    for module in modules:
+        for job in module.jobs:
+            name = job.contract_class_name
+            imports.append(
+                f"    from .{module.name} import {module.class_name} as {name}"
+            )
+            contracts.append(
+                f"    {json.dumps(name)}: ({json.dumps(module.name)}, {json.dumps(module.class_name)}),"
+            )
+    lines = [
+        "# Autogenerated file.",
+        "from importlib import import_module",
+        "from typing import TYPE_CHECKING, Any",
+        "",
+    ]
+    if imports:
+        lines += ["if TYPE_CHECKING:", *imports, ""]
+    lines += [
+        *(["_CONTRACTS = {", *contracts, "}"] if contracts else ["_CONTRACTS = {}"]),
+        "",
+        "__all__ = sorted(_CONTRACTS)",
+    ]
+    return "\n".join(lines) + "\n" + INIT_GETATTR
+
+
+def _write_if_changed(path: Path, content: str) -> bool:
+    try:
+        if path.read_text() == content:
+            return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(content)
+    os.replace(tmp_path, path)
+    return True
+
+
+def generate_package(
+    jobs: list[BatchJob],
+    package_dir: Path,
+    options: GenerateOptions = DEFAULT_OPTIONS,
+    max_workers: int | None = None,
+) -> list[BatchResult]:
+    """
+    Generate a package with one module per distinct ABI, and every contract class in `__init__.py`.
+    Contracts sharing an ABI share its module and class, the contract names are aliases of that class,
+    so the package size, import time and memory grow with the number of distinct ABIs.
+    Modules are imported on first access, see `render_init`.
+    The `out_file` of the jobs is ignored. ABI modules no longer used by any contract are removed.
+    `options` must have a single target.
+    Results are returned in the same order as `jobs`, see `generate_batch`.
+    """
+    if len(options.target_libs) != 1:
+        raise ValueError("A package is generated for a single target")
+    modules, failures = group_jobs(jobs, options.member_filter)
+    module_jobs = [
+        BatchJob(
+            abi_path=module.source.abi_path,
+            out_file=package_dir / f"{module.name}.py",
+            contract_class_name=module.class_name,
+            abi_span=module.source.abi_span,
+        )
+        for module in modules
+    ]
+    module_results = generate_batch(module_jobs, options, max_workers)
+
+    # class names are unique within the package, so they identify the grouped jobs
+    results = {}
+    generated_modules = []
+    for module, module_result in zip(modules, module_results):
+        if module_result.ok:
+            generated_modules.append(module)
+        for i, job in enumerate(module.jobs):
+            results[job.contract_class_name] = BatchResult(
+                job=job,
+                error=module_result.error,
+                cached=module_result.cached,
+                # the module is generated once for its contracts
+                profile=module_result.profile if i == 0 else None,
+            )
+
+    package_dir.mkdir(parents=True, exist_ok=True)
+    init_file = package_dir / PACKAGE_INIT
+    changed = _write_if_changed(init_file, render_init(generated_modules))
+    if options.bytecode and (changed or not bytecode_path(init_file).exists()):
+        write_bytecode(init_file, options.bytecode)
+    used = {f"{module.name}.py" for module in modules}
+    for path in package_dir.iterdir():
+        if ABI_MODULE_PATTERN.fullmatch(path.name) and path.name not in used:
+            path.unlink()
+            bytecode_path(path).unlink(missing_ok=True)
+            sidecar_path(path).unlink(missing_ok=True)
+            stub_path(path).unlink(missing_ok=True)
+    return [
+        failures[i] if i in failures else results[job.contract_class_name]
+        for i, job in enumerate(jobs)
+    ]
@@ -0,0 +1,203 @@
+import json
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Any, ParamSpec, TypeVar
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# digits of the times reported, in seconds
+TIME_DIGITS = 6
+
+_NOT_PROFILED = nullcontext()
+_current: ContextVar["Profiler | None"] = ContextVar("profiler", default=None)
+
+
+@dataclass
+class StageStats:
+    # seconds
+    wall_time: float = 0.0
+    # bytes allocated on top of the memory in use when the stage started, at their highest
+    peak_memory: int | None = None
+    calls: int = 0
+
+
+class Profiler:
+    """
+    Wall time and peak memory of the stages of code generation, see `profile_stage`.
+    The figures of a stage exclude the stages nested in it, so stages never overlap.
+    With `trace_memory`, memory is traced with `tracemalloc`, which slows down allocations several times,
+    imports and formatting the most, so times are only accurate without it.
+    """
+
+    def __init__(self, trace_memory: bool = True) -> None:
+        self.trace_memory = trace_memory
+        self.stages: dict[str, StageStats] = {}
+        self.wall_time = 0.0
+        self.peak_memory: int | None = 0 if trace_memory else None
+        self._stack: list[StageStats] = []
+        self._token: Any = None
+        self._tracing = False
+        self._start_time = 0.0
+        self._base_memory = 0
+        self._interval_start = 0.0
+        self._interval_memory = 0
+
+    def start(self) -> "Profiler":
+        """
+        Profile the stages run from now on in this context, until `stop`.
+        """
+        self._tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if self._tracing:
+            tracemalloc.start()
+        self._token = _current.set(self)
+        if self.trace_memory:
+            self._base_memory, _ = tracemalloc.get_traced_memory()
+            self._interval_memory = self._base_memory
+            tracemalloc.reset_peak()
+        self._start_time = self._interval_start = time.perf_counter()
+        return self
+
+    def stop(self) -> None:
+        self._switch()
+        self.wall_time = self._interval_start - self._start_time
+        _current.reset(self._token)
+        if self._tracing:
+            tracemalloc.stop()
+
+    def _switch(self) -> None:
+        # end the running interval of the innermost stage and start the next one,
+        # leaving the time spent tracing memory out of both
+        end = time.perf_counter()
+        stats = self._stack[-1] if self._stack else None
+        if stats is not None:
+            stats.wall_time += end - self._interval_start
+        if self.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if stats is not None:
+                stats.peak_memory = max(
+                    stats.peak_memory or 0, peak - self._interval_memory
+                )
+            self.peak_memory = max(self.peak_memory or 0, peak - self._base_memory)
+            tracemalloc.reset_peak()
+            self._interval_memory = current
+        self._interval_start = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        stats = self.stages.setdefault(name, StageStats())
+        self._switch()
+        stats.calls += 1
+        self._stack.append(stats)
+        try:
+            yield
+        finally:
+            self._switch()
+            self._stack.pop()
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "wall_time": round(self.wall_time, TIME_DIGITS),
+            "peak_memory": self.peak_memory,
+            "stages": {
+                name: {
+                    **asdict(stats),
+                    "wall_time": round(stats.wall_time, TIME_DIGITS),
+                }
+                for name, stats in self.stages.items()
+            },
+        }
+
+
+def profile_stage(name: str) -> AbstractContextManager[None]:
+    """
+    Account the code run in this context to stage `name` of the running `Profiler`, if any.
+    """
+    profiler = _current.get()
+    return _NOT_PROFILED if profiler is None else profiler.stage(name)
+
+
+def profiled(function: Callable[P, R], name: str) -> Callable[P, R]:
+    """
+    `function`, with its calls accounted to stage `name` of the running `Profiler`, if any.
+    """
+    profiler = _current.get()
+    if profiler is None:
+        return function
+
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        with profiler.stage(name):
+            return function(*args, **kwargs)
+
+    return wrapper
+
+
+def abi_stats(abi_content: str) -> dict[str, int]:
+    """
+    Size of an ABI: its length in bytes, its number of entries of each type and of parameters.
+    """
+    stats = {"bytes": len(abi_content.encode())}
+    try:
+        content = json.loads(abi_content)
+    except ValueError:
+        return stats
+    if not isinstance(content, list):
+        return stats
+    stats["entries"] = len(content)
+    parameters = 0
+    for item in content:
+        if not isinstance(item, dict):
+            continue
+        key = f"{item.get('type')}s"
+        stats[key] = stats.get(key, 0) + 1
+        parameters += len(item.get("inputs") or ()) + len(item.get("outputs") or ())
+    stats["parameters"] = parameters
+    return stats
+
+
+def profile_report(profiler: Profiler, abi_content: str | None) -> dict[str, Any]:
+    report = profiler.report()
+    if abi_content is not None:
+        report["abi"] = abi_stats(abi_content)
+    return report
+
+
+def _max_memory(a: int | None, b: int | None) -> int | None:
+    # memory isn't traced in every report
+    if a is None or b is None:
+        return b if a is None else a
+    return max(a, b)
+
+
+def merge_reports(reports: Iterable[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Totals of the reports of several generations: times, calls and ABI stats add up, peak memory is the highest.
+    """
+    stages: dict[str, dict[str, Any]] = {}
+    abi: dict[str, int] = {}
+    wall_time = 0.0
+    peak_memory = None
+    for report in reports:
+        wall_time += report["wall_time"]
+        peak_memory = _max_memory(peak_memory, report["peak_memory"])
+        for name, stats in report["stages"].items():
+            total = stages.setdefault(name, asdict(StageStats()))
+            total["wall_time"] += stats["wall_time"]
+            total["peak_memory"] = _max_memory(
+                total["peak_memory"], stats["peak_memory"]
+            )
+            total["calls"] += stats["calls"]
+        for key, value in report.get("abi", {}).items():
+            abi[key] = abi.get(key, 0) + value
+    for total in stages.values():
+        total["wall_time"] = round(total["wall_time"], TIME_DIGITS)
+    return {
+        "wall_time": round(wall_time, TIME_DIGITS),
+        "peak_memory": peak_memory,
+        "stages": stages,
+        "abi": abi,
+    }
@@ -0,0 +1,140 @@
+import ast
+import json
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from eth_utils import keccak
+
+from py_contract_codegen.modules.exceptions import (
+    InvalidABIStructureError,
+    InvalidJSONError,
+)
+
+# only these ABI entries become methods, the others are always kept
+PRUNED_TYPES = ("function", "event")
+EVENT_METHOD_PREFIX = "get_event_"
+GENERATED_FILE_HEADER = "# Autogenerated file."
+
+
+def _canonical_type(param: dict[str, Any]) -> str:
+    abi_type = param["type"]
+    if abi_type.startswith("tuple"):
+        components = ",".join(_canonical_type(c) for c in param.get("components", []))
+        return f"({components}){abi_type[len('tuple') :]}"
+    return abi_type
+
+
+def member_signature(entry: dict[str, Any]) -> str:
+    """
+    e.g. `transfer(address,uint256)`
+    """
+    types = ",".join(_canonical_type(p) for p in entry.get("inputs", []))
+    return f"{entry['name']}({types})"
+
+
+def member_selector(entry: dict[str, Any]) -> str:
+    """
+    4-byte selector of a function, or topic of an event, as `0x`-prefixed hex.
+    """
+    digest = keccak(text=member_signature(entry))
+    if entry["type"] == "function":
+        digest = digest[:4]
+    return "0x" + digest.hex()
+
+
+def method_name(entry: dict[str, Any]) -> str:
+    """
+    Name of the generated method of a function or event.
+    """
+    if entry["type"] == "event":
+        return f"{EVENT_METHOD_PREFIX}{entry['name']}"
+    return entry["name"]
+
+
+def _iter_python_files(paths: Iterable[Path]) -> Iterator[Path]:
+    for path in paths:
+        if path.is_dir():
+            yield from sorted(path.rglob("*.py"))
+        else:
+            yield path
+
+
+def collect_used_names(paths: Iterable[Path]) -> frozenset[str]:
+    """
+    Every attribute name accessed in the Python files under `paths`, e.g. `balanceOf` in `token.balanceOf(owner)`.
+    Generated modules are skipped, since they define every member.
+    """
+    names = set()
+    for path in _iter_python_files(paths):
+        source = path.read_text()
+        if source.startswith(GENERATED_FILE_HEADER):
+            continue
+        for node in ast.walk(ast.parse(source, filename=str(path))):
+            if isinstance(node, ast.Attribute):
+                names.add(node.attr)
+    return frozenset(names)
+
+
+@dataclass(frozen=True)
+class MemberFilter:
+    """
+    Select the functions and events to generate, by name, signature (`transfer(address,uint256)`)
+    or selector (`0xa9059cbb`, or the topic of an event).
+    Members matching `include` or used in code (see `collect_used_names`) are kept,
+    or every member when neither is set, then members matching `exclude` are dropped.
+    Other ABI entries, e.g. the constructor and errors, are always kept.
+    """
+
+    include: tuple[str, ...] = ()
+    exclude: tuple[str, ...] = ()
+    used_names: frozenset[str] | None = None
+
+    def __bool__(self) -> bool:
+        return bool(self.include or self.exclude or self.used_names is not None)
+
+    @staticmethod
+    def _matches(entry: dict[str, Any], patterns: tuple[str, ...]) -> bool:
+        if not patterns:
+            return False
+        if entry["name"] in patterns:
+            return True
+        signature = member_signature(entry)
+        if signature in patterns:
+            return True
+        selectors = [p.lower() for p in patterns if p.startswith("0x")]
+        return bool(selectors) and member_selector(entry) in selectors
+
+    def keeps(self, entry: dict[str, Any]) -> bool:
+        if entry.get("type") not in PRUNED_TYPES:
+            return True
+        if self.include or self.used_names is not None:
+            used = self.used_names is not None and method_name(entry) in self.used_names
+            if not used and not self._matches(entry, self.include):
+                return False
+        return not self._matches(entry, self.exclude)
+
+    def apply(self, abi_content: str) -> str:
+        """
+        `abi_content` without the dropped members, unchanged when nothing is dropped.
+        """
+        try:
+            abi = json.loads(abi_content)
+        except json.JSONDecodeError as e:
+            raise InvalidJSONError(f"Invalid JSON in content: {e}")
+        if not isinstance(abi, list):
+            return abi_content
+        try:
+            kept = [
+                entry
+                for entry in abi
+                if not isinstance(entry, dict)
+                or "name" not in entry
+                or self.keeps(entry)
+            ]
+        except (KeyError, TypeError) as e:
+            raise InvalidABIStructureError(f"Invalid ABI member: {e}")
+        if len(kept) == len(abi):
+            return abi_content
+        return json.dumps(kept)
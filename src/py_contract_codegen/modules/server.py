@@ -0,0 +1,133 @@
+import json
+import os
+import socketserver
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from py_contract_codegen.modules.client import is_daemon_running
+from py_contract_codegen.modules.code_generator import (
+    DEFAULT_CONTRACT_CLASS_NAME,
+    ContractCodeGenerator,
+    generate_targets,
+)
+from py_contract_codegen.modules.enums import (
+    ABIEmbedding,
+    Backend,
+    Bytecode,
+    TargetLib,
+)
+from py_contract_codegen.modules.exceptions import DaemonError
+from py_contract_codegen.modules.options import GenerateOptions
+from py_contract_codegen.modules.templates import TEMPLATE_PATH, get_template
+
+
+def handle_request(request: dict[str, Any]) -> dict[str, Any]:
+    """
+    Generate code for one request.
+    Request: `{"abi": ..., "class_name": ..., "target_lib": ..., "backend": ..., "format": ..., "out_file": ..., "cache_dir": ..., "bytecode": ..., "abi_embedding": ..., "stub": ..., "runtime": ...}`,
+    where only `abi` is required. `abi` is the ABI JSON, either as a string or embedded as is.
+    Response: `{"ok": true, "code": ...}` without `out_file`,
+    `{"ok": true, "generated": ...}` with `out_file`, or `{"ok": false, "error": ...}`.
+    The request `id`, if any, is copied to the response.
+    """
+    response = _handle_request(request)
+    if isinstance(request, dict) and "id" in request:
+        response["id"] = request["id"]
+    return response
+
+
+def handle_line(line: str | bytes) -> dict[str, Any] | None:
+    """
+    Handle one line of newline-delimited JSON requests. Returns None for a blank line.
+    """
+    if not line.strip():
+        return None
+    try:
+        request = json.loads(line)
+    except json.JSONDecodeError as e:
+        return {"ok": False, "error": f"Invalid JSON in request: {e}"}
+    return handle_request(request)
+
+
+def _request_options(request: dict[str, Any]) -> GenerateOptions:
+    cache_dir = request.get("cache_dir")
+    return GenerateOptions(
+        target_libs=(TargetLib(request.get("target_lib", TargetLib.web3_v7.value)),),
+        backend=Backend(request.get("backend", Backend.jinja.value)),
+        format_output=bool(request.get("format", False)),
+        bytecode=Bytecode(request["bytecode"]) if request.get("bytecode") else None,
+        abi_embedding=ABIEmbedding(
+            request.get("abi_embedding", ABIEmbedding.literal.value)
+        ),
+        stub=bool(request.get("stub", False)),
+        runtime=bool(request.get("runtime", False)),
+        cache_dir=Path(cache_dir) if cache_dir else None,
+    )
+
+
+def _handle_request(request: dict[str, Any]) -> dict[str, Any]:
+    try:
+        abi = request["abi"]
+        abi_content = abi if isinstance(abi, str) else json.dumps(abi)
+        class_name = request.get("class_name") or DEFAULT_CONTRACT_CLASS_NAME
+        options = _request_options(request)
+        if request.get("out_file"):
+            generated = generate_targets(
+                abi_content, class_name, Path(request["out_file"]), options
+            )
+            return {"ok": True, "generated": generated}
+        generator = ContractCodeGenerator.from_options(
+            abi_content, class_name, options.target_libs[0], options
+        )
+        return {"ok": True, "code": generator.generate()}
+    except Exception as e:
+        return {"ok": False, "error": str(e)}
+
+
+class CodegenRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Newline-delimited JSON: one response line per request line.
+    """
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            response = handle_line(line)
+            if response is None:
+                continue
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+class CodegenServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+def create_server(socket_path: Path) -> CodegenServer:
+    """
+    Bind the codegen server to `socket_path` with every template loaded up front.
+    A leftover socket file from a previous run is replaced.
+    The socket, and its directory when it doesn't exist, are only accessible to the current user.
+    """
+    if is_daemon_running(socket_path):
+        raise DaemonError(f"Codegen daemon is already running on {socket_path}")
+    for target_lib in TargetLib:
+        get_template(TEMPLATE_PATH, target_lib)
+    socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    socket_path.unlink(missing_ok=True)
+    # the socket is created without permissions for other users, so none can connect in the meantime
+    old_umask = os.umask(0o077)
+    try:
+        return CodegenServer(str(socket_path), CodegenRequestHandler)
+    finally:
+        os.umask(old_umask)
+
+
+def serve(socket_path: Path, on_ready: Callable[[], None] | None = None) -> None:
+    with create_server(socket_path) as server:
+        if on_ready is not None:
+            on_ready()
+        try:
+            server.serve_forever()
+        finally:
+            socket_path.unlink(missing_ok=True)
@@ -0,0 +1,32 @@
+import json
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TextIO
+
+from py_contract_codegen.modules.server import handle_line
+
+
+@dataclass
+class StreamSummary:
+    requests: int = 0
+    failures: int = 0
+
+
+def process_stream(lines: Iterable[str], out: TextIO) -> StreamSummary:
+    """
+    Generate code for a stream of newline-delimited JSON requests, writing one response line per request.
+    Requests and responses are those of the codegen daemon, see `handle_request`.
+    Each response is flushed before the next line is read, so only one contract is held in memory at a time
+    and a consumer can pipe results onwards as they come.
+    """
+    summary = StreamSummary()
+    for line in lines:
+        response = handle_line(line)
+        if response is None:
+            continue
+        summary.requests += 1
+        if not response["ok"]:
+            summary.failures += 1
+        out.write(json.dumps(response) + "\n")
+        out.flush()
+    return summary
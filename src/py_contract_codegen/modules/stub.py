@@ -0,0 +1,231 @@
+import ast
+import json
+import os
+from pathlib import Path
+
+STUB_SUFFIX = ".pyi"
+METHODS_NAME = "METHODS"
+# types of the module attributes and instance attributes the stub can't take from an annotation
+ATTRIBUTE_TYPES = {
+    "ABI": "list[dict[str, Any]]",
+    "ABI_JSON": "str",
+    "ABI_FILE": "Path",
+    "contract": "Contract",
+}
+STUB_IMPORTS = "from web3.contract import Contract\n"
+
+CLASS_GETATTR = f"""
+    def __getattr__(self, name: str) -> Any:
+        # compile a method on first access and keep it on the class, its signature is in the `.pyi` stub
+        try:
+            source = {METHODS_NAME}[name]
+        except KeyError:
+            message = f"{{type(self).__name__!r}} object has no attribute {{name!r}}"
+            raise AttributeError(message) from None
+        namespace: dict[str, Any] = {{}}
+        exec(source, globals(), namespace)
+        method = namespace[name]
+        method.__qualname__ = f"{{type(self).__qualname__}}.{{name}}"
+        setattr(type(self), name, method)
+        return getattr(self, name)
+
+    def __dir__(self) -> list[str]:
+        return sorted({{*super().__dir__(), *{METHODS_NAME}}})
+"""
+
+
+def stub_path(out_file: Path) -> Path:
+    """
+    Type stub of a module generated with `stub`.
+    e.g. `token.py` -> `token.pyi`
+    """
+    return out_file.with_suffix(STUB_SUFFIX)
+
+
+def _string_literal(value: str) -> str:
+    # double quoted like the formatter, unless that needs escaping
+    return json.dumps(value) if '"' not in value else repr(value)
+
+
+def _find_class(module: ast.Module, class_name: str | None) -> ast.ClassDef:
+    classes = [node for node in module.body if isinstance(node, ast.ClassDef)]
+    for node in classes:
+        if node.name == class_name:
+            return node
+    if len(classes) == 1:
+        return classes[0]
+    raise ValueError(f"Generated module has no class {class_name}")
+
+
+def _first_line(node: ast.FunctionDef | ast.ClassDef) -> int:
+    # 0-based index of the first line of `node`, including its decorators
+    return min([node.lineno, *(d.lineno for d in node.decorator_list)]) - 1
+
+
+def _signature(lines: list[str], node: ast.FunctionDef) -> str:
+    """
+    The decorators and `def` lines of `node` as generated, with `...` as the body.
+    """
+    signature = "".join(lines[_first_line(node) : node.body[0].lineno - 1])
+    return signature.rstrip() + " ...\n"
+
+
+def _methods(class_node: ast.ClassDef) -> list[ast.FunctionDef]:
+    return [
+        node
+        for node in class_node.body
+        if isinstance(node, ast.FunctionDef) and node.name != "__init__"
+    ]
+
+
+def render_runtime(source: str, class_name: str | None) -> str:
+    """
+    The generated module `source` with the methods of the contract class, apart from `__init__`,
+    moved to a table of their source, compiled on first access by the class `__getattr__`.
+    Importing it only creates the class and its `__init__`, whatever the number of methods.
+    """
+    module = ast.parse(source)
+    class_node = _find_class(module, class_name)
+    lines = source.splitlines(keepends=True)
+    methods = _methods(class_node)
+    skipped: set[int] = set()
+    entries = []
+    for node in methods:
+        assert node.end_lineno is not None
+        skipped.update(range(_first_line(node), node.end_lineno))
+        method_source = "".join(
+            line[4:] if line.startswith("    ") else line
+            for line in lines[_first_line(node) : node.end_lineno]
+        )
+        entries.append(
+            f"    {json.dumps(node.name)}: {_string_literal(method_source)},\n"
+        )
+    assert class_node.end_lineno is not None
+    class_start = _first_line(class_node)
+    class_source = "".join(
+        line
+        for i, line in enumerate(
+            lines[class_start : class_node.end_lineno], class_start
+        )
+        if i not in skipped
+    )
+    table = (
+        f"{METHODS_NAME} = {{\n{''.join(entries)}}}"
+        if entries
+        else f"{METHODS_NAME} = {{}}"
+    )
+    return (
+        "".join(lines[:class_start]).rstrip("\n")
+        + "\n\n\n# source of the contract methods, see `__getattr__`\n"
+        + table
+        + "\n\n\n"
+        + class_source.rstrip("\n")
+        + "\n"
+        + CLASS_GETATTR
+        + "".join(lines[class_node.end_lineno :])
+    )
+
+
+def _annotation(name: str) -> str:
+    return ATTRIBUTE_TYPES.get(name, "Any")
+
+
+def _init_attributes(source: str, init: ast.FunctionDef) -> list[str]:
+    """
+    Annotations of the attributes set by `__init__`, typed like the argument they're set to.
+    """
+    arguments = {
+        arg.arg: ast.get_source_segment(source, arg.annotation)
+        for arg in init.args.args
+        if arg.annotation is not None
+    }
+    attributes = []
+    for node in init.body:
+        if not isinstance(node, ast.Assign) or len(node.targets) != 1:
+            continue
+        target = node.targets[0]
+        if not (
+            isinstance(target, ast.Attribute)
+            and isinstance(target.value, ast.Name)
+            and target.value.id == "self"
+        ):
+            continue
+        annotation = None
+        if isinstance(node.value, ast.Name):
+            annotation = arguments.get(node.value.id)
+        attributes.append(
+            f"    {target.attr}: {annotation or _annotation(target.attr)}\n"
+        )
+    return attributes
+
+
+def render_stub(source: str, class_name: str | None) -> str:
+    """
+    The `.pyi` stub of the generated module `source`: its imports, the types of its module attributes,
+    and the signatures of its functions and of the contract class methods, as generated.
+    The lazily decoded `ABI` of a module generated with an `ABIEmbedding` other than `literal` is declared too.
+    """
+    module = ast.parse(source)
+    class_node = _find_class(module, class_name)
+    lines = source.splitlines(keepends=True)
+    imports = [
+        node for node in module.body if isinstance(node, (ast.Import, ast.ImportFrom))
+    ]
+    parts = []
+    declares_abi = False
+    position = 0
+    for node in module.body:
+        start = (
+            _first_line(node)
+            if isinstance(node, (ast.FunctionDef, ast.ClassDef))
+            else node.lineno - 1
+        )
+        parts.append("".join(lines[position:start]))
+        assert node.end_lineno is not None
+        position = node.end_lineno
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            parts.append("".join(lines[start:position]))
+            if node is imports[-1]:
+                parts.append(STUB_IMPORTS)
+        elif isinstance(node, ast.Assign) and all(
+            isinstance(target, ast.Name) for target in node.targets
+        ):
+            for target in node.targets:
+                assert isinstance(target, ast.Name)
+                declares_abi = declares_abi or target.id == "ABI"
+                parts.append(f"{target.id}: {_annotation(target.id)}\n")
+        elif isinstance(node, ast.FunctionDef) and node.name == "__getattr__":
+            # the lazy `ABI` of the module, a stub declares it instead
+            if not declares_abi:
+                declares_abi = True
+                parts.append(f"ABI: {_annotation('ABI')}\n")
+        elif isinstance(node, ast.FunctionDef):
+            parts.append(_signature(lines, node))
+        elif node is class_node:
+            parts.append("".join(lines[start : class_node.body[0].lineno - 1]))
+            attributes = []
+            members = []
+            for member in class_node.body:
+                if isinstance(member, ast.FunctionDef):
+                    if member.name == "__init__":
+                        attributes = _init_attributes(source, member)
+                    members.append(_signature(lines, member))
+            parts.append("".join(attributes))
+            if attributes and members:
+                parts.append("\n")
+            parts.append("\n".join(members) if members else "    ...\n")
+        else:
+            parts.append("".join(lines[start:position]))
+    parts.append("".join(lines[position:]))
+    return "".join(parts)
+
+
+def write_stub(out_file: Path, content: str) -> Path:
+    path = stub_path(out_file)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(content)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return path
@@ -0,0 +1,95 @@
+import hashlib
+import json
+from functools import cache
+from pathlib import Path
+
+import jinja2
+from jinja2 import ChoiceLoader, Environment, FileSystemLoader, ModuleLoader, Template
+from jinja2.bccache import bc_version
+
+from py_contract_codegen.modules.constants import TEMPLATE_PATH
+from py_contract_codegen.modules.enums import TargetLib
+
+COMPILED_TEMPLATE_PATH = TEMPLATE_PATH / "compiled"
+COMPILED_CHECKSUMS_FILE = COMPILED_TEMPLATE_PATH / "checksums.json"
+
+
+def get_template_name(target_lib: TargetLib) -> str:
+    return f"contract.{target_lib.value}.jinja2"
+
+
+def template_checksums(template_path: Path = TEMPLATE_PATH) -> dict[str, str]:
+    return {
+        path.name: hashlib.sha256(path.read_bytes()).hexdigest()
+        for path in sorted(template_path.glob("*.jinja2"))
+    }
+
+
+def jinja_feature_release() -> str:
+    major, minor = jinja2.__version__.split(".")[:2]
+    return f"{major}.{minor}"
+
+
+def compiled_metadata(template_path: Path = TEMPLATE_PATH) -> dict[str, object]:
+    """
+    What precompiled modules depend on: the template sources, and the Jinja feature release and bytecode version
+    that compiled them, since compiled modules call into Jinja's runtime.
+    Patch releases don't change either, so modules compiled by any of them are used.
+    """
+    return {
+        "jinja2": jinja_feature_release(),
+        "bytecode": bc_version,
+        "templates": template_checksums(template_path),
+    }
+
+
+def compile_templates(
+    template_path: Path = TEMPLATE_PATH, target: Path = COMPILED_TEMPLATE_PATH
+) -> None:
+    """
+    Precompile templates into Python modules loadable by `ModuleLoader`.
+    The checksums of the sources and the Jinja release are recorded so stale modules are never used.
+    """
+    env = Environment(loader=FileSystemLoader(template_path))
+    target.mkdir(parents=True, exist_ok=True)
+    for path in target.glob("tmpl_*.py"):
+        path.unlink()
+    env.compile_templates(
+        target, zip=None, filter_func=lambda name: name.endswith(".jinja2")
+    )
+    (target / COMPILED_CHECKSUMS_FILE.name).write_text(
+        json.dumps(compiled_metadata(template_path), indent=2, sort_keys=True) + "\n"
+    )
+
+
+def _compiled_templates_are_fresh() -> bool:
+    try:
+        metadata = json.loads(COMPILED_CHECKSUMS_FILE.read_text())
+    except (OSError, ValueError):
+        return False
+    return metadata == compiled_metadata()
+
+
+@cache
+def get_environment(template_path: Path) -> Environment:
+    """
+    Process-wide Jinja environment for `template_path`.
+    The bundled templates are loaded from their precompiled modules when those are up to date
+    and were compiled by the installed Jinja feature release, else from their sources.
+    """
+    loader: FileSystemLoader | ChoiceLoader = FileSystemLoader(template_path)
+    if template_path.resolve() == TEMPLATE_PATH and _compiled_templates_are_fresh():
+        loader = ChoiceLoader([ModuleLoader(COMPILED_TEMPLATE_PATH), loader])
+    return Environment(loader=loader)
+
+
+@cache
+def get_template(template_path: Path, target_lib: TargetLib) -> Template:
+    """
+    Process-wide template registry, so each template is compiled at most once per process.
+    """
+    return get_environment(template_path).get_template(get_template_name(target_lib))
+
+
+if __name__ == "__main__":
+    compile_templates()
@@ -0,0 +1,121 @@
+import hashlib
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from py_contract_codegen.modules.batch import BatchJob, BatchResult
+from py_contract_codegen.modules.code_generator import generate_targets
+from py_contract_codegen.modules.exceptions import BatchManifestError
+from py_contract_codegen.modules.options import DEFAULT_OPTIONS, GenerateOptions
+
+DEFAULT_POLL_INTERVAL = 0.2
+DEFAULT_DEBOUNCE = 0.1
+
+
+@dataclass
+class Watcher:
+    """
+    Regenerate outputs when their ABI files change.
+    Files are polled with `stat`, and a file is regenerated once it has been quiet for `debounce` seconds,
+    so a burst of writes triggers one generation.
+    Outputs are only regenerated when the ABI content actually changed.
+    """
+
+    collect_jobs: Callable[[], list[BatchJob]]
+    options: GenerateOptions = DEFAULT_OPTIONS
+    interval: float = DEFAULT_POLL_INTERVAL
+    debounce: float = DEFAULT_DEBOUNCE
+    _stats: dict[Path, tuple[int, int]] = field(default_factory=dict, init=False)
+    _digests: dict[Path, str] = field(default_factory=dict, init=False)
+    _pending: dict[Path, float] = field(default_factory=dict, init=False)
+
+    def prime(self) -> None:
+        """
+        Treat the current ABI files as already generated.
+        """
+        for job in self.collect_jobs():
+            try:
+                stat = job.abi_path.stat()
+                abi_content = job.abi_path.read_bytes()
+            except OSError:
+                continue
+            self._stats[job.abi_path] = (stat.st_mtime_ns, stat.st_size)
+            self._digests[job.abi_path] = hashlib.sha256(abi_content).hexdigest()
+
+    def poll(self, now: float | None = None) -> list[BatchResult]:
+        """
+        Check every ABI file once and regenerate the settled changes.
+        """
+        if now is None:
+            now = time.monotonic()
+        try:
+            jobs = {job.abi_path: job for job in self.collect_jobs()}
+        except (OSError, BatchManifestError):
+            # the manifest or directory is being rewritten, retry on the next poll
+            return []
+
+        for abi_path in list(self._stats):
+            if abi_path not in jobs:
+                self._forget(abi_path)
+        for abi_path in jobs:
+            try:
+                stat = abi_path.stat()
+            except OSError:
+                self._forget(abi_path)
+                continue
+            stat_key = (stat.st_mtime_ns, stat.st_size)
+            if self._stats.get(abi_path) != stat_key:
+                self._stats[abi_path] = stat_key
+                self._pending[abi_path] = now
+
+        results = []
+        for abi_path, changed_at in list(self._pending.items()):
+            if now - changed_at < self.debounce:
+                continue
+            del self._pending[abi_path]
+            result = self._regenerate(jobs[abi_path])
+            if result is not None:
+                results.append(result)
+        return results
+
+    def run(
+        self,
+        on_result: Callable[[BatchResult], None],
+        stop: threading.Event | None = None,
+    ) -> None:
+        """
+        Poll until `stop` is set.
+        """
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            for result in self.poll():
+                on_result(result)
+            stop.wait(self.interval)
+
+    def _forget(self, abi_path: Path) -> None:
+        self._stats.pop(abi_path, None)
+        self._digests.pop(abi_path, None)
+        self._pending.pop(abi_path, None)
+
+    def _regenerate(self, job: BatchJob) -> BatchResult | None:
+        try:
+            abi_content = job.abi_path.read_bytes()
+        except OSError as e:
+            return BatchResult(job=job, error=str(e))
+        digest = hashlib.sha256(abi_content).hexdigest()
+        if self._digests.get(job.abi_path) == digest:
+            return None
+        try:
+            content = abi_content.decode()
+            if self.options.member_filter:
+                content = self.options.member_filter.apply(content)
+            generated = generate_targets(
+                content, job.contract_class_name, job.out_file, self.options
+            )
+        except Exception as e:
+            return BatchResult(job=job, error=str(e))
+        # only recorded once generated, so a failed generation is retried when the file is saved again
+        self._digests[job.abi_path] = digest
+        return BatchResult(job=job, cached=not generated)
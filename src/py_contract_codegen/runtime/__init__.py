@@ -0,0 +1,13 @@
+"""
+Runtime of the code generated with `--runtime`: contract construction, calls and events.
+Generated modules only declare their typed methods, so upgrading this package upgrades every one of them.
+"""
+
+from py_contract_codegen.runtime.contract import (
+    ContractBase,
+    build_contract,
+    clear_contract_cache,
+)
+from py_contract_codegen.runtime.events import get_logs
+
+__all__ = ["ContractBase", "build_contract", "clear_contract_cache", "get_logs"]
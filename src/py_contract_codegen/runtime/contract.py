@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from copy import copy
+from typing import TYPE_CHECKING, Any, cast
+
+from py_contract_codegen.runtime.events import get_logs
+
+if TYPE_CHECKING:
+    from web3 import Web3
+    from web3.contract import Contract
+    from web3.contract.contract import ContractFunction
+    from web3.types import ENS, Address, ChecksumAddress
+
+# attribute of a `Web3` instance holding its `ContractCache`
+CACHE_ATTRIBUTE = "_py_contract_codegen_contracts"
+# factories and contracts last used, kept per `Web3` instance, the least recently used is dropped first
+MAX_CACHED_CONTRACTS = 1024
+
+
+class ContractCache:
+    """
+    Contract factories and contracts created with one `Web3` instance, and kept on it.
+    A factory builds the functions and events of its ABI once, and a contract those bound to its address,
+    so both are reused instead of being built again for every instance of a generated class.
+    ABIs are compared by identity, which holds for the module-level ABI of generated code.
+    Both reference their `Web3`, which references the cache, so the cache is collected along with it.
+    """
+
+    def __init__(self) -> None:
+        self.factories: OrderedDict[tuple[int, Any], type[Contract]] = OrderedDict()
+        self.contracts: OrderedDict[tuple[int, Any], Contract] = OrderedDict()
+
+    def factory(self, web3: Web3, abi: Any) -> type[Contract]:
+        # a factory class set with `web3.eth.set_contract_factory` makes other factories
+        key = (id(abi), getattr(web3.eth, "_default_contract_factory", None))
+        factory = self.factories.get(key)
+        # the factory keeps its ABI, so the id isn't reused while it's cached
+        if factory is not None and factory.abi is abi:
+            self.factories.move_to_end(key)
+            return factory
+        factory = web3.eth.contract(abi=abi)
+        _put(self.factories, key, factory)
+        return factory
+
+    def contract(
+        self, web3: Web3, address: Address | ChecksumAddress | ENS, abi: Any
+    ) -> Contract:
+        factory = self.factory(web3, abi)
+        # a contract keeps its factory, so the id isn't reused while it's cached
+        key = (id(factory), address)
+        contract = self.contracts.get(key)
+        if contract is None:
+            # the contract normalizes the address itself, like `web3.eth.contract` passes it
+            contract = factory(cast("ChecksumAddress", address))
+            _put(self.contracts, key, contract)
+        else:
+            self.contracts.move_to_end(key)
+        return contract
+
+
+def _put(entries: OrderedDict[Any, Any], key: Any, value: Any) -> None:
+    entries[key] = value
+    if len(entries) > MAX_CACHED_CONTRACTS:
+        entries.popitem(last=False)
+
+
+def build_contract(
+    web3: Web3, address: Address | ChecksumAddress | ENS, abi: Any
+) -> Contract:
+    """
+    `web3.eth.contract(address=address, abi=abi)`, reusing the factory and contract built before
+    with the same `web3`, `abi` object and `address`.
+    The contract is shared by every caller, so it must not be modified.
+    """
+    cache = getattr(web3, CACHE_ATTRIBUTE, None)
+    if cache is None:
+        cache = ContractCache()
+        try:
+            setattr(web3, CACHE_ATTRIBUTE, cache)
+        except AttributeError:
+            # e.g. a `Web3` subclass with `__slots__`
+            return web3.eth.contract(address=address, abi=abi)
+    return cache.contract(web3, address, abi)
+
+
+def clear_contract_cache(web3: Web3) -> None:
+    """
+    Drop the contract factories and contracts cached for `web3`.
+    """
+    if getattr(web3, CACHE_ATTRIBUTE, None) is not None:
+        delattr(web3, CACHE_ATTRIBUTE)
+
+
+class ContractBase:
+    """
+    Base class of the contract classes generated with `--runtime`.
+    Construction, calls and events go through here, so generated modules only declare the typed methods.
+    Instances with the same `web3` and address reuse the contract built for them, see `build_contract`.
+    Each instance gets its own copy, so setting an attribute of its `contract` doesn't change the others'.
+    """
+
+    def __init__(
+        self,
+        contract_address: Address | ChecksumAddress | ENS,
+        web3: Web3,
+        abi: list[dict[str, Any]],
+    ) -> None:
+        self.contract_address = contract_address
+        self.web3 = web3
+        # a shallow copy, the functions and events built for the address are still shared
+        self.contract = copy(build_contract(web3, contract_address, abi))
+
+    def _call_function(self, name: str, *args: Any) -> Any:
+        return getattr(self.contract.functions, name)(*args).call()
+
+    def _build_function(self, name: str, *args: Any) -> ContractFunction:
+        return getattr(self.contract.functions, name)(*args)
+
+    def _get_event_logs(self, name: str, *args: Any) -> Any:
+        return get_logs(getattr(self.contract.events, name)(), *args)
@@ -0,0 +1,35 @@
+from collections.abc import Iterable
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from hexbytes import HexBytes
+    from web3.types import BlockIdentifier, EventData
+
+
+@cache
+def _block_keywords() -> tuple[str, str]:
+    # web3 v7 renamed the block range keywords of `get_logs`
+    from web3 import __version__
+
+    if int(__version__.split(".")[0]) < 7:
+        return "fromBlock", "toBlock"
+    return "from_block", "to_block"
+
+
+def get_logs(
+    event: Any,
+    argument_filters: dict[str, Any] | None = None,
+    from_block: "BlockIdentifier | None" = None,
+    to_block: "BlockIdentifier | None" = None,
+    block_hash: "HexBytes | None" = None,
+) -> "Iterable[EventData]":
+    """
+    The decoded logs of a contract event, e.g. `contract.events.Transfer()`, with the keywords of the installed web3.
+    """
+    from_keyword, to_keyword = _block_keywords()
+    return event.get_logs(
+        argument_filters=argument_filters,
+        block_hash=block_hash,
+        **{from_keyword: from_block, to_keyword: to_block},
+    )
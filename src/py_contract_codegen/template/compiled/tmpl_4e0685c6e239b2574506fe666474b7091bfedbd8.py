@@ -0,0 +1,363 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'contract.web3_v7.jinja2'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_formatted_content = resolve('formatted_content')
+    l_0_contract_class_name = resolve('contract_class_name')
+    l_0_abi_embedding = resolve('abi_embedding')
+    l_0_runtime = resolve('runtime')
+    l_0_functions = resolve('functions')
+    l_0_events = resolve('events')
+    l_0_render_header = l_0_render_function = l_0_render_event = missing
+    try:
+        t_1 = environment.filters['default']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'default' found.")
+    try:
+        t_2 = environment.filters['length']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No filter named 'length' found.")
+    try:
+        t_3 = environment.filters['safe']
+    except KeyError:
+        @internalcode
+        def t_3(*unused):
+            raise TemplateRuntimeError("No filter named 'safe' found.")
+    pass
+    def macro(l_1_formatted_content, l_1_contract_class_name, l_1_abi_embedding, l_1_runtime):
+        t_4 = []
+        if l_1_formatted_content is missing:
+            l_1_formatted_content = undefined("parameter 'formatted_content' was not provided", name='formatted_content')
+        if l_1_contract_class_name is missing:
+            l_1_contract_class_name = undefined("parameter 'contract_class_name' was not provided", name='contract_class_name')
+        if l_1_abi_embedding is missing:
+            l_1_abi_embedding = 'literal'
+        if l_1_runtime is missing:
+            l_1_runtime = False
+        pass
+        t_4.append(
+            '# Autogenerated file.\n',
+        )
+        if (l_1_abi_embedding != 'literal'):
+            pass
+            t_4.append(
+                'import json\nfrom functools import cache\n',
+            )
+        if (l_1_abi_embedding == 'sidecar'):
+            pass
+            t_4.append(
+                'from pathlib import Path\n',
+            )
+        t_4.append(
+            'from typing import Any, Iterable\nfrom hexbytes import HexBytes\nfrom web3 import Web3\nfrom web3.contract.contract import ContractFunction\nfrom web3.types import ENS, Address, BlockIdentifier, ChecksumAddress, EventData\n',
+        )
+        if l_1_runtime:
+            pass
+            t_4.append(
+                'from py_contract_codegen.runtime import ContractBase\n',
+            )
+        t_4.append(
+            '\n',
+        )
+        if (l_1_abi_embedding == 'literal'):
+            pass
+            t_4.extend((
+                'ABI = ',
+                str(t_3(l_1_formatted_content)),
+            ))
+        else:
+            pass
+            if (l_1_abi_embedding == 'json'):
+                pass
+                t_4.extend((
+                    'ABI_JSON = ',
+                    str(t_3(l_1_formatted_content)),
+                ))
+            else:
+                pass
+                t_4.append(
+                    'ABI_FILE = Path(__file__).with_suffix(".abi.json")',
+                )
+            t_4.append(
+                '\n\n\n@cache\ndef load_abi() -> list[dict[str, Any]]:\n    return json.loads(',
+            )
+            if (l_1_abi_embedding == 'json'):
+                pass
+                t_4.append(
+                    'ABI_JSON',
+                )
+            else:
+                pass
+                t_4.append(
+                    'ABI_FILE.read_bytes()',
+                )
+            t_4.append(
+                ')\n\n\ndef __getattr__(name: str) -> Any:\n    # the ABI is decoded on first use, see PEP 562\n    if name == "ABI":\n        return load_abi()\n    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")',
+            )
+        t_4.extend((
+            '\n\n\nclass ',
+            str(l_1_contract_class_name),
+        ))
+        if l_1_runtime:
+            pass
+            t_4.append(
+                '(ContractBase)',
+            )
+        t_4.append(
+            ':\n    def __init__(self, contract_address: Address | ChecksumAddress | ENS, web3: Web3) -> None:\n',
+        )
+        if l_1_runtime:
+            pass
+            t_4.append(
+                '        super().__init__(contract_address, web3, ',
+            )
+            if (l_1_abi_embedding == 'literal'):
+                pass
+                t_4.append(
+                    'ABI',
+                )
+            else:
+                pass
+                t_4.append(
+                    'load_abi()',
+                )
+            t_4.append(
+                ')\n',
+            )
+        else:
+            pass
+            t_4.append(
+                '        self.contract_address = contract_address\n        self.web3 = web3\n        self.contract = web3.eth.contract(address=self.contract_address, abi=',
+            )
+            if (l_1_abi_embedding == 'literal'):
+                pass
+                t_4.append(
+                    'ABI',
+                )
+            else:
+                pass
+                t_4.append(
+                    'load_abi()',
+                )
+            t_4.append(
+                ')\n',
+            )
+        return concat(t_4)
+    context.exported_vars.add('render_header')
+    context.vars['render_header'] = l_0_render_header = Macro(environment, macro, 'render_header', ('formatted_content', 'contract_class_name', 'abi_embedding', 'runtime'), False, False, False, context.eval_ctx.autoescape)
+    def macro(l_1_function, l_1_runtime):
+        t_5 = []
+        if l_1_function is missing:
+            l_1_function = undefined("parameter 'function' was not provided", name='function')
+        if l_1_runtime is missing:
+            l_1_runtime = False
+        pass
+        t_5.extend((
+            '\n    def ',
+            str(environment.getattr(l_1_function, 'name')),
+            '(self',
+        ))
+        if environment.getattr(l_1_function, 'converted_inputs'):
+            pass
+            t_5.append(
+                ', ',
+            )
+        l_2_loop = missing
+        for l_2_input, l_2_loop in LoopContext(environment.getattr(l_1_function, 'converted_inputs'), undefined):
+            _loop_vars = {}
+            pass
+            t_5.extend((
+                str(environment.getattr(l_2_input, 'name')),
+                ': ',
+                str(environment.getattr(l_2_input, 'python_type')),
+            ))
+            if (not environment.getattr(l_2_loop, 'last')):
+                pass
+                t_5.append(
+                    ', ',
+                )
+        l_2_loop = l_2_input = missing
+        if (environment.getattr(l_1_function, 'stateMutability') not in ['view', 'pure']):
+            pass
+        t_5.append(
+            ')',
+        )
+        if (environment.getattr(l_1_function, 'stateMutability') in ['view', 'pure']):
+            pass
+            t_5.append(
+                ' -> ',
+            )
+            if (t_2(environment.getattr(l_1_function, 'converted_outputs')) == 1):
+                pass
+                t_5.append(
+                    str(environment.getattr(environment.getitem(environment.getattr(l_1_function, 'converted_outputs'), 0), 'python_type')),
+                )
+            else:
+                pass
+                t_5.append(
+                    'tuple[',
+                )
+                if (not environment.getattr(l_1_function, 'converted_outputs')):
+                    pass
+                    t_5.append(
+                        '()',
+                    )
+                l_2_loop = missing
+                for l_2_output, l_2_loop in LoopContext(environment.getattr(l_1_function, 'converted_outputs'), undefined):
+                    _loop_vars = {}
+                    pass
+                    t_5.append(
+                        str(environment.getattr(l_2_output, 'python_type')),
+                    )
+                    if (not environment.getattr(l_2_loop, 'last')):
+                        pass
+                        t_5.append(
+                            ', ',
+                        )
+                l_2_loop = l_2_output = missing
+                t_5.append(
+                    ']',
+                )
+        else:
+            pass
+            t_5.append(
+                ' -> ContractFunction',
+            )
+        t_5.append(
+            ':',
+        )
+        if l_1_runtime:
+            pass
+            t_5.append(
+                '\n        return self.',
+            )
+            if (environment.getattr(l_1_function, 'stateMutability') in ['view', 'pure']):
+                pass
+                t_5.append(
+                    '_call_function',
+                )
+            else:
+                pass
+                t_5.append(
+                    '_build_function',
+                )
+            t_5.extend((
+                '("',
+                str(environment.getattr(l_1_function, 'name')),
+                '"',
+            ))
+            for l_2_input in environment.getattr(l_1_function, 'converted_inputs'):
+                _loop_vars = {}
+                pass
+                t_5.extend((
+                    ', ',
+                    str(environment.getattr(l_2_input, 'name')),
+                ))
+            l_2_input = missing
+            t_5.append(
+                ')',
+            )
+        elif (environment.getattr(l_1_function, 'stateMutability') in ['view', 'pure']):
+            pass
+            t_5.extend((
+                '\n        return self.contract.functions.',
+                str(environment.getattr(l_1_function, 'name')),
+                '(',
+            ))
+            l_2_loop = missing
+            for l_2_input, l_2_loop in LoopContext(environment.getattr(l_1_function, 'converted_inputs'), undefined):
+                _loop_vars = {}
+                pass
+                t_5.append(
+                    str(environment.getattr(l_2_input, 'name')),
+                )
+                if (not environment.getattr(l_2_loop, 'last')):
+                    pass
+                    t_5.append(
+                        ', ',
+                    )
+            l_2_loop = l_2_input = missing
+            t_5.append(
+                ').call()',
+            )
+        else:
+            pass
+            t_5.extend((
+                '\n        return self.contract.functions.',
+                str(environment.getattr(l_1_function, 'name')),
+                '(',
+            ))
+            l_2_loop = missing
+            for l_2_input, l_2_loop in LoopContext(environment.getattr(l_1_function, 'converted_inputs'), undefined):
+                _loop_vars = {}
+                pass
+                t_5.append(
+                    str(environment.getattr(l_2_input, 'name')),
+                )
+                if (not environment.getattr(l_2_loop, 'last')):
+                    pass
+                    t_5.append(
+                        ', ',
+                    )
+            l_2_loop = l_2_input = missing
+            t_5.append(
+                ')',
+            )
+        t_5.append(
+            '\n',
+        )
+        return concat(t_5)
+    context.exported_vars.add('render_function')
+    context.vars['render_function'] = l_0_render_function = Macro(environment, macro, 'render_function', ('function', 'runtime'), False, False, False, context.eval_ctx.autoescape)
+    def macro(l_1_event, l_1_runtime):
+        t_6 = []
+        if l_1_event is missing:
+            l_1_event = undefined("parameter 'event' was not provided", name='event')
+        if l_1_runtime is missing:
+            l_1_runtime = False
+        pass
+        t_6.extend((
+            '\n    def get_event_',
+            str(environment.getattr(l_1_event, 'name')),
+            '(\n        self,\n        argument_filters: dict[str, Any] | None = None,\n        from_block: BlockIdentifier | None = None,\n        to_block: BlockIdentifier | None = None,\n        block_hash: HexBytes | None = None,\n    ) -> Iterable[EventData]:\n',
+        ))
+        if l_1_runtime:
+            pass
+            t_6.extend((
+                '        return self._get_event_logs("',
+                str(environment.getattr(l_1_event, 'name')),
+                '", argument_filters, from_block, to_block, block_hash)\n',
+            ))
+        else:
+            pass
+            t_6.extend((
+                '        return self.contract.events.',
+                str(environment.getattr(l_1_event, 'name')),
+                '().get_logs(  # type: ignore[attr-defined]\n            argument_filters=argument_filters,\n            from_block=from_block,\n            to_block=to_block,\n            block_hash=block_hash,\n        )\n',
+            ))
+        return concat(t_6)
+    context.exported_vars.add('render_event')
+    context.vars['render_event'] = l_0_render_event = Macro(environment, macro, 'render_event', ('event', 'runtime'), False, False, False, context.eval_ctx.autoescape)
+    yield str(context.call((undefined(name='render_header') if l_0_render_header is missing else l_0_render_header), (undefined(name='formatted_content') if l_0_formatted_content is missing else l_0_formatted_content), (undefined(name='contract_class_name') if l_0_contract_class_name is missing else l_0_contract_class_name), t_1((undefined(name='abi_embedding') if l_0_abi_embedding is missing else l_0_abi_embedding), 'literal'), t_1((undefined(name='runtime') if l_0_runtime is missing else l_0_runtime), False)))
+    for l_1_function in (undefined(name='functions') if l_0_functions is missing else l_0_functions):
+        _loop_vars = {}
+        pass
+        yield str(context.call((undefined(name='render_function') if l_0_render_function is missing else l_0_render_function), l_1_function, t_1((undefined(name='runtime') if l_0_runtime is missing else l_0_runtime), False), _loop_vars=_loop_vars))
+    l_1_function = missing
+    for l_1_event in (undefined(name='events') if l_0_events is missing else l_0_events):
+        _loop_vars = {}
+        pass
+        yield str(context.call((undefined(name='render_event') if l_0_render_event is missing else l_0_render_event), l_1_event, t_1((undefined(name='runtime') if l_0_runtime is missing else l_0_runtime), False), _loop_vars=_loop_vars))
+    l_1_event = missing
+
+blocks = {}
+debug_info = '1=36&2=50&4=55&10=63&12=71&17=93&27=108&29=118&32=141&34=157&35=166&36=243&37=273&38=296&40=321&41=330&48=333&49=344&56=350'
\ No newline at end of file
@@ -0,0 +1,70 @@
+import importlib.util
+import json
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+from py_contract_codegen.modules.client import SOCKET_ENV_VAR
+
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "template"
+ADDRESS = "0x0000000000000000000000000000000000000001"
+
+# a view function, a state-changing function and an event
+SAMPLE_ABI: list[dict[str, Any]] = [
+    {
+        "type": "function",
+        "name": "balanceOf",
+        "inputs": [{"name": "owner", "type": "address"}],
+        "outputs": [{"name": "", "type": "uint256"}],
+        "stateMutability": "view",
+    },
+    {
+        "type": "function",
+        "name": "transfer",
+        "inputs": [
+            {"name": "to", "type": "address"},
+            {"name": "value", "type": "uint256"},
+        ],
+        "outputs": [{"name": "", "type": "bool"}],
+        "stateMutability": "nonpayable",
+    },
+    {
+        "type": "event",
+        "name": "Transfer",
+        "inputs": [{"name": "from", "type": "address", "indexed": True}],
+        "anonymous": False,
+    },
+]
+SAMPLE_ABI_JSON = json.dumps(SAMPLE_ABI)
+
+
+def function_abi(name: str) -> dict[str, Any]:
+    """
+    A view function `name(address) -> uint256`.
+    """
+    return {
+        "type": "function",
+        "name": name,
+        "inputs": [{"name": "owner", "type": "address"}],
+        "outputs": [{"name": "", "type": "uint256"}],
+        "stateMutability": "view",
+    }
+
+
+def import_path(path: Path) -> ModuleType:
+    """
+    Import a generated module from its file.
+    """
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(autouse=True)
+def no_daemon(monkeypatch, tmp_path):
+    # `gen` forwards to a running daemon, which must not be one the developer left running
+    monkeypatch.setenv(SOCKET_ENV_VAR, str(tmp_path / "no-daemon.sock"))
@@ -1,12 +1,15 @@
+import ast
 import json
-import re
+from pathlib import Path
 
 import pytest
 
 from py_contract_codegen.modules.abi import (
+    BASIC_PYTHON_TYPES,
     ABIParser,
     ABITypeConverter,
-    replace_keywords,
+    ComponentRecord,
+    format_abi_for_python,
 )
 from py_contract_codegen.modules.enums import StateMutability
 from py_contract_codegen.modules.exceptions import (
@@ -16,17 +19,68 @@ from py_contract_codegen.modules.exceptions import (
 )
 
 
+GENERATED_DIR = Path(__file__).resolve().parent.parent.parent / "generated"
+
+
 @pytest.mark.parametrize(
-    "input_string, expected",
+    "abi",
     [
-        ('"true"', "True"),
-        ('"false"', "False"),
-        ('"null"', "None"),
+        [],
+        [{}],
+        [
+            {
+                "type": "function",
+                "name": "balanceOf",
+                "constant": True,
+                "payable": False,
+                "inputs": [{"name": "_account", "type": "address"}],
+                "outputs": [],
+                "gas": 2300,
+                "extra": None,
+            }
+        ],
     ],
 )
-def test_replace_keywords(input_string, expected):
-    match = re.match(r'"(true|false|null)"', input_string)
-    assert replace_keywords(match) == expected
+def test_format_abi_for_python(abi):
+    formatted = format_abi_for_python(abi)
+
+    assert ast.literal_eval(formatted) == abi
+    assert formatted == json.dumps(abi, indent=4).replace("true", "True").replace(
+        "false", "False"
+    ).replace("null", "None")
+
+
+def test_format_abi_for_python_keeps_keywords_in_strings():
+    abi = [{"type": "event", "name": "true", "inputs": [{"name": "null_or_false"}]}]
+
+    formatted = format_abi_for_python(abi)
+
+    assert ast.literal_eval(formatted) == abi
+    assert '"name": "true"' in formatted
+    assert '"name": "null_or_false"' in formatted
+
+
+def test_format_abi_for_python_escapes_strings():
+    abi = [{"name": 'quote"back\\slash\nnewline\u00e9'}]
+
+    assert ast.literal_eval(format_abi_for_python(abi)) == abi
+
+
+def test_format_abi_for_python_matches_shipped_examples():
+    code = (GENERATED_DIR / "contract" / "usdt.py").read_text()
+    module = ast.parse(code)
+    abi = next(
+        ast.literal_eval(node.value)
+        for node in module.body
+        if isinstance(node, ast.Assign) and node.targets[0].id == "ABI"
+    )
+
+    assert ast.literal_eval(format_abi_for_python(abi)) == abi
+
+
+def test_format_abi_for_python_with_unsupported_type():
+    with pytest.raises(TypeError):
+        format_abi_for_python([{"name": object()}])
 
 
 @pytest.mark.parametrize(
@@ -64,6 +118,27 @@ def test_get_python_type_parse_error():
     assert ABITypeConverter.get_python_type("invalid python type") == "Any"
 
 
+@pytest.mark.parametrize("abi_type", sorted(BASIC_PYTHON_TYPES))
+def test_basic_python_types_match_resolution(abi_type: str):
+    resolved = ABITypeConverter._resolve_python_type.__wrapped__(abi_type)
+    assert BASIC_PYTHON_TYPES[abi_type] == resolved
+
+
+def test_get_python_type_cache_info():
+    ABITypeConverter.cache_clear()
+
+    ABITypeConverter.get_python_type("uint256")
+    ABITypeConverter.get_python_type("(uint256,address)[]")
+    ABITypeConverter.get_python_type("(uint256,address)[]")
+    info = ABITypeConverter.cache_info()
+
+    # `uint256` and the second tuple lookup are hits,
+    # the tuple array and its element tuple type are misses.
+    assert info.hits == 2
+    assert info.misses == 2
+    assert info.currsize == len(BASIC_PYTHON_TYPES) + 2
+
+
 def test_convert_type_abi_error():
     with pytest.raises(UnknownABITypeError):
         ABITypeConverter._convert_type("invalid python type")
@@ -400,3 +475,42 @@ def test_abi_data_with_function_output_address():
     assert abi_data.functions[0]["converted_outputs"][0]["name"] == "output_1"
     assert abi_data.functions[0]["converted_outputs"][0]["python_type"] == "str"
     assert abi_data.functions[0]["stateMutability"] == "view"
+
+
+def test_abi_parser_render_view():
+    abi_json = json.dumps(
+        [
+            {
+                "type": "function",
+                "name": "balanceOf",
+                "inputs": [{"name": "owner", "type": "address"}],
+                "outputs": [{"name": "", "type": "uint256"}],
+                "stateMutability": "view",
+            },
+            {
+                "type": "event",
+                "name": "Transfer",
+                "inputs": [{"name": "from", "type": "address", "indexed": True}],
+            },
+        ]
+    )
+    abi_data = ABIParser(abi=abi_json)
+
+    view = abi_data.render_view()
+
+    assert view.formatted_content is abi_data.formatted_content
+    function = view.functions[0]
+    assert function.name is abi_data.functions[0]["name"]
+    assert function.stateMutability == "view"
+    assert function.converted_inputs[0] == ComponentRecord(
+        name="owner", type="address", indexed=False, python_type="ChecksumAddress"
+    )
+    assert function.converted_outputs[0].python_type == "int"
+    event = view.events[0]
+    assert event.name == "Transfer"
+    assert not event.anonymous
+    assert event.converted_inputs[0].name == "from_"
+    assert event.converted_inputs[0].indexed
+    assert not hasattr(function, "__dict__")
+    with pytest.raises(AttributeError):
+        function.name = "other"  # type: ignore[misc]
@@ -0,0 +1,158 @@
+import json
+
+import pytest
+
+from py_contract_codegen.modules.artifacts import (
+    collect_jobs_from_artifacts,
+    iter_foundry_artifacts,
+    iter_hardhat_artifacts,
+    iter_json_values,
+    iter_solc_artifacts,
+    module_name_from_contract,
+)
+from py_contract_codegen.modules.batch import read_job_abi
+from py_contract_codegen.modules.enums import ArtifactFormat
+
+TOKEN_ABI = [
+    {
+        "type": "function",
+        "name": "balanceOf",
+        "inputs": [{"name": "owner", "type": "address"}],
+        "outputs": [{"name": "", "type": "uint256"}],
+        "stateMutability": "view",
+    }
+]
+VAULT_ABI = [{"type": "event", "name": "Deposit", "inputs": [], "anonymous": False}]
+
+
+def write_json(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(content, indent=2))
+
+
+@pytest.mark.parametrize(
+    "content, patterns, expected",
+    [
+        ({"abi": [1, 2], "bytecode": "0x00"}, [("abi",)], [(("abi",), [1, 2])]),
+        (
+            {"a": {"abi": 1}, "b": [{"abi": 2}], "abi": {"x": "}{]["}},
+            [("abi",)],
+            [(("abi",), {"x": "}{]["})],
+        ),
+        (
+            {"x": 1, "y": {"z": '"abi": "escaped"'}, "abi": None},
+            [("abi",)],
+            [(("abi",), None)],
+        ),
+        (
+            {"c": {"f1": {"A": {"abi": []}}, "f2": {"B": {"abi": [3], "evm": {}}}}},
+            [("c", None, None, "abi")],
+            [(("c", "f1", "A", "abi"), []), (("c", "f2", "B", "abi"), [3])],
+        ),
+        ({"abi": []}, [("missing",)], []),
+        # `None` only matches object keys
+        (
+            {"c": [{"abi": 1}], "d": {"A": {"abi": 2}}},
+            [(None, None, "abi")],
+            [(("d", "A", "abi"), 2)],
+        ),
+        ([{"abi": 1}], [("abi",)], []),
+    ],
+)
+def test_iter_json_values(content, patterns, expected):
+    data = json.dumps(content).encode()
+
+    assert list(iter_json_values(data, patterns)) == expected
+
+
+def test_iter_json_values_stops_after_matched_top_level_keys():
+    data = json.dumps({"abi": [1]}).encode() + b', "ast": {this is never parsed'
+
+    assert list(iter_json_values(data, [("abi",)])) == [(("abi",), [1])]
+
+
+@pytest.mark.parametrize(
+    "contract_name, expected",
+    [
+        ("UniswapV3Pool", "uniswap_v3_pool"),
+        ("ERC20Token", "erc20_token"),
+        ("WETH9", "weth9"),
+        ("IERC20", "ierc20"),
+        ("1inchRouter", "_1inch_router"),
+    ],
+)
+def test_module_name_from_contract(contract_name, expected):
+    assert module_name_from_contract(contract_name) == expected
+
+
+def test_iter_foundry_artifacts(tmp_path):
+    write_json(
+        tmp_path / "Token.sol" / "Token.json",
+        {"abi": TOKEN_ABI, "bytecode": {"object": "0x6080"}, "ast": {"nodes": []}},
+    )
+    write_json(tmp_path / "build-info" / "abc.json", {"output": {}})
+
+    artifacts = list(iter_foundry_artifacts(tmp_path))
+
+    assert [(a.contract_name, a.abi) for a in artifacts] == [("Token", TOKEN_ABI)]
+
+
+def test_iter_hardhat_artifacts(tmp_path):
+    write_json(
+        tmp_path / "contracts" / "Vault.sol" / "Vault.json",
+        {
+            "_format": "hh-sol-artifact-1",
+            "contractName": "MyVault",
+            "sourceName": "contracts/Vault.sol",
+            "abi": VAULT_ABI,
+            "bytecode": "0x6080",
+        },
+    )
+    write_json(tmp_path / "contracts" / "Vault.sol" / "Vault.dbg.json", {"abi": []})
+    (tmp_path / "empty.json").write_text("")
+
+    artifacts = list(iter_hardhat_artifacts(tmp_path))
+
+    assert [(a.contract_name, a.abi) for a in artifacts] == [("MyVault", VAULT_ABI)]
+
+
+def test_iter_solc_artifacts(tmp_path):
+    output_file = tmp_path / "output.json"
+    write_json(
+        output_file,
+        {
+            "contracts": {
+                "src/Token.sol": {"Token": {"abi": TOKEN_ABI, "evm": {}}},
+                "src/Vault.sol": {"Vault": {"abi": VAULT_ABI}},
+            },
+            "sources": {"src/Token.sol": {"id": 0, "ast": {"nodes": []}}},
+        },
+    )
+
+    artifacts = list(iter_solc_artifacts(output_file))
+
+    assert [(a.contract_name, a.abi) for a in artifacts] == [
+        ("Token", TOKEN_ABI),
+        ("Vault", VAULT_ABI),
+    ]
+
+
+def test_collect_jobs_from_artifacts(tmp_path):
+    artifacts_dir = tmp_path / "out"
+    write_json(artifacts_dir / "A.sol" / "Token.json", {"abi": TOKEN_ABI})
+    write_json(artifacts_dir / "B.sol" / "Token.json", {"abi": VAULT_ABI})
+    write_json(artifacts_dir / "Lib.sol" / "Lib.json", {"abi": []})
+    out_dir = tmp_path / "generated"
+
+    jobs = collect_jobs_from_artifacts(artifacts_dir, ArtifactFormat.foundry, out_dir)
+
+    assert [(j.out_file, j.contract_class_name) for j in jobs] == [
+        (out_dir / "token.py", "TokenContract"),
+        (out_dir / "token_2.py", "TokenContract"),
+    ]
+    assert json.loads(read_job_abi(jobs[0])) == TOKEN_ABI
+
+    jobs = collect_jobs_from_artifacts(
+        artifacts_dir, ArtifactFormat.foundry, out_dir, include_empty=True
+    )
+    assert len(jobs) == 3
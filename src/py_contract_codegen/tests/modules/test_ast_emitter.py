@@ -0,0 +1,211 @@
+import ast
+import json
+from pathlib import Path
+
+import pytest
+from conftest import TEMPLATE_DIR, function_abi
+
+from py_contract_codegen.modules.abi import ABIParser
+from py_contract_codegen.modules.ast_emitter import (
+    LINE_LENGTH,
+    ASTEmitter,
+    format_abi_literal,
+)
+from py_contract_codegen.modules.cache import GenerationCache
+from py_contract_codegen.modules.code_generator import ContractCodeGenerator
+from py_contract_codegen.modules.enums import Backend, TargetLib
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent.parent
+GENERATED_DIR = PACKAGE_DIR / "generated" / "contract"
+
+ABI = [
+    {
+        "type": "function",
+        "name": "balanceOf",
+        "inputs": [{"name": "owner", "type": "address"}],
+        "outputs": [{"name": "", "type": "uint256"}],
+        "stateMutability": "view",
+    },
+    {
+        "type": "function",
+        "name": "ping",
+        "inputs": [],
+        "outputs": [],
+        "stateMutability": "view",
+    },
+    {
+        "type": "event",
+        "name": "Transfer",
+        "anonymous": False,
+        "inputs": [
+            {"name": "from", "type": "address", "indexed": True},
+            {"name": "to", "type": "address", "indexed": True},
+            {"name": "value", "type": "uint256", "indexed": False},
+        ],
+    },
+]
+
+
+def _render(abi: list[dict], target_lib: TargetLib = TargetLib.web3_v7) -> str:
+    view = ABIParser(abi=json.dumps(abi)).render_view()
+    return ASTEmitter(target_lib).render(view, "MyContract")
+
+
+@pytest.mark.parametrize(
+    "path", sorted(GENERATED_DIR.glob("*.py")), ids=lambda p: p.stem
+)
+def test_ast_emitter_matches_generated_examples(path):
+    code = path.read_text()
+    module = ast.parse(code)
+    abi = next(
+        ast.literal_eval(node.value)
+        for node in module.body
+        if isinstance(node, ast.Assign) and node.targets[0].id == "ABI"  # type: ignore[attr-defined]
+    )
+    class_name = next(
+        node.name for node in module.body if isinstance(node, ast.ClassDef)
+    )
+
+    view = ABIParser(abi=json.dumps(abi)).render_view()
+
+    assert ASTEmitter().render(view, class_name) == code
+
+
+@pytest.mark.parametrize("target_lib", list(TargetLib))
+def test_ast_emitter_output_is_valid_python(target_lib):
+    code = _render(ABI, target_lib)
+
+    ast.parse(code)
+    assert all(len(line) <= LINE_LENGTH for line in code.splitlines())
+    assert "def ping(self) -> tuple[()]:" in code
+    assert "def balanceOf(self, owner: ChecksumAddress) -> int:" in code
+
+
+def test_ast_emitter_uses_target_lib_keywords():
+    assert "fromBlock=from_block" in _render(ABI, TargetLib.web3_v6)
+    assert "from_block=from_block" in _render(ABI, TargetLib.web3_v7)
+
+
+def test_format_abi_literal_splits_long_lines():
+    abi = [{"type": "function", "name": "f" * 100, "inputs": []}]
+
+    literal = format_abi_literal(abi)
+
+    assert ast.literal_eval(literal) == abi
+    assert len(literal.splitlines()) > 1
+    assert format_abi_literal([]) == "[]"
+    assert format_abi_literal([{"anonymous": False}]) == '[{"anonymous": False}]'
+
+
+def test_code_generator_with_ast_backend(tmp_path):
+    generator = ContractCodeGenerator(
+        abi_content=json.dumps(ABI),
+        template_path=TEMPLATE_DIR,
+        contract_class_name="MyContract",
+        backend=Backend.ast,
+    )
+    out_file = tmp_path / "contract.py"
+
+    assert generator.generate() == "".join(generator.iter_generate())
+    assert generator.generate() == _render(ABI)
+    assert generator.generate_file(out_file)
+    assert out_file.read_text() == generator.generate()
+
+    cache = GenerationCache(tmp_path / "cache")
+    generator.generate_file(out_file, cache=cache)
+    generator = ContractCodeGenerator(
+        abi_content=json.dumps([*ABI, function_abi("added")]),
+        template_path=TEMPLATE_DIR,
+        contract_class_name="MyContract",
+        backend=Backend.ast,
+    )
+    generator.generate_file(out_file, cache=cache)
+    assert generator.last_write is not None
+    # the header embeds the whole ABI, so it changes along with the added function
+    assert (generator.last_write.rendered, generator.last_write.reused) == (2, 3)
+    assert out_file.read_text() == generator.generate()
+
+
+@pytest.mark.parametrize("target_lib", list(TargetLib))
+def test_ast_emitter_with_runtime_matches_formatted_template(target_lib):
+    pytest.importorskip("black")
+
+    def generate(backend: Backend, format_output: bool) -> str:
+        return ContractCodeGenerator(
+            abi_content=json.dumps(ABI),
+            template_path=TEMPLATE_DIR,
+            target_lib=target_lib,
+            backend=backend,
+            format_output=format_output,
+            runtime=True,
+        ).generate()
+
+    code = generate(Backend.ast, False)
+    assert code == generate(Backend.jinja, True)
+    assert 'return self._call_function("balanceOf", owner)' in code
+    assert all(len(line) <= LINE_LENGTH for line in code.splitlines())
+
+
+LONG_ABI = [
+    {
+        "type": "function",
+        "name": "setPositionsForManyAccountsAtOnce",
+        "inputs": [
+            {
+                "name": "accountPositionsWithVeryLongDescriptiveNameAndEvenLongerSuffix",
+                "type": "(uint256,address)[]",
+            }
+        ],
+        "outputs": [],
+        "stateMutability": "nonpayable",
+    },
+    {
+        "type": "function",
+        "name": "positions",
+        "inputs": [],
+        "outputs": [
+            {"name": "", "type": "(uint256,address,bytes32,uint8,bool,string)[]"}
+        ],
+        "stateMutability": "view",
+    },
+    {
+        "type": "event",
+        "name": "SomethingHappenedWithAnExtremelyLongEventNameThatGoesOnAndOnForever",
+        "anonymous": False,
+        "inputs": [],
+    },
+]
+
+
+@pytest.mark.parametrize("runtime", [False, True])
+def test_ast_emitter_wraps_long_lines_like_black(runtime):
+    code = ContractCodeGenerator(
+        abi_content=json.dumps(LONG_ABI),
+        template_path=TEMPLATE_DIR,
+        contract_class_name="ContractWithAClassNameThatIsLongEnoughToPushItsBaseClassPastTheLineLimit",
+        backend=Backend.ast,
+        runtime=runtime,
+    ).generate()
+    # the emitter splits the annotation itself, so the output doesn't depend on black being installed
+    assert (
+        "        accountPositionsWithVeryLongDescriptiveNameAndEvenLongerSuffix: list[\n"
+        "            tuple[int, ChecksumAddress]\n"
+        "        ],\n"
+    ) in code
+    black = pytest.importorskip("black")
+    assert code == black.format_str(code, mode=black.Mode())
+
+
+def test_ast_emitter_wraps_long_calls_without_arguments_like_black():
+    name = "functionWithANameLongEnoughToPushTheCallWithoutArgumentsPastTheLimit"
+    code = ContractCodeGenerator(
+        abi_content=json.dumps([dict(function_abi(name), inputs=[])]),
+        template_path=TEMPLATE_DIR,
+        backend=Backend.ast,
+    ).generate()
+    assert (
+        f"        return (\n            self.contract.functions.{name}().call()\n        )\n"
+        in code
+    )
+    black = pytest.importorskip("black")
+    assert code == black.format_str(code, mode=black.Mode())
@@ -0,0 +1,145 @@
+import json
+from dataclasses import replace
+
+import pytest
+from conftest import SAMPLE_ABI_JSON, TEMPLATE_DIR
+
+from py_contract_codegen.modules.batch import (
+    BatchJob,
+    class_name_from_stem,
+    collect_jobs_from_dir,
+    collect_jobs_from_manifest,
+    generate_batch,
+)
+from py_contract_codegen.modules.exceptions import BatchManifestError
+from py_contract_codegen.modules.options import GenerateOptions
+
+OPTIONS = GenerateOptions(template_path=TEMPLATE_DIR)
+
+
+@pytest.mark.parametrize(
+    "stem, expected",
+    [
+        ("usdt", "UsdtContract"),
+        ("uniswap_v3", "UniswapV3Contract"),
+        ("crypto-kitties", "CryptoKittiesContract"),
+        ("ERC20", "ERC20Contract"),
+        ("TokenContract", "TokenContract"),
+        ("1inch", "_1inchContract"),
+    ],
+)
+def test_class_name_from_stem(stem, expected):
+    assert class_name_from_stem(stem) == expected
+
+
+def test_collect_jobs_from_dir(tmp_path):
+    (tmp_path / "b_token.json").write_text(SAMPLE_ABI_JSON)
+    (tmp_path / "a_token.abi").write_text(SAMPLE_ABI_JSON)
+    (tmp_path / "README.md").write_text("not an abi")
+    out_dir = tmp_path / "out"
+
+    jobs = collect_jobs_from_dir(tmp_path, out_dir)
+
+    assert jobs == [
+        BatchJob(tmp_path / "a_token.abi", out_dir / "a_token.py", "ATokenContract"),
+        BatchJob(tmp_path / "b_token.json", out_dir / "b_token.py", "BTokenContract"),
+    ]
+
+
+def test_collect_jobs_from_manifest(tmp_path):
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(
+        json.dumps(
+            [
+                {"abi_path": "abi/usdt.json", "class_name": "USDTContract"},
+                {"abi_path": "abi/weth.json", "out_file": "custom/weth_wrapper.py"},
+            ]
+        )
+    )
+    out_dir = tmp_path / "out"
+
+    jobs = collect_jobs_from_manifest(manifest, out_dir)
+
+    assert jobs == [
+        BatchJob(tmp_path / "abi/usdt.json", out_dir / "usdt.py", "USDTContract"),
+        BatchJob(
+            tmp_path / "abi/weth.json",
+            tmp_path / "custom/weth_wrapper.py",
+            "WethContract",
+        ),
+    ]
+
+
+@pytest.mark.parametrize(
+    "content",
+    ["invalid json", json.dumps({"abi_path": "a.json"}), json.dumps([{"x": 1}])],
+)
+def test_collect_jobs_from_invalid_manifest(tmp_path, content):
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(content)
+
+    with pytest.raises(BatchManifestError):
+        collect_jobs_from_manifest(manifest, tmp_path)
+
+
+def test_collect_jobs_from_manifest_without_out_dir(tmp_path):
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(json.dumps([{"abi_path": "a.json"}]))
+
+    with pytest.raises(BatchManifestError):
+        collect_jobs_from_manifest(manifest, None)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_generate_batch_reports_failures_without_aborting(tmp_path, max_workers):
+    (tmp_path / "token.json").write_text(SAMPLE_ABI_JSON)
+    (tmp_path / "broken.json").write_text("invalid json content")
+    (tmp_path / "vault.json").write_text(SAMPLE_ABI_JSON)
+    out_dir = tmp_path / "out"
+    jobs = collect_jobs_from_dir(tmp_path, out_dir)
+
+    results = generate_batch(jobs, OPTIONS, max_workers=max_workers)
+
+    assert [r.job for r in results] == jobs
+    assert [r.ok for r in results] == [False, True, True]
+    assert "Invalid JSON" in results[0].error
+    assert not (out_dir / "broken.py").exists()
+    assert "class TokenContract" in (out_dir / "token.py").read_text()
+    assert "class VaultContract" in (out_dir / "vault.py").read_text()
+
+
+def test_generate_batch_with_no_jobs():
+    assert generate_batch([], OPTIONS) == []
+
+
+def test_generate_batch_with_format_output(tmp_path):
+    pytest.importorskip("black")
+    (tmp_path / "token.json").write_text(SAMPLE_ABI_JSON)
+    (tmp_path / "vault.json").write_text(SAMPLE_ABI_JSON)
+    out_dir = tmp_path / "out"
+    jobs = collect_jobs_from_dir(tmp_path, out_dir)
+
+    results = generate_batch(jobs, replace(OPTIONS, format_output=True), max_workers=2)
+
+    assert all(r.ok for r in results)
+    code = (out_dir / "token.py").read_text()
+    assert 'ABI = [\n    {\n        "type": "function",' in code
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_generate_batch_with_profile(tmp_path, max_workers):
+    (tmp_path / "token.json").write_text(SAMPLE_ABI_JSON)
+    (tmp_path / "vault.json").write_text(SAMPLE_ABI_JSON)
+    jobs = collect_jobs_from_dir(tmp_path, tmp_path / "out")
+
+    results = generate_batch(
+        jobs, replace(OPTIONS, profile=True), max_workers=max_workers
+    )
+
+    for result in results:
+        assert result.profile is not None
+        assert {"read", "validate", "parse", "render", "write"} <= set(
+            result.profile["stages"]
+        )
+        assert result.profile["abi"]["functions"] == 2
+    assert generate_batch(jobs, OPTIONS, max_workers=1)[0].profile is None
@@ -0,0 +1,60 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+from conftest import SAMPLE_ABI_JSON, TEMPLATE_DIR
+
+from py_contract_codegen.modules.bytecode import bytecode_path, write_bytecode
+from py_contract_codegen.modules.cache import GenerationCache
+from py_contract_codegen.modules.code_generator import ContractCodeGenerator
+from py_contract_codegen.modules.enums import Bytecode
+
+
+def _pyc_flags(pyc_file: Path) -> int:
+    data = pyc_file.read_bytes()
+    assert data[:4] == importlib.util.MAGIC_NUMBER
+    return int.from_bytes(data[4:8], "little")
+
+
+@pytest.mark.parametrize(
+    "mode, flags",
+    [
+        (Bytecode.timestamp, 0b00),
+        (Bytecode.checked_hash, 0b11),
+        (Bytecode.unchecked_hash, 0b01),
+    ],
+)
+def test_write_bytecode(tmp_path, mode, flags):
+    source = tmp_path / "token.py"
+    source.write_text("VALUE = 1\n")
+
+    pyc_file = write_bytecode(source, mode)
+
+    assert pyc_file == bytecode_path(source)
+    assert pyc_file.parent == tmp_path / "__pycache__"
+    assert _pyc_flags(pyc_file) == flags
+
+
+def test_generate_file_with_bytecode(tmp_path):
+    out_file = tmp_path / "token.py"
+    cache = GenerationCache(tmp_path / "cache")
+    generator = ContractCodeGenerator(
+        abi_content=SAMPLE_ABI_JSON,
+        template_path=TEMPLATE_DIR,
+        contract_class_name="Token",
+        bytecode=Bytecode.unchecked_hash,
+    )
+
+    assert generator.generate_file(out_file, cache=cache)
+    pyc_file = bytecode_path(out_file)
+    assert _pyc_flags(pyc_file) == 0b01
+
+    pyc_file.unlink()
+    assert not generator.generate_file(out_file, cache=cache)
+    assert pyc_file.exists()
+
+    spec = importlib.util.spec_from_file_location("token_module", out_file)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    assert module.Token.__name__ == "Token"
@@ -0,0 +1,55 @@
+import json
+
+from py_contract_codegen.modules.cache import (
+    GenerationCache,
+    compute_cache_key,
+    normalize_abi,
+)
+
+ABI = [{"type": "function", "name": "balanceOf", "inputs": [], "outputs": []}]
+
+
+def test_normalize_abi_ignores_formatting():
+    assert normalize_abi(json.dumps(ABI, indent=4)) == normalize_abi(json.dumps(ABI))
+    assert normalize_abi(ABI) == normalize_abi(json.dumps(ABI))
+
+
+def test_compute_cache_key_changes_with_inputs():
+    key = compute_cache_key(ABI, "template", "MyContract", "web3_v7")
+
+    assert key == compute_cache_key(
+        json.dumps(ABI), "template", "MyContract", "web3_v7"
+    )
+    assert key != compute_cache_key([], "template", "MyContract", "web3_v7")
+    assert key != compute_cache_key(ABI, "template2", "MyContract", "web3_v7")
+    assert key != compute_cache_key(ABI, "template", "Other", "web3_v7")
+    assert key != compute_cache_key(ABI, "template", "MyContract", "web3_v6")
+
+
+def test_generation_cache(tmp_path):
+    cache = GenerationCache(tmp_path / "cache")
+    out_file = tmp_path / "out.py"
+
+    assert not cache.is_fresh(out_file, "key")
+
+    out_file.write_text("generated")
+    cache.store(out_file, "key")
+    assert cache.is_fresh(out_file, "key")
+    assert not cache.is_fresh(out_file, "other_key")
+
+    out_file.write_text("edited by hand")
+    assert not cache.is_fresh(out_file, "key")
+
+    out_file.unlink()
+    assert not cache.is_fresh(out_file, "key")
+
+
+def test_generation_cache_with_corrupted_entry(tmp_path):
+    cache = GenerationCache(tmp_path / "cache")
+    out_file = tmp_path / "out.py"
+    out_file.write_text("generated")
+    cache.store(out_file, "key")
+    for entry in (tmp_path / "cache").iterdir():
+        entry.write_text("corrupted")
+
+    assert not cache.is_fresh(out_file, "key")
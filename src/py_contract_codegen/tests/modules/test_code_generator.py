@@ -1,10 +1,17 @@
+import io
+import json
+import os
 from pathlib import Path
 
 import pytest
+from conftest import ADDRESS, TEMPLATE_DIR, function_abi, import_path
 from jinja2 import TemplateNotFound
+from py_contract_codegen.modules.cache import GenerationCache
 from py_contract_codegen.modules.code_generator import ContractCodeGenerator
-
-TEMPLATE_DIR = Path(__file__).resolve().parent.parent.parent / "template"
+from py_contract_codegen.modules.enums import Backend, TargetLib
+from py_contract_codegen.modules.exceptions import InvalidJSONError
+from py_contract_codegen.runtime import ContractBase
+from web3 import Web3
 
 
 def test_py_contract_codegen_with_valid_abi():
@@ -92,3 +99,240 @@ def test_py_contract_codegen_with_default_class_name():
 
     assert "class GeneratedContract" in generated_code
     assert "return self.contract.functions.balanceOf(_account).call()" in generated_code
+
+
+def test_py_contract_codegen_generate_file_with_cache(tmp_path):
+    abi_content = """
+    [
+        {
+            "type": "function",
+            "name": "balanceOf",
+            "inputs": [{"name": "_account", "type": "address"}],
+            "outputs": [{"name": "", "type": "uint256"}],
+            "stateMutability": "view"
+        }
+    ]
+    """
+    cache = GenerationCache(tmp_path / "cache")
+    out_file = tmp_path / "out" / "contract.py"
+    generator = ContractCodeGenerator(
+        abi_content=abi_content,
+        template_path=TEMPLATE_DIR,
+        contract_class_name="MyContract",
+    )
+
+    assert generator.generate_file(out_file, cache=cache)
+    assert out_file.read_text().startswith(generator.generate())
+    mtime = out_file.stat().st_mtime_ns
+
+    # re-formatted ABI has the same content, so the output is left untouched
+    generator = ContractCodeGenerator(
+        abi_content=" ".join(abi_content.split()),
+        template_path=TEMPLATE_DIR,
+        contract_class_name="MyContract",
+    )
+    assert not generator.generate_file(out_file, cache=cache)
+    assert out_file.stat().st_mtime_ns == mtime
+
+    generator = ContractCodeGenerator(
+        abi_content=abi_content,
+        template_path=TEMPLATE_DIR,
+        contract_class_name="OtherContract",
+    )
+    assert generator.generate_file(out_file, cache=cache)
+    assert "class OtherContract" in out_file.read_text()
+
+
+def _generate_file(abi: list[dict], out_file: Path) -> ContractCodeGenerator:
+    generator = ContractCodeGenerator(
+        abi_content=json.dumps(abi),
+        template_path=TEMPLATE_DIR,
+        contract_class_name="MyContract",
+    )
+    generator.generate_file(out_file, cache=GenerationCache(out_file.parent / "cache"))
+    return generator
+
+
+def test_py_contract_codegen_generate_file_renders_only_changed_members(tmp_path):
+    out_file = tmp_path / "contract.py"
+    abi = [function_abi(f"function{i}") for i in range(10)]
+    abi.append({"type": "event", "name": "Transfer", "inputs": []})
+
+    generator = _generate_file(abi, out_file)
+    assert generator.last_write is not None
+    assert (generator.last_write.rendered, generator.last_write.reused) == (12, 0)
+    assert out_file.read_text() == generator.generate()
+
+    abi.insert(3, function_abi("added"))
+    abi[7]["outputs"][0]["type"] = "bool"
+    generator = _generate_file(abi, out_file)
+    assert generator.last_write is not None
+    # the header embeds the whole ABI, so it changes along with the two functions
+    assert (generator.last_write.rendered, generator.last_write.reused) == (3, 10)
+    assert out_file.read_text() == generator.generate()
+
+    del abi[3]
+    generator = _generate_file(abi, out_file)
+    assert generator.last_write is not None
+    assert generator.last_write.rendered == 1
+    assert out_file.read_text() == generator.generate()
+
+
+def test_py_contract_codegen_generate_file_without_cache(tmp_path):
+    out_file = tmp_path / "contract.py"
+    abi = [function_abi("balanceOf"), function_abi("allowance")]
+    generator = ContractCodeGenerator(
+        abi_content=json.dumps(abi),
+        template_path=TEMPLATE_DIR,
+        contract_class_name="MyContract",
+    )
+
+    assert generator.generate_file(out_file)
+    assert generator.generate_file(out_file)
+
+    # segments are only reused from the cache, so the output is the module alone
+    assert generator.last_write is None
+    assert out_file.read_text() == generator.generate()
+
+
+def test_py_contract_codegen_generate_file_ignores_edited_output(tmp_path):
+    out_file = tmp_path / "contract.py"
+    abi = [function_abi("balanceOf"), function_abi("allowance")]
+    _generate_file(abi, out_file)
+    out_file.write_text(out_file.read_text().replace("allowance(owner)", "edited()"))
+
+    generator = _generate_file(abi, out_file)
+
+    assert generator.last_write is not None
+    assert generator.last_write.reused == 0
+    assert "edited()" not in out_file.read_text()
+
+
+def test_py_contract_codegen_generate_file_ignores_other_target_lib(tmp_path):
+    out_file = tmp_path / "contract.py"
+    abi = [{"type": "event", "name": "Transfer", "inputs": []}]
+    _generate_file(abi, out_file)
+
+    generator = ContractCodeGenerator(
+        abi_content=json.dumps(abi),
+        template_path=TEMPLATE_DIR,
+        target_lib=TargetLib.web3_v6,
+    )
+    generator.generate_file(out_file, cache=GenerationCache(tmp_path / "cache"))
+
+    assert generator.last_write is not None
+    assert generator.last_write.reused == 0
+    assert "fromBlock=from_block" in out_file.read_text()
+
+
+def test_py_contract_codegen_generate_to():
+    abi_content = """
+    [
+        {
+            "type": "function",
+            "name": "balanceOf",
+            "inputs": [{"name": "_account", "type": "address"}],
+            "outputs": [{"name": "", "type": "uint256"}],
+            "stateMutability": "view"
+        }
+    ]
+    """
+    generator = ContractCodeGenerator(
+        abi_content=abi_content,
+        template_path=TEMPLATE_DIR,
+        contract_class_name="MyContract",
+    )
+    buffer = io.StringIO()
+
+    generator.generate_to(buffer)
+
+    assert buffer.getvalue() == generator.generate()
+    assert len(list(generator.iter_generate())) > 1
+
+
+def test_py_contract_codegen_generate_file_with_invalid_abi(tmp_path):
+    out_file = tmp_path / "contract.py"
+    out_file.write_text("previous")
+    generator = ContractCodeGenerator(
+        abi_content="invalid json content",
+        template_path=TEMPLATE_DIR,
+    )
+
+    with pytest.raises(InvalidJSONError):
+        generator.generate_file(out_file)
+    assert out_file.read_text() == "previous"
+    assert list(tmp_path.iterdir()) == [out_file]
+
+
+def test_py_contract_codegen_generate_file_with_template_without_macros(tmp_path):
+    template_dir = tmp_path / "template"
+    template_dir.mkdir()
+    (template_dir / "contract.web3_v7.jinja2").write_text(
+        "class {{ contract_class_name }}: ...\n"
+    )
+    out_file = tmp_path / "contract.py"
+    generator = ContractCodeGenerator(
+        abi_content="[]", template_path=template_dir, contract_class_name="MyContract"
+    )
+
+    assert generator.iter_segments() is None
+    assert generator.generate_file(out_file)
+    assert generator.last_write is None
+    assert out_file.read_text() == "class MyContract: ..."
+
+
+def test_py_contract_codegen_cache_key_with_modified_template(tmp_path):
+    template_dir = tmp_path / "template"
+    template_dir.mkdir()
+    template = template_dir / "contract.web3_v7.jinja2"
+    template.write_text("class {{ contract_class_name }}: ...\n")
+    os.utime(template, ns=(0, 0))
+    generator = ContractCodeGenerator(
+        abi_content="[]", template_path=template_dir, contract_class_name="MyContract"
+    )
+    key = generator.cache_key()
+    assert generator.cache_key() == key
+
+    template.write_text("class {{ contract_class_name }}:\n    pass\n")
+
+    assert generator.cache_key() != key
+
+
+@pytest.mark.parametrize("backend", list(Backend))
+@pytest.mark.parametrize("target_lib", list(TargetLib))
+def test_py_contract_codegen_generate_file_with_runtime(tmp_path, backend, target_lib):
+    abi = [
+        {
+            "type": "function",
+            "name": "transfer",
+            "inputs": [
+                {"name": "to", "type": "address"},
+                {"name": "value", "type": "uint256"},
+            ],
+            "outputs": [{"name": "", "type": "bool"}],
+            "stateMutability": "nonpayable",
+        },
+        {
+            "type": "event",
+            "name": "Transfer",
+            "inputs": [{"name": "from", "type": "address", "indexed": True}],
+            "anonymous": False,
+        },
+    ]
+    out_file = tmp_path / "token.py"
+    ContractCodeGenerator(
+        abi_content=json.dumps(abi),
+        template_path=TEMPLATE_DIR,
+        contract_class_name="Token",
+        target_lib=target_lib,
+        backend=backend,
+        runtime=True,
+    ).generate_file(out_file)
+    module = import_path(out_file)
+
+    assert "get_logs(" not in out_file.read_text()
+    assert issubclass(module.Token, ContractBase)
+    token = module.Token(ADDRESS, Web3())
+    assert token.contract.abi == abi
+    function = token.transfer(ADDRESS, 1)
+    assert (function.fn_name, function.args) == ("transfer", (ADDRESS, 1))
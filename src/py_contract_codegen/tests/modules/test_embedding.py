@@ -0,0 +1,95 @@
+import json
+from pathlib import Path
+
+import pytest
+from conftest import ADDRESS, SAMPLE_ABI, TEMPLATE_DIR, import_path
+from web3 import Web3
+
+from py_contract_codegen.modules.cache import GenerationCache
+from py_contract_codegen.modules.code_generator import ContractCodeGenerator
+from py_contract_codegen.modules.embedding import (
+    embedded_content,
+    minify_abi,
+    sidecar_path,
+)
+from py_contract_codegen.modules.enums import ABIEmbedding, Backend, TargetLib
+
+
+def test_minify_abi():
+    assert minify_abi([{"type": "function", "inputs": []}]) == (
+        '[{"type":"function","inputs":[]}]'
+    )
+
+
+def test_sidecar_path():
+    assert sidecar_path(Path("out/token.py")) == Path("out/token.abi.json")
+
+
+def test_embedded_content():
+    assert embedded_content(SAMPLE_ABI, ABIEmbedding.json) == repr(
+        minify_abi(SAMPLE_ABI)
+    )
+    assert embedded_content(SAMPLE_ABI, ABIEmbedding.sidecar) == ""
+
+
+@pytest.mark.parametrize("backend", list(Backend))
+@pytest.mark.parametrize("target_lib", list(TargetLib))
+@pytest.mark.parametrize("abi_embedding", [ABIEmbedding.json, ABIEmbedding.sidecar])
+def test_generate_file_decodes_abi_on_first_use(
+    tmp_path, backend, target_lib, abi_embedding
+):
+    out_file = tmp_path / "token.py"
+    ContractCodeGenerator(
+        abi_content=json.dumps(SAMPLE_ABI),
+        template_path=TEMPLATE_DIR,
+        contract_class_name="Token",
+        target_lib=target_lib,
+        backend=backend,
+        abi_embedding=abi_embedding,
+    ).generate_file(out_file)
+
+    assert sidecar_path(out_file).exists() == (abi_embedding == ABIEmbedding.sidecar)
+    source = out_file.read_text()
+    assert "\nABI = " not in source
+    module = import_path(out_file)
+    assert "ABI" not in vars(module)
+    assert module.ABI == SAMPLE_ABI
+    token = module.Token(ADDRESS, Web3())
+    assert token.contract.abi == SAMPLE_ABI
+
+
+@pytest.mark.parametrize("abi_embedding", [ABIEmbedding.json, ABIEmbedding.sidecar])
+def test_backends_embed_abi_alike(abi_embedding):
+    pytest.importorskip("black")
+
+    def generate(backend: Backend, format_output: bool) -> str:
+        return ContractCodeGenerator(
+            abi_content=json.dumps(SAMPLE_ABI),
+            template_path=TEMPLATE_DIR,
+            backend=backend,
+            format_output=format_output,
+            abi_embedding=abi_embedding,
+        ).generate()
+
+    assert generate(Backend.jinja, True) == generate(Backend.ast, False)
+
+
+def test_generate_file_rewrites_missing_sidecar(tmp_path):
+    out_file = tmp_path / "token.py"
+    cache = GenerationCache(tmp_path / "cache")
+
+    def generate(abi_embedding: ABIEmbedding) -> bool:
+        return ContractCodeGenerator(
+            abi_content=json.dumps(SAMPLE_ABI),
+            template_path=TEMPLATE_DIR,
+            abi_embedding=abi_embedding,
+        ).generate_file(out_file, cache=cache)
+
+    assert generate(ABIEmbedding.sidecar)
+    assert not generate(ABIEmbedding.sidecar)
+    sidecar_path(out_file).unlink()
+    assert generate(ABIEmbedding.sidecar)
+    assert json.loads(sidecar_path(out_file).read_text()) == SAMPLE_ABI
+    # another embedding is another output
+    assert generate(ABIEmbedding.literal)
+    assert "\nABI = [" in out_file.read_text()
@@ -0,0 +1,108 @@
+import ast
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from conftest import TEMPLATE_DIR, function_abi
+
+from py_contract_codegen.modules import formatting
+from py_contract_codegen.modules.cache import GenerationCache
+from py_contract_codegen.modules.code_generator import ContractCodeGenerator
+from py_contract_codegen.modules.enums import Backend
+from py_contract_codegen.modules.exceptions import FormatterNotInstalledError
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent.parent
+GENERATED_DIR = PACKAGE_DIR / "generated" / "contract"
+
+
+@pytest.fixture
+def without_black(monkeypatch):
+    formatting.load_formatter.cache_clear()
+    monkeypatch.setitem(sys.modules, "black", None)
+    yield
+    formatting.load_formatter.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "path", sorted(GENERATED_DIR.glob("*.py")), ids=lambda p: p.stem
+)
+def test_format_output_matches_generated_examples(path):
+    pytest.importorskip("black")
+    code = path.read_text()
+    module = ast.parse(code)
+    abi = next(
+        ast.literal_eval(node.value)
+        for node in module.body
+        if isinstance(node, ast.Assign) and node.targets[0].id == "ABI"  # type: ignore[attr-defined]
+    )
+    class_name = next(
+        node.name for node in module.body if isinstance(node, ast.ClassDef)
+    )
+    generator = ContractCodeGenerator(
+        abi_content=json.dumps(abi),
+        template_path=TEMPLATE_DIR,
+        contract_class_name=class_name,
+        format_output=True,
+    )
+
+    assert generator.generate() == code
+    assert formatting.format_module(code) == code
+
+
+def test_format_output_reuses_formatted_segments(tmp_path):
+    pytest.importorskip("black")
+    out_file = tmp_path / "contract.py"
+    abi = [function_abi(f"function{i}") for i in range(3)]
+
+    def generate_file(format_output: bool) -> ContractCodeGenerator:
+        generator = ContractCodeGenerator(
+            abi_content=json.dumps(abi),
+            template_path=TEMPLATE_DIR,
+            format_output=format_output,
+        )
+        generator.generate_file(out_file, cache=GenerationCache(tmp_path / "cache"))
+        return generator
+
+    generate_file(False)
+    generator = generate_file(True)
+    assert generator.last_write is not None
+    assert generator.last_write.reused == 0
+    assert out_file.read_text() == generator.generate()
+
+    abi.append(function_abi("added"))
+    generator = generate_file(True)
+    assert generator.last_write is not None
+    assert (generator.last_write.rendered, generator.last_write.reused) == (2, 3)
+    assert out_file.read_text() == generator.generate()
+
+
+def test_format_output_without_black(without_black):
+    with pytest.raises(FormatterNotInstalledError):
+        ContractCodeGenerator(
+            abi_content="[]", template_path=TEMPLATE_DIR, format_output=True
+        )
+
+
+def test_format_output_with_view_function_without_outputs():
+    pytest.importorskip("black")
+    abi = [{**function_abi("ping"), "inputs": [], "outputs": []}]
+
+    code = ContractCodeGenerator(
+        abi_content=json.dumps(abi), template_path=TEMPLATE_DIR, format_output=True
+    ).generate()
+
+    assert "def ping(self) -> tuple[()]:" in code
+
+
+def test_format_output_with_ast_backend():
+    pytest.importorskip("black")
+    generator = ContractCodeGenerator(
+        abi_content=json.dumps([function_abi("balanceOf")]),
+        template_path=TEMPLATE_DIR,
+        backend=Backend.ast,
+        format_output=True,
+    )
+
+    assert generator.formatter is not None
+    assert generator.generate() == formatting.format_module(generator.generate())
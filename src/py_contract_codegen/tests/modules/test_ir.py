@@ -0,0 +1,101 @@
+import json
+from unittest.mock import patch
+
+from conftest import TEMPLATE_DIR
+
+from py_contract_codegen.modules.abi import ABIParser
+from py_contract_codegen.modules.code_generator import (
+    ContractCodeGenerator,
+    generate_targets,
+    target_out_file,
+)
+from py_contract_codegen.modules.enums import TargetLib
+from py_contract_codegen.modules.ir import (
+    IR_CACHE_DIR_NAME,
+    ContractIR,
+    ir_cache_key,
+    load_ir,
+)
+from py_contract_codegen.modules.options import GenerateOptions
+
+ABI = json.dumps(
+    [
+        {
+            "type": "function",
+            "name": "balanceOf",
+            "inputs": [{"name": "owner", "type": "address"}],
+            "outputs": [{"name": "", "type": "uint256"}],
+            "stateMutability": "view",
+        },
+        {"type": "event", "name": "Transfer", "inputs": []},
+        {"type": "constructor", "inputs": []},
+        {"type": "receive", "stateMutability": "payable"},
+        {"type": "error", "name": "Unauthorized", "inputs": []},
+    ]
+)
+
+
+def test_contract_ir_round_trips_through_json():
+    ir = ContractIR.from_abi(ABI)
+
+    assert ContractIR.from_json(ir.to_json()) == ir
+    assert ir.functions[0]["converted_inputs"][0]["python_type"] == "ChecksumAddress"
+
+
+def test_contract_ir_render_view_matches_parser():
+    assert ContractIR.from_abi(ABI).render_view() == ABIParser(abi=ABI).render_view()
+
+
+def test_ir_cache_key_uses_raw_content():
+    assert ir_cache_key(ABI) == ir_cache_key(ABI)
+    assert ir_cache_key(ABI) != ir_cache_key(ABI + " ")
+
+
+def test_load_ir_parses_once(tmp_path):
+    with patch.object(ContractIR, "from_abi", wraps=ContractIR.from_abi) as from_abi:
+        ir = load_ir(ABI, tmp_path)
+        assert load_ir(ABI, tmp_path) == ir
+        assert from_abi.call_count == 1
+    assert (tmp_path / IR_CACHE_DIR_NAME / f"{ir_cache_key(ABI)}.json").exists()
+
+
+def test_load_ir_ignores_corrupt_cache(tmp_path):
+    ir_path = tmp_path / IR_CACHE_DIR_NAME / f"{ir_cache_key(ABI)}.json"
+    ir_path.parent.mkdir()
+    ir_path.write_text("{")
+
+    assert load_ir(ABI, tmp_path) == ContractIR.from_abi(ABI)
+
+
+def test_generate_targets_parses_once(tmp_path):
+    out_file = tmp_path / "token.py"
+    target_libs = (TargetLib.web3_v7, TargetLib.web3_v6)
+    options = GenerateOptions(template_path=TEMPLATE_DIR, target_libs=target_libs)
+
+    with patch.object(ContractIR, "from_abi", wraps=ContractIR.from_abi) as from_abi:
+        assert generate_targets(ABI, "Token", out_file, options)
+        assert from_abi.call_count == 1
+
+    for target_lib in target_libs:
+        code = target_out_file(out_file, target_lib).read_text()
+        expected = ContractCodeGenerator(
+            abi_content=ABI,
+            template_path=TEMPLATE_DIR,
+            contract_class_name="Token",
+            target_lib=target_lib,
+        ).generate()
+        assert code.startswith(expected)
+    assert not out_file.exists()
+
+
+def test_generate_targets_with_cache(tmp_path):
+    out_file = tmp_path / "token.py"
+    options = GenerateOptions(template_path=TEMPLATE_DIR, cache_dir=tmp_path / "cache")
+
+    assert generate_targets(ABI, "Token", out_file, options)
+    out_file.unlink()
+    # the output is regenerated from the cached IR
+    with patch.object(ContractIR, "from_abi") as from_abi:
+        assert generate_targets(ABI, "Token", out_file, options)
+        from_abi.assert_not_called()
+    assert not generate_targets(ABI, "Token", out_file, options)
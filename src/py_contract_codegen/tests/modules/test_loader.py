@@ -0,0 +1,98 @@
+import json
+
+import pytest
+from conftest import ADDRESS, SAMPLE_ABI
+from web3 import Web3
+
+from py_contract_codegen.modules import loader
+from py_contract_codegen.modules.code_generator import ContractCodeGenerator
+from py_contract_codegen.modules.enums import TargetLib
+from py_contract_codegen.modules.loader import (
+    CODE_CACHE_DIR_NAME,
+    LOADED_MODULE_NAME,
+    clear_loaded_contracts,
+    load_contract,
+)
+
+
+@pytest.fixture(autouse=True)
+def loaded_contracts():
+    clear_loaded_contracts()
+    yield
+    clear_loaded_contracts()
+
+
+def test_load_contract():
+    token_class = load_contract(SAMPLE_ABI, "Token")
+
+    token = token_class(ADDRESS, Web3())
+
+    assert token_class.__name__ == "Token"
+    assert token_class.__module__ == LOADED_MODULE_NAME
+    assert token.transfer(ADDRESS, 1).fn_name == "transfer"
+
+
+def test_load_contract_returns_loaded_class():
+    token_class = load_contract(SAMPLE_ABI, "Token")
+
+    assert load_contract(json.dumps(SAMPLE_ABI), "Token") is token_class
+    assert load_contract(json.dumps(SAMPLE_ABI, indent=2), "Token") is token_class
+    assert load_contract(SAMPLE_ABI, "Other") is not token_class
+    assert load_contract(SAMPLE_ABI, "Token", TargetLib.web3_v6) is not token_class
+
+
+def test_load_contract_again_skips_hashing(monkeypatch):
+    abi_json = json.dumps(SAMPLE_ABI)
+    token_class = load_contract(abi_json, "Token")
+    load_contract(SAMPLE_ABI, "Token")
+
+    def code_key(generator):
+        raise AssertionError("the ABI should not be hashed again")
+
+    monkeypatch.setattr(loader, "_code_key", code_key)
+
+    assert load_contract(json.dumps(SAMPLE_ABI), "Token") is token_class
+    assert load_contract(SAMPLE_ABI, "Token") is token_class
+    with pytest.raises(AssertionError):
+        # another list is hashed, even with the same content
+        load_contract(list(SAMPLE_ABI), "Token")
+
+
+def test_load_contract_evicts_first_loaded(monkeypatch):
+    monkeypatch.setattr(loader, "MAX_LOADED_CONTRACTS", 2)
+    first = load_contract(SAMPLE_ABI, "First")
+    load_contract(SAMPLE_ABI, "Second")
+    load_contract(SAMPLE_ABI, "Third")
+
+    assert len(loader._loaded) == 2
+    assert load_contract(SAMPLE_ABI, "First") is not first
+
+
+def test_load_contract_with_cache_dir(tmp_path, monkeypatch):
+    token_class = load_contract(SAMPLE_ABI, "Token", cache_dir=tmp_path)
+    assert len(list((tmp_path / CODE_CACHE_DIR_NAME).iterdir())) == 1
+    clear_loaded_contracts()
+
+    def generate(self):
+        raise AssertionError("code should be loaded from the cache")
+
+    monkeypatch.setattr(ContractCodeGenerator, "generate", generate)
+    cached_class = load_contract(SAMPLE_ABI, "Token", cache_dir=tmp_path)
+
+    assert cached_class is not token_class
+    assert cached_class(ADDRESS, Web3()).transfer(ADDRESS, 1).fn_name == "transfer"
+
+
+def test_load_contract_with_corrupted_cache(tmp_path):
+    load_contract(SAMPLE_ABI, "Token", cache_dir=tmp_path)
+    clear_loaded_contracts()
+    for path in (tmp_path / CODE_CACHE_DIR_NAME).iterdir():
+        path.write_bytes(b"corrupted")
+
+    assert load_contract(SAMPLE_ABI, "Token", cache_dir=tmp_path).__name__ == "Token"
+
+
+@pytest.mark.parametrize("class_name", ["not a class name", "class", "None"])
+def test_load_contract_with_invalid_class_name(class_name):
+    with pytest.raises(ValueError):
+        load_contract(SAMPLE_ABI, class_name)
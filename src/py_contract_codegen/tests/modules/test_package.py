@@ -0,0 +1,194 @@
+import importlib
+import json
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+from conftest import TEMPLATE_DIR
+
+from py_contract_codegen.modules.artifacts import collect_jobs_from_artifacts
+from py_contract_codegen.modules.batch import BatchJob
+from py_contract_codegen.modules.enums import ArtifactFormat
+from py_contract_codegen.modules.options import GenerateOptions
+from py_contract_codegen.modules.package import (
+    ABI_MODULE_PREFIX,
+    PACKAGE_INIT,
+    abi_digest,
+    generate_package,
+    group_jobs,
+)
+from py_contract_codegen.modules.pruning import MemberFilter
+
+OPTIONS = GenerateOptions(template_path=TEMPLATE_DIR)
+
+TOKEN_ABI = [
+    {
+        "type": "function",
+        "name": "balanceOf",
+        "inputs": [{"name": "owner", "type": "address"}],
+        "outputs": [{"name": "", "type": "uint256"}],
+        "stateMutability": "view",
+    }
+]
+VAULT_ABI = [
+    {
+        "type": "function",
+        "name": "deposit",
+        "inputs": [{"name": "amount", "type": "uint256"}],
+        "outputs": [],
+        "stateMutability": "nonpayable",
+    }
+]
+
+
+@pytest.fixture
+def import_package(monkeypatch):
+    imported = []
+
+    def import_package(package_dir: Path):
+        monkeypatch.syspath_prepend(str(package_dir.parent))
+        importlib.invalidate_caches()
+        imported.append(package_dir.name)
+        return importlib.import_module(package_dir.name)
+
+    yield import_package
+    for name in list(sys.modules):
+        if name.split(".")[0] in imported:
+            del sys.modules[name]
+
+
+def _job(tmp_path: Path, class_name: str, abi_content: str) -> BatchJob:
+    abi_path = tmp_path / f"{class_name}.json"
+    abi_path.write_text(abi_content)
+    return BatchJob(
+        abi_path=abi_path,
+        out_file=tmp_path / f"{class_name}.py",
+        contract_class_name=class_name,
+    )
+
+
+def test_abi_digest_ignores_formatting():
+    assert abi_digest(json.dumps(TOKEN_ABI)) == abi_digest(
+        json.dumps(TOKEN_ABI, indent=2, sort_keys=True)
+    )
+    assert abi_digest(json.dumps(TOKEN_ABI)) != abi_digest(json.dumps(VAULT_ABI))
+
+
+def test_group_jobs(tmp_path):
+    jobs = [
+        _job(tmp_path, "UsdcContract", json.dumps(TOKEN_ABI)),
+        _job(tmp_path, "VaultContract", json.dumps(VAULT_ABI)),
+        _job(tmp_path, "DaiContract", json.dumps(TOKEN_ABI, indent=2)),
+        _job(tmp_path, "BrokenContract", "invalid json content"),
+        BatchJob(
+            abi_path=tmp_path / "other.json",
+            out_file=tmp_path / "other.py",
+            contract_class_name="UsdcContract",
+        ),
+    ]
+
+    modules, failures = group_jobs(jobs)
+
+    assert sorted([j.contract_class_name for j in m.jobs] for m in modules) == [
+        ["DaiContract", "UsdcContract"],
+        ["VaultContract"],
+    ]
+    assert all(m.name.startswith(ABI_MODULE_PREFIX) for m in modules)
+    assert sorted(failures) == [3, 4]
+    assert "Invalid JSON" in failures[3].error
+    assert "Duplicate class name UsdcContract" in failures[4].error
+
+
+def test_generate_package(tmp_path, import_package):
+    package_dir = tmp_path / "contracts"
+    jobs = [
+        _job(tmp_path, "UsdcContract", json.dumps(TOKEN_ABI)),
+        _job(tmp_path, "VaultContract", json.dumps(VAULT_ABI)),
+        _job(tmp_path, "DaiContract", json.dumps(TOKEN_ABI, indent=2)),
+        _job(tmp_path, "BrokenContract", "invalid json content"),
+    ]
+
+    results = generate_package(jobs, package_dir, OPTIONS, max_workers=1)
+
+    assert [r.job for r in results] == jobs
+    assert [r.ok for r in results] == [True, True, True, False]
+    assert len(list(package_dir.glob(f"{ABI_MODULE_PREFIX}*.py"))) == 2
+    package = import_package(package_dir)
+    assert package.UsdcContract is package.DaiContract
+    assert package.DaiContract.__name__ == "DaiContract"
+    assert package.VaultContract is not package.DaiContract
+    assert package.__all__ == ["DaiContract", "UsdcContract", "VaultContract"]
+
+
+def test_generate_package_from_artifacts_with_member_filter(tmp_path, import_package):
+    # the modules are generated from the ABIs inside the solc output, filtered in the workers
+    output_file = tmp_path / "solc-output.json"
+    output_file.write_text(
+        json.dumps(
+            {
+                "contracts": {
+                    "src/Token.sol": {"Token": {"abi": TOKEN_ABI + VAULT_ABI}},
+                    "src/Vault.sol": {"Vault": {"abi": VAULT_ABI}},
+                }
+            }
+        )
+    )
+    package_dir = tmp_path / "artifact_contracts"
+    jobs = collect_jobs_from_artifacts(output_file, ArtifactFormat.solc, package_dir)
+
+    results = generate_package(
+        jobs,
+        package_dir,
+        replace(OPTIONS, member_filter=MemberFilter(exclude=("deposit",))),
+        max_workers=1,
+    )
+
+    assert [r.ok for r in results] == [True, True]
+    package = import_package(package_dir)
+    assert hasattr(package.TokenContract, "balanceOf")
+    assert not hasattr(package.TokenContract, "deposit")
+    assert not hasattr(package.VaultContract, "deposit")
+
+
+def test_generate_package_imports_contracts_lazily(tmp_path, import_package):
+    package_dir = tmp_path / "lazy_contracts"
+    jobs = [
+        _job(tmp_path, "UsdcContract", json.dumps(TOKEN_ABI)),
+        _job(tmp_path, "VaultContract", json.dumps(VAULT_ABI)),
+    ]
+    generate_package(jobs, package_dir, OPTIONS, max_workers=1)
+    token_module = (
+        f"lazy_contracts.{ABI_MODULE_PREFIX}{abi_digest(json.dumps(TOKEN_ABI))}"
+    )
+    vault_module = (
+        f"lazy_contracts.{ABI_MODULE_PREFIX}{abi_digest(json.dumps(VAULT_ABI))}"
+    )
+
+    package = import_package(package_dir)
+    assert token_module not in sys.modules
+    assert "UsdcContract" in dir(package)
+
+    from lazy_contracts import UsdcContract  # type: ignore[import-not-found]
+
+    assert UsdcContract.__name__ == "UsdcContract"
+    assert token_module in sys.modules
+    assert vault_module not in sys.modules
+    assert not hasattr(package, "MissingContract")
+
+
+def test_generate_package_removes_unused_modules(tmp_path):
+    package_dir = tmp_path / "contracts"
+    token_job = _job(tmp_path, "UsdcContract", json.dumps(TOKEN_ABI))
+    vault_job = _job(tmp_path, "VaultContract", json.dumps(VAULT_ABI))
+    generate_package([token_job, vault_job], package_dir, OPTIONS, max_workers=1)
+    init_content = (package_dir / PACKAGE_INIT).read_text()
+
+    results = generate_package([token_job], package_dir, OPTIONS, max_workers=1)
+
+    assert [r.ok for r in results] == [True]
+    assert [p.name for p in package_dir.glob(f"{ABI_MODULE_PREFIX}*.py")] == [
+        f"{ABI_MODULE_PREFIX}{abi_digest(json.dumps(TOKEN_ABI))}.py"
+    ]
+    assert "VaultContract" in init_content
+    assert "VaultContract" not in (package_dir / PACKAGE_INIT).read_text()
@@ -0,0 +1,124 @@
+import tracemalloc
+
+import pytest
+from conftest import SAMPLE_ABI_JSON, TEMPLATE_DIR
+
+from py_contract_codegen.modules.cache import GenerationCache
+from py_contract_codegen.modules.code_generator import ContractCodeGenerator
+from py_contract_codegen.modules.profiling import (
+    Profiler,
+    abi_stats,
+    merge_reports,
+    profile_report,
+    profile_stage,
+    profiled,
+)
+
+
+def test_profile_stage_without_profiler():
+    with profile_stage("render"):
+        pass
+    assert profiled(len, "write") is len
+
+
+def test_profiler_excludes_nested_stages():
+    profiler = Profiler().start()
+    try:
+        with profile_stage("outer"):
+            data = bytearray(1_000_000)
+            with profile_stage("inner"):
+                inner = bytearray(2_000_000)
+            del data, inner
+        write = profiled(len, "write")
+        assert write("abc") == 3
+        write("de")
+    finally:
+        profiler.stop()
+
+    assert not tracemalloc.is_tracing()
+    report = profiler.report()
+    stages = report["stages"]
+    assert stages["outer"]["calls"] == stages["inner"]["calls"] == 1
+    assert stages["write"]["calls"] == 2
+    assert stages["inner"]["peak_memory"] >= 2_000_000
+    assert 1_000_000 <= stages["outer"]["peak_memory"] < 2_000_000
+    assert report["peak_memory"] >= stages["inner"]["peak_memory"]
+    assert sum(s["wall_time"] for s in stages.values()) <= report["wall_time"]
+
+
+def test_profiler_without_memory():
+    profiler = Profiler(trace_memory=False).start()
+    with profile_stage("render"):
+        pass
+    profiler.stop()
+
+    assert not tracemalloc.is_tracing()
+    report = profiler.report()
+    assert report["peak_memory"] is None
+    assert report["stages"]["render"]["peak_memory"] is None
+
+
+def test_abi_stats():
+    assert abi_stats(SAMPLE_ABI_JSON) == {
+        "bytes": len(SAMPLE_ABI_JSON),
+        "entries": 3,
+        "functions": 2,
+        "events": 1,
+        "parameters": 6,
+    }
+    assert abi_stats("not json") == {"bytes": 8}
+
+
+def test_merge_reports():
+    def report(wall_time: float, peak_memory: int | None) -> dict:
+        stats = {"wall_time": wall_time, "peak_memory": peak_memory, "calls": 1}
+        return {
+            "wall_time": wall_time,
+            "peak_memory": peak_memory,
+            "stages": {"render": stats},
+            "abi": {"bytes": 10},
+        }
+
+    merged = merge_reports([report(0.5, 100), report(0.25, 300), report(0.25, None)])
+
+    assert merged["wall_time"] == 1.0
+    assert merged["peak_memory"] == 300
+    assert merged["stages"]["render"] == {
+        "wall_time": 1.0,
+        "peak_memory": 300,
+        "calls": 3,
+    }
+    assert merged["abi"] == {"bytes": 30}
+
+
+@pytest.mark.parametrize("stub", [False, True])
+def test_profile_generate_file(tmp_path, stub):
+    out_file = tmp_path / "token.py"
+    cache = GenerationCache(tmp_path / "cache")
+
+    def generate() -> dict:
+        profiler = Profiler().start()
+        try:
+            ContractCodeGenerator(
+                abi_content=SAMPLE_ABI_JSON, template_path=TEMPLATE_DIR, stub=stub
+            ).generate_file(out_file, cache=cache)
+        finally:
+            profiler.stop()
+        return profile_report(profiler, SAMPLE_ABI_JSON)
+
+    report = generate()
+    assert set(report["stages"]) >= {
+        "setup",
+        "cache",
+        "ir_cache",
+        "validate",
+        "parse",
+        "convert_types",
+        "render_view",
+        "render",
+        "write",
+    }
+    assert report["stages"]["convert_types"]["calls"] == 5
+    assert report["abi"]["functions"] == 2
+    # up to date, so only checked against the cache
+    assert set(generate()["stages"]) == {"setup", "cache"}
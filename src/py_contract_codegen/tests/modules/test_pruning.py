@@ -0,0 +1,131 @@
+import json
+
+import pytest
+from py_contract_codegen.modules.exceptions import InvalidJSONError
+from py_contract_codegen.modules.pruning import (
+    MemberFilter,
+    collect_used_names,
+    member_selector,
+    member_signature,
+)
+
+ABI = [
+    {"type": "constructor", "inputs": [], "stateMutability": "nonpayable"},
+    {
+        "type": "function",
+        "name": "transfer",
+        "inputs": [
+            {"name": "to", "type": "address"},
+            {"name": "value", "type": "uint256"},
+        ],
+        "outputs": [{"name": "", "type": "bool"}],
+        "stateMutability": "nonpayable",
+    },
+    {
+        "type": "function",
+        "name": "balanceOf",
+        "inputs": [{"name": "owner", "type": "address"}],
+        "outputs": [{"name": "", "type": "uint256"}],
+        "stateMutability": "view",
+    },
+    {
+        "type": "function",
+        "name": "swap",
+        "inputs": [
+            {
+                "name": "params",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "token", "type": "address"},
+                    {"name": "amounts", "type": "uint256[2]"},
+                ],
+            }
+        ],
+        "outputs": [],
+        "stateMutability": "nonpayable",
+    },
+    {
+        "type": "event",
+        "name": "Transfer",
+        "anonymous": False,
+        "inputs": [
+            {"name": "from", "type": "address", "indexed": True},
+            {"name": "to", "type": "address", "indexed": True},
+            {"name": "value", "type": "uint256", "indexed": False},
+        ],
+    },
+]
+
+
+def _names(member_filter: MemberFilter) -> list[str]:
+    abi = json.loads(member_filter.apply(json.dumps(ABI)))
+    return [entry.get("name", entry["type"]) for entry in abi]
+
+
+def test_member_signature_and_selector():
+    assert member_signature(ABI[1]) == "transfer(address,uint256)"
+    assert member_signature(ABI[3]) == "swap((address,uint256[2])[])"
+    assert member_selector(ABI[1]) == "0xa9059cbb"
+    assert member_selector(ABI[4]) == (
+        "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+    )
+
+
+@pytest.mark.parametrize(
+    "member_filter, expected",
+    [
+        (MemberFilter(), ["constructor", "transfer", "balanceOf", "swap", "Transfer"]),
+        (MemberFilter(include=("balanceOf",)), ["constructor", "balanceOf"]),
+        (
+            MemberFilter(
+                include=(
+                    "transfer(address,uint256)",
+                    "0xDDF252AD"
+                    + "1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef",
+                )
+            ),
+            ["constructor", "transfer", "Transfer"],
+        ),
+        (
+            MemberFilter(exclude=("0xa9059cbb", "swap")),
+            ["constructor", "balanceOf", "Transfer"],
+        ),
+        (
+            MemberFilter(used_names=frozenset({"balanceOf", "get_event_Transfer"})),
+            ["constructor", "balanceOf", "Transfer"],
+        ),
+        (
+            MemberFilter(
+                include=("swap",),
+                exclude=("Transfer",),
+                used_names=frozenset({"get_event_Transfer"}),
+            ),
+            ["constructor", "swap"],
+        ),
+    ],
+)
+def test_member_filter(member_filter, expected):
+    assert _names(member_filter) == expected
+
+
+def test_member_filter_keeps_content_when_nothing_is_dropped():
+    content = json.dumps(ABI, indent=2)
+
+    assert MemberFilter(exclude=("missing",)).apply(content) is content
+
+
+def test_member_filter_with_invalid_json():
+    with pytest.raises(InvalidJSONError):
+        MemberFilter(include=("transfer",)).apply("invalid json content")
+
+
+def test_collect_used_names(tmp_path):
+    (tmp_path / "bot.py").write_text(
+        "def run(token):\n    return token.balanceOf(owner), token.get_event_Transfer()\n"
+    )
+    (tmp_path / "generated").mkdir()
+    (tmp_path / "generated" / "token.py").write_text(
+        "# Autogenerated file.\nx.transfer()\n"
+    )
+
+    assert collect_used_names([tmp_path]) == {"balanceOf", "get_event_Transfer"}
@@ -0,0 +1,147 @@
+import json
+import os
+import socket
+import stat
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+from conftest import SAMPLE_ABI_JSON
+
+from py_contract_codegen.modules.client import (
+    default_socket_path,
+    is_daemon_running,
+    is_own_socket,
+    request_generation,
+)
+from py_contract_codegen.modules.exceptions import DaemonError
+from py_contract_codegen.modules.server import create_server, handle_request
+
+
+@pytest.fixture
+def socket_path():
+    # AF_UNIX paths are limited to ~100 bytes, pytest's tmp_path may be longer
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        yield Path(tmp_dir) / "codegen.sock"
+
+
+@pytest.fixture
+def daemon(socket_path):
+    server = create_server(socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield socket_path
+    server.shutdown()
+    server.server_close()
+
+
+def test_handle_request_returns_code():
+    response = handle_request({"abi": SAMPLE_ABI_JSON, "class_name": "MyContract"})
+
+    assert response["ok"]
+    assert "class MyContract" in response["code"]
+
+
+def test_handle_request_writes_out_file(tmp_path):
+    out_file = tmp_path / "contract.py"
+    request = {
+        "abi": SAMPLE_ABI_JSON,
+        "out_file": str(out_file),
+        "cache_dir": str(tmp_path / "cache"),
+    }
+
+    assert handle_request(request) == {"ok": True, "generated": True}
+    assert "class GeneratedContract" in out_file.read_text()
+    assert handle_request(request) == {"ok": True, "generated": False}
+
+
+def test_handle_request_with_embedded_abi_and_id():
+    response = handle_request({"abi": json.loads(SAMPLE_ABI_JSON), "id": 7})
+
+    assert response["ok"]
+    assert response["id"] == 7
+    assert "class GeneratedContract" in response["code"]
+
+
+@pytest.mark.parametrize(
+    "request_",
+    [{}, {"abi": "invalid json content"}, {"abi": SAMPLE_ABI_JSON, "target_lib": "x"}],
+)
+def test_handle_request_with_error(request_):
+    response = handle_request(request_)
+
+    assert not response["ok"]
+    assert response["error"]
+
+
+def test_request_generation(daemon):
+    assert is_daemon_running(daemon)
+
+    response = request_generation(
+        daemon,
+        {"abi": SAMPLE_ABI_JSON, "class_name": "MyContract", "target_lib": "web3_v6"},
+    )
+
+    assert "class MyContract" in response["code"]
+
+
+def test_request_generation_with_error(daemon):
+    with pytest.raises(DaemonError, match="Invalid JSON"):
+        request_generation(daemon, {"abi": "invalid json content"})
+
+
+def test_daemon_handles_many_requests_per_connection(daemon):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(daemon))
+        sock.sendall(
+            b"not json\n" + json.dumps({"abi": SAMPLE_ABI_JSON}).encode() + b"\n"
+        )
+        sock.shutdown(socket.SHUT_WR)
+        with sock.makefile("rb") as f:
+            responses = [json.loads(line) for line in f]
+
+    assert [r["ok"] for r in responses] == [False, True]
+
+
+def test_create_server_when_already_running(daemon):
+    with pytest.raises(DaemonError, match="already running"):
+        create_server(daemon)
+
+
+def test_is_daemon_running_without_daemon(socket_path):
+    assert not is_daemon_running(socket_path)
+    socket_path.write_text("stale")
+    assert not is_daemon_running(socket_path)
+
+
+def test_daemon_socket_is_private(daemon):
+    assert stat.S_IMODE(daemon.stat().st_mode) & 0o077 == 0
+    assert is_own_socket(daemon)
+
+
+def test_socket_accessible_to_other_users_is_not_trusted(daemon):
+    os.chmod(daemon, 0o777)
+
+    assert not is_own_socket(daemon)
+    assert not is_daemon_running(daemon)
+    with pytest.raises(DaemonError, match="not a codegen daemon socket"):
+        request_generation(daemon, {"abi": SAMPLE_ABI_JSON})
+
+
+def test_create_server_makes_private_directory(socket_path):
+    socket_path = socket_path.parent / "daemon" / "codegen.sock"
+
+    with create_server(socket_path):
+        assert stat.S_IMODE(socket_path.parent.stat().st_mode) == 0o700
+        assert is_daemon_running(socket_path)
+
+
+def test_default_socket_path(monkeypatch):
+    monkeypatch.setenv("XDG_RUNTIME_DIR", "/run/user/1000")
+    assert default_socket_path() == Path("/run/user/1000/py-contract-codegen.sock")
+
+    monkeypatch.delenv("XDG_RUNTIME_DIR")
+    path = default_socket_path()
+    assert path.parent.parent == Path(tempfile.gettempdir())
+    assert path.parent.name.startswith("py-contract-codegen-")
@@ -0,0 +1,37 @@
+import io
+import json
+
+from conftest import SAMPLE_ABI
+
+from py_contract_codegen.modules.stream import process_stream
+
+
+def test_process_stream():
+    lines = [
+        json.dumps({"id": 1, "abi": json.dumps(SAMPLE_ABI), "class_name": "Token"}),
+        "\n",
+        json.dumps({"id": 2, "abi": SAMPLE_ABI, "target_lib": "web3_v6"}),
+        "invalid json content",
+        json.dumps({"id": 3, "abi": "invalid json content"}),
+    ]
+    out = io.StringIO()
+
+    summary = process_stream(lines, out)
+
+    responses = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert (summary.requests, summary.failures) == (4, 2)
+    assert [r["ok"] for r in responses] == [True, True, False, False]
+    assert [r.get("id") for r in responses] == [1, 2, None, 3]
+    assert "class Token" in responses[0]["code"]
+    assert "fromBlock=from_block" not in responses[0]["code"]
+    assert "class GeneratedContract" in responses[1]["code"]
+    assert "Invalid JSON in request" in responses[2]["error"]
+
+
+def test_process_stream_with_no_requests():
+    out = io.StringIO()
+
+    summary = process_stream(["", "\n"], out)
+
+    assert (summary.requests, summary.failures) == (0, 0)
+    assert out.getvalue() == ""
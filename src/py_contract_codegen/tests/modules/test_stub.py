@@ -0,0 +1,109 @@
+import json
+
+import pytest
+from conftest import ADDRESS, SAMPLE_ABI, TEMPLATE_DIR, import_path
+from web3 import Web3
+
+from py_contract_codegen.modules.cache import GenerationCache
+from py_contract_codegen.modules.code_generator import ContractCodeGenerator
+from py_contract_codegen.modules.enums import ABIEmbedding, Backend, TargetLib
+from py_contract_codegen.modules.stub import (
+    METHODS_NAME,
+    render_runtime,
+    render_stub,
+    stub_path,
+)
+
+
+def _generate(**kwargs) -> str:
+    return ContractCodeGenerator(
+        abi_content=json.dumps(SAMPLE_ABI),
+        template_path=TEMPLATE_DIR,
+        contract_class_name="Token",
+        **kwargs,
+    ).generate()
+
+
+def test_render_stub():
+    stub = render_stub(_generate(), "Token")
+
+    assert "ABI: list[dict[str, Any]]\n" in stub
+    assert "    contract: Contract\n" in stub
+    assert "    def balanceOf(self, owner: ChecksumAddress) -> int: ...\n" in stub
+    assert ") -> Iterable[EventData]: ...\n" in stub
+    assert "return" not in stub
+    compile(stub, "token.pyi", "exec")
+
+
+def test_render_stub_declares_lazy_abi():
+    stub = render_stub(_generate(abi_embedding=ABIEmbedding.json), "Token")
+
+    assert "ABI_JSON: str\n" in stub
+    assert "ABI: list[dict[str, Any]]\n" in stub
+    assert "def load_abi() -> list[dict[str, Any]]: ...\n" in stub
+    assert "__getattr__" not in stub
+
+
+def test_render_runtime():
+    runtime = render_runtime(_generate(), "Token")
+
+    assert "    def balanceOf(" not in runtime
+    assert '    "balanceOf": "def balanceOf(' in runtime
+    assert "    def __init__(" in runtime
+    assert f"source = {METHODS_NAME}[name]" in runtime
+
+
+def test_render_runtime_without_class():
+    with pytest.raises(ValueError, match="no class"):
+        render_runtime("VALUE = 1\n", "Token")
+
+
+@pytest.mark.parametrize("backend", list(Backend))
+@pytest.mark.parametrize("target_lib", list(TargetLib))
+def test_generate_file_with_stub(tmp_path, backend, target_lib):
+    out_file = tmp_path / "token.py"
+    ContractCodeGenerator(
+        abi_content=json.dumps(SAMPLE_ABI),
+        template_path=TEMPLATE_DIR,
+        contract_class_name="Token",
+        target_lib=target_lib,
+        backend=backend,
+        stub=True,
+    ).generate_file(out_file)
+
+    assert stub_path(out_file).exists()
+    module = import_path(out_file)
+    assert "balanceOf" not in vars(module.Token)
+    token = module.Token(ADDRESS, Web3())
+    assert "transfer" in dir(token)
+
+    function = token.transfer(to=ADDRESS, value=1)
+    assert function.fn_name == "transfer"
+    assert function.args == (ADDRESS, 1)
+    # compiled once, then found on the class
+    assert "transfer" in vars(module.Token)
+    assert token.transfer.__qualname__ == "Token.transfer"
+    assert module.ABI == SAMPLE_ABI
+    with pytest.raises(AttributeError, match="no attribute 'nothing'"):
+        _ = token.nothing
+
+
+def test_generate_file_rewrites_missing_stub(tmp_path):
+    out_file = tmp_path / "token.py"
+    cache = GenerationCache(tmp_path / "cache")
+
+    def generate(stub: bool) -> bool:
+        return ContractCodeGenerator(
+            abi_content=json.dumps(SAMPLE_ABI),
+            template_path=TEMPLATE_DIR,
+            stub=stub,
+        ).generate_file(out_file, cache=cache)
+
+    assert generate(True)
+    assert not generate(True)
+    stub_path(out_file).unlink()
+    assert generate(True)
+    assert stub_path(out_file).exists()
+    # the module with every method is another output
+    assert generate(False)
+    assert "    def balanceOf(" in out_file.read_text()
@@ -0,0 +1,115 @@
+import json
+
+import jinja2
+from jinja2 import ChoiceLoader, Environment, FileSystemLoader
+
+from py_contract_codegen.modules import templates
+from py_contract_codegen.modules.enums import TargetLib
+from py_contract_codegen.modules.templates import (
+    TEMPLATE_PATH,
+    compile_templates,
+    compiled_metadata,
+    get_environment,
+    get_template,
+    get_template_name,
+    jinja_feature_release,
+    template_checksums,
+)
+
+CONTEXT = {
+    "formatted_content": "[]",
+    "contract_class_name": "MyContract",
+    "functions": [
+        {
+            "name": "balanceOf",
+            "stateMutability": "view",
+            "converted_inputs": [{"name": "owner", "python_type": "ChecksumAddress"}],
+            "converted_outputs": [{"name": "output_1", "python_type": "int"}],
+        }
+    ],
+    "events": [{"name": "Transfer"}],
+}
+
+
+def test_compiled_templates_are_up_to_date():
+    assert templates._compiled_templates_are_fresh(), (
+        "Precompiled templates are stale, "
+        "run `python -m py_contract_codegen.modules.templates`"
+    )
+
+
+def test_get_environment_uses_compiled_templates():
+    env = get_environment(TEMPLATE_PATH)
+
+    assert isinstance(env.loader, ChoiceLoader)
+    assert get_environment(TEMPLATE_PATH) is env
+
+
+def test_get_template_is_registered_once():
+    for target_lib in TargetLib:
+        assert get_template(TEMPLATE_PATH, target_lib) is get_template(
+            TEMPLATE_PATH, target_lib
+        )
+
+
+def test_compiled_templates_render_same_as_sources():
+    source_env = Environment(loader=FileSystemLoader(TEMPLATE_PATH))
+    for target_lib in TargetLib:
+        source_template = source_env.get_template(get_template_name(target_lib))
+        compiled_template = get_template(TEMPLATE_PATH, target_lib)
+        assert compiled_template.render(CONTEXT) == source_template.render(CONTEXT)
+
+
+def test_compile_templates(tmp_path):
+    compile_templates(TEMPLATE_PATH, tmp_path)
+
+    assert len(list(tmp_path.glob("tmpl_*.py"))) == len(TargetLib)
+    metadata = json.loads((tmp_path / "checksums.json").read_text())
+    assert metadata == compiled_metadata(TEMPLATE_PATH)
+    assert jinja2.__version__.startswith(f"{metadata['jinja2']}.")
+
+
+def test_get_environment_with_stale_compiled_templates(tmp_path, monkeypatch):
+    checksums_file = tmp_path / "checksums.json"
+    checksums_file.write_text('{"contract.web3_v7.jinja2": "stale"}')
+    monkeypatch.setattr(templates, "COMPILED_CHECKSUMS_FILE", checksums_file)
+    get_environment.cache_clear()
+    try:
+        env = get_environment(TEMPLATE_PATH)
+        assert isinstance(env.loader, FileSystemLoader)
+    finally:
+        get_environment.cache_clear()
+
+
+def test_template_checksums():
+    checksums = template_checksums(TEMPLATE_PATH)
+
+    assert set(checksums) == {get_template_name(t) for t in TargetLib}
+
+
+def test_get_environment_with_templates_compiled_by_other_jinja(tmp_path, monkeypatch):
+    checksums_file = tmp_path / "checksums.json"
+    metadata = {**compiled_metadata(TEMPLATE_PATH), "jinja2": "0.0"}
+    checksums_file.write_text(json.dumps(metadata))
+    monkeypatch.setattr(templates, "COMPILED_CHECKSUMS_FILE", checksums_file)
+    get_environment.cache_clear()
+    try:
+        env = get_environment(TEMPLATE_PATH)
+        assert isinstance(env.loader, FileSystemLoader)
+    finally:
+        get_environment.cache_clear()
+
+
+def test_get_environment_with_templates_compiled_by_other_jinja_patch_release(
+    tmp_path, monkeypatch
+):
+    checksums_file = tmp_path / "checksums.json"
+    checksums_file.write_text(json.dumps(compiled_metadata(TEMPLATE_PATH)))
+    monkeypatch.setattr(templates, "COMPILED_CHECKSUMS_FILE", checksums_file)
+    monkeypatch.setattr(jinja2, "__version__", f"{jinja_feature_release()}.99")
+    get_environment.cache_clear()
+    try:
+        env = get_environment(TEMPLATE_PATH)
+        assert isinstance(env.loader, ChoiceLoader)
+    finally:
+        get_environment.cache_clear()
@@ -0,0 +1,143 @@
+import json
+import os
+import threading
+from pathlib import Path
+
+from conftest import TEMPLATE_DIR
+
+from py_contract_codegen.modules import watch
+from py_contract_codegen.modules.batch import BatchJob, collect_jobs_from_dir
+from py_contract_codegen.modules.options import GenerateOptions
+from py_contract_codegen.modules.watch import Watcher
+
+
+def make_abi(name: str) -> str:
+    return json.dumps(
+        [
+            {
+                "type": "function",
+                "name": name,
+                "inputs": [],
+                "outputs": [{"name": "", "type": "uint256"}],
+                "stateMutability": "view",
+            }
+        ]
+    )
+
+
+def touch(path: Path, content: str) -> None:
+    # bump mtime explicitly, writes within the same tick may keep it unchanged
+    stat = path.stat() if path.exists() else None
+    path.write_text(content)
+    if stat is not None:
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def make_watcher(abi_dir: Path, out_dir: Path) -> Watcher:
+    return Watcher(
+        collect_jobs=lambda: collect_jobs_from_dir(abi_dir, out_dir),
+        options=GenerateOptions(template_path=TEMPLATE_DIR),
+        debounce=0.5,
+    )
+
+
+def test_watcher_generates_after_debounce(tmp_path):
+    abi_file = tmp_path / "token.json"
+    abi_file.write_text(make_abi("totalSupply"))
+    out_dir = tmp_path / "out"
+    watcher = make_watcher(tmp_path, out_dir)
+
+    assert watcher.poll(now=0.0) == []
+    assert not (out_dir / "token.py").exists()
+
+    results = watcher.poll(now=1.0)
+    assert [r.job.abi_path for r in results] == [abi_file]
+    assert results[0].ok
+    assert "def totalSupply" in (out_dir / "token.py").read_text()
+
+
+def test_watcher_debounces_bursts_of_writes(tmp_path):
+    abi_file = tmp_path / "token.json"
+    abi_file.write_text(make_abi("totalSupply"))
+    watcher = make_watcher(tmp_path, tmp_path / "out")
+    watcher.prime()
+
+    touch(abi_file, make_abi("first"))
+    assert watcher.poll(now=0.0) == []
+    touch(abi_file, make_abi("second"))
+    assert watcher.poll(now=0.4) == []
+    assert watcher.poll(now=0.8) == []
+
+    results = watcher.poll(now=1.0)
+    assert len(results) == 1
+    assert "def second" in (tmp_path / "out" / "token.py").read_text()
+
+
+def test_watcher_skips_unchanged_content(tmp_path):
+    abi_file = tmp_path / "token.json"
+    abi_file.write_text(make_abi("totalSupply"))
+    watcher = make_watcher(tmp_path, tmp_path / "out")
+    watcher.prime()
+
+    touch(abi_file, make_abi("totalSupply"))
+    watcher.poll(now=0.0)
+
+    assert watcher.poll(now=1.0) == []
+    assert not (tmp_path / "out" / "token.py").exists()
+
+
+def test_watcher_picks_up_new_and_invalid_files(tmp_path):
+    out_dir = tmp_path / "out"
+    watcher = make_watcher(tmp_path, out_dir)
+    watcher.prime()
+
+    (tmp_path / "vault.json").write_text(make_abi("deposit"))
+    (tmp_path / "broken.json").write_text("invalid json content")
+    watcher.poll(now=0.0)
+    results = watcher.poll(now=1.0)
+
+    assert {r.job.abi_path.name: r.ok for r in results} == {
+        "broken.json": False,
+        "vault.json": True,
+    }
+    assert (out_dir / "vault.py").exists()
+
+
+def test_watcher_retries_same_content_after_failure(tmp_path, monkeypatch):
+    abi_file = tmp_path / "token.json"
+    abi_file.write_text(make_abi("totalSupply"))
+    watcher = make_watcher(tmp_path, tmp_path / "out")
+    watcher.prime()
+
+    def fail(*args):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as m:
+        m.setattr(watch, "generate_targets", fail)
+        touch(abi_file, make_abi("balanceOf"))
+        watcher.poll(now=0.0)
+        assert [r.error for r in watcher.poll(now=1.0)] == ["disk full"]
+
+    # saved again without changes
+    touch(abi_file, make_abi("balanceOf"))
+    watcher.poll(now=2.0)
+    results = watcher.poll(now=3.0)
+    assert [r.ok for r in results] == [True]
+    assert (tmp_path / "out" / "token.py").exists()
+
+
+def test_watcher_run_until_stopped(tmp_path):
+    abi_file = tmp_path / "token.json"
+    abi_file.write_text(make_abi("totalSupply"))
+    job = BatchJob(abi_file, tmp_path / "token.py", "TokenContract")
+    stop = threading.Event()
+    watcher = Watcher(
+        collect_jobs=lambda: [job],
+        options=GenerateOptions(template_path=TEMPLATE_DIR),
+        interval=0.01,
+        debounce=0,
+    )
+
+    watcher.run(on_result=lambda result: stop.set(), stop=stop)
+
+    assert "class TokenContract" in job.out_file.read_text()
@@ -0,0 +1,97 @@
+import gc
+import json
+import weakref
+
+from conftest import ADDRESS, SAMPLE_ABI
+from web3 import Web3
+
+from py_contract_codegen.runtime import (
+    ContractBase,
+    build_contract,
+    clear_contract_cache,
+)
+from py_contract_codegen.runtime import contract as runtime_contract
+
+OTHER_ADDRESS = "0x0000000000000000000000000000000000000002"
+THIRD_ADDRESS = "0x0000000000000000000000000000000000000003"
+
+
+class Token(ContractBase):
+    def __init__(self, contract_address, web3):
+        super().__init__(contract_address, web3, SAMPLE_ABI)
+
+
+def test_build_contract_reuses_contracts():
+    web3 = Web3()
+
+    contract = build_contract(web3, ADDRESS, SAMPLE_ABI)
+
+    assert contract.address == ADDRESS
+    assert contract.abi == SAMPLE_ABI
+    assert build_contract(web3, ADDRESS, SAMPLE_ABI) is contract
+    other = build_contract(web3, OTHER_ADDRESS, SAMPLE_ABI)
+    assert other is not contract
+    # same ABI, same factory
+    assert type(other) is type(contract)
+
+
+def test_build_contract_per_web3_and_abi():
+    web3 = Web3()
+    contract = build_contract(web3, ADDRESS, SAMPLE_ABI)
+
+    assert build_contract(Web3(), ADDRESS, SAMPLE_ABI) is not contract
+    # ABIs are compared by identity
+    equal_abi = json.loads(json.dumps(SAMPLE_ABI))
+    assert build_contract(web3, ADDRESS, equal_abi) is not contract
+
+
+def test_clear_contract_cache():
+    web3 = Web3()
+    contract = build_contract(web3, ADDRESS, SAMPLE_ABI)
+
+    clear_contract_cache(web3)
+
+    assert build_contract(web3, ADDRESS, SAMPLE_ABI) is not contract
+
+
+def test_contract_cache_does_not_keep_web3_alive():
+    web3 = Web3()
+    token = Token(ADDRESS, web3)
+    ref = weakref.ref(web3)
+
+    del web3, token
+    gc.collect()
+
+    assert ref() is None
+
+
+def test_contract_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(runtime_contract, "MAX_CACHED_CONTRACTS", 2)
+    web3 = Web3()
+    first = build_contract(web3, ADDRESS, SAMPLE_ABI)
+    other = build_contract(web3, OTHER_ADDRESS, SAMPLE_ABI)
+    assert build_contract(web3, ADDRESS, SAMPLE_ABI) is first
+
+    # drops the least recently used
+    build_contract(web3, THIRD_ADDRESS, SAMPLE_ABI)
+
+    assert build_contract(web3, ADDRESS, SAMPLE_ABI) is first
+    assert build_contract(web3, OTHER_ADDRESS, SAMPLE_ABI) is not other
+
+
+def test_contract_base():
+    web3 = Web3()
+    token = Token(ADDRESS, web3)
+
+    assert token.contract_address == ADDRESS
+    assert token.web3 is web3
+    other = Token(ADDRESS, web3)
+    # the contract built for the address is reused, and copied per instance
+    assert other.contract is not token.contract
+    assert other.contract.functions is token.contract.functions
+    other.contract.address = OTHER_ADDRESS
+    assert token.contract.address == ADDRESS
+
+    function = token._build_function("transfer", OTHER_ADDRESS, 1)
+    assert function.fn_name == "transfer"
+    assert function.args == (OTHER_ADDRESS, 1)
@@ -0,0 +1,28 @@
+from unittest.mock import MagicMock, patch
+
+from py_contract_codegen.runtime import events
+from py_contract_codegen.runtime.events import get_logs
+
+
+def test_get_logs():
+    event = MagicMock()
+
+    get_logs(event, {"from": "0x01"}, 1, 2)
+
+    event.get_logs.assert_called_once_with(
+        argument_filters={"from": "0x01"}, from_block=1, to_block=2, block_hash=None
+    )
+
+
+def test_get_logs_with_web3_v6():
+    event = MagicMock()
+    events._block_keywords.cache_clear()
+    try:
+        with patch("web3.__version__", "6.20.0"):
+            get_logs(event, None, 1, "latest")
+    finally:
+        events._block_keywords.cache_clear()
+
+    event.get_logs.assert_called_once_with(
+        argument_filters=None, fromBlock=1, toBlock="latest", block_hash=None
+    )
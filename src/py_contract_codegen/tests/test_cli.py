@@ -48,7 +48,7 @@ def test_gen_with_abi_stdin(sample_abi):
     assert "def transfer" in result.stdout
 
 
-@patch("py_contract_codegen.cli.get_abi")
+@patch("py_contract_codegen.modules.etherscan.get_abi")
 def test_gen_with_contract_address(mock_get_abi, sample_abi):
     mock_get_abi.return_value = sample_abi
 
@@ -57,7 +57,7 @@ def test_gen_with_contract_address(mock_get_abi, sample_abi):
     assert "def transfer" in result.stdout
 
 
-@patch("py_contract_codegen.cli.get_abi")
+@patch("py_contract_codegen.modules.etherscan.get_abi")
 def test_gen_with_network(mock_get_abi, sample_abi):
     mock_get_abi.return_value = sample_abi
 
@@ -98,10 +98,583 @@ def test_gen_with_no_abi():
     assert "No ABI content provided" in result.stdout
 
 
-@patch("py_contract_codegen.cli.ContractCodeGenerator")
+@patch("py_contract_codegen.modules.code_generator.ContractCodeGenerator")
 def test_gen_with_exception(mock_generator):
-    mock_generator.side_effect = Exception("Test exception")
+    mock_generator.from_options.side_effect = Exception("Test exception")
 
     result = runner.invoke(app, ["gen", "--abi-stdin"])
     assert result.exit_code == 1
     assert "An error occurred: Test exception" in result.stdout
+
+
+def test_gen_batch_with_abi_dir(tmp_path, sample_abi):
+    abi_dir = tmp_path / "abi"
+    abi_dir.mkdir()
+    (abi_dir / "token.json").write_text(sample_abi)
+    (abi_dir / "vault.json").write_text(sample_abi)
+    out_dir = tmp_path / "out"
+
+    result = runner.invoke(
+        app,
+        ["gen-batch", "--abi-dir", str(abi_dir), "--out-dir", str(out_dir)],
+    )
+    assert result.exit_code == 0
+    assert "Generated 2/2 contracts (0 unchanged)" in result.stdout
+    assert "class TokenContract" in (out_dir / "token.py").read_text()
+    assert "class VaultContract" in (out_dir / "vault.py").read_text()
+
+
+def test_gen_batch_with_manifest(tmp_path, sample_abi):
+    (tmp_path / "token.json").write_text(sample_abi)
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(
+        json.dumps(
+            [{"abi_path": "token.json", "class_name": "MyToken", "out_file": "t.py"}]
+        )
+    )
+
+    result = runner.invoke(app, ["gen-batch", "--manifest", str(manifest)])
+    assert result.exit_code == 0
+    assert "class MyToken" in (tmp_path / "t.py").read_text()
+
+
+def test_gen_batch_with_failure(tmp_path, sample_abi):
+    abi_dir = tmp_path / "abi"
+    abi_dir.mkdir()
+    (abi_dir / "token.json").write_text(sample_abi)
+    (abi_dir / "broken.json").write_text("invalid json content")
+    out_dir = tmp_path / "out"
+
+    result = runner.invoke(
+        app,
+        [
+            "gen-batch",
+            "--abi-dir",
+            str(abi_dir),
+            "--out-dir",
+            str(out_dir),
+            "--workers",
+            "1",
+        ],
+    )
+    assert result.exit_code == 1
+    assert "Failed to generate" in result.stdout
+    assert "Generated 1/2 contracts" in result.stdout
+    assert (out_dir / "token.py").exists()
+
+
+def test_gen_batch_with_no_source():
+    result = runner.invoke(app, ["gen-batch"])
+    assert result.exit_code == 1
+    assert "No ABI directory, manifest or artifacts provided" in result.stdout
+
+
+def test_gen_batch_abi_dir_without_out_dir(tmp_path):
+    result = runner.invoke(app, ["gen-batch", "--abi-dir", str(tmp_path)])
+    assert result.exit_code == 1
+    assert "`--out-dir` is required" in result.stdout
+
+
+def test_gen_with_cache_dir(tmp_path, sample_abi):
+    abi_file = tmp_path / "sample.abi"
+    abi_file.write_text(sample_abi)
+    out_file = tmp_path / "output.py"
+    args = [
+        "gen",
+        "--abi-path",
+        str(abi_file),
+        "--out-file",
+        str(out_file),
+        "--cache-dir",
+        str(tmp_path / "cache"),
+    ]
+
+    result = runner.invoke(app, args)
+    assert result.exit_code == 0
+    assert "Generated code saved to" in result.stdout
+
+    result = runner.invoke(app, args)
+    assert result.exit_code == 0
+    assert "Generated code is up to date" in result.stdout
+
+
+def test_gen_batch_with_cache_dir(tmp_path, sample_abi):
+    abi_dir = tmp_path / "abi"
+    abi_dir.mkdir()
+    (abi_dir / "token.json").write_text(sample_abi)
+    (abi_dir / "vault.json").write_text(sample_abi)
+    args = [
+        "gen-batch",
+        "--abi-dir",
+        str(abi_dir),
+        "--out-dir",
+        str(tmp_path / "out"),
+        "--cache-dir",
+        str(tmp_path / "cache"),
+        "--workers",
+        "1",
+    ]
+
+    result = runner.invoke(app, args)
+    assert "Generated 2/2 contracts (0 unchanged)" in result.stdout
+
+    (abi_dir / "vault.json").write_text(sample_abi.replace("transfer", "send"))
+    result = runner.invoke(app, args)
+    assert result.exit_code == 0
+    assert "Generated 2/2 contracts (1 unchanged)" in result.stdout
+
+
+def test_gen_with_multiple_target_libs(tmp_path, sample_abi):
+    abi_file = tmp_path / "sample.abi"
+    abi_file.write_text(sample_abi)
+    out_file = tmp_path / "token.py"
+
+    result = runner.invoke(
+        app,
+        [
+            "gen",
+            "--abi-path",
+            str(abi_file),
+            "--out-file",
+            str(out_file),
+            "--target-lib",
+            "web3_v7",
+            "--target-lib",
+            "web3_v6",
+        ],
+    )
+    assert result.exit_code == 0
+    assert "Generated code saved to" in result.stdout
+    assert sorted(p.name for p in tmp_path.glob("token*.py")) == [
+        "token_web3_v6.py",
+        "token_web3_v7.py",
+    ]
+
+
+def test_gen_with_ast_backend(tmp_path, sample_abi):
+    abi_file = tmp_path / "sample.abi"
+    abi_file.write_text(sample_abi)
+
+    jinja_result = runner.invoke(app, ["gen", "--abi-path", str(abi_file)])
+    ast_result = runner.invoke(
+        app, ["gen", "--abi-path", str(abi_file), "--backend", "ast"]
+    )
+
+    assert ast_result.exit_code == 0
+    assert "class GeneratedContract" in ast_result.stdout
+    assert ast_result.stdout != jinja_result.stdout
+
+
+def test_gen_with_format(tmp_path, sample_abi):
+    pytest.importorskip("black")
+    abi_file = tmp_path / "sample.abi"
+    abi_file.write_text(sample_abi)
+
+    result = runner.invoke(
+        app, ["gen", "--abi-path", str(abi_file), "--format", "--no-daemon"]
+    )
+
+    assert result.exit_code == 0
+    assert (
+        result.stdout
+        == runner.invoke(
+            app, ["gen", "--abi-path", str(abi_file), "--backend", "ast", "--no-daemon"]
+        ).stdout
+    )
+
+
+def test_stream(sample_abi):
+    requests = [
+        {"id": "token", "abi": sample_abi, "class_name": "Token"},
+        {"id": "broken", "abi": "invalid json content"},
+    ]
+
+    result = runner.invoke(
+        app, ["stream"], input="".join(json.dumps(r) + "\n" for r in requests)
+    )
+
+    assert result.exit_code == 1
+    responses = [json.loads(line) for line in result.stdout.splitlines()[:2]]
+    assert [(r["id"], r["ok"]) for r in responses] == [
+        ("token", True),
+        ("broken", False),
+    ]
+    assert "class Token" in responses[0]["code"]
+    assert "Failed to generate 1/2 requests" in result.stdout
+
+
+def test_gen_with_bytecode(tmp_path, sample_abi):
+    abi_file = tmp_path / "sample.abi"
+    abi_file.write_text(sample_abi)
+    out_file = tmp_path / "token.py"
+
+    result = runner.invoke(
+        app,
+        [
+            "gen",
+            "--abi-path",
+            str(abi_file),
+            "--out-file",
+            str(out_file),
+            "--bytecode",
+            "unchecked_hash",
+            "--no-daemon",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert list((tmp_path / "__pycache__").glob("token.*.pyc"))
+
+
+def test_gen_bytecode_requires_out_file(sample_abi):
+    result = runner.invoke(
+        app, ["gen", "--abi-stdin", "--bytecode", "timestamp"], input=sample_abi
+    )
+    assert result.exit_code == 1
+    assert "`--bytecode` requires `--out-file`" in result.stdout
+
+
+def test_gen_with_abi_embedding(tmp_path, sample_abi):
+    abi_file = tmp_path / "sample.abi"
+    abi_file.write_text(sample_abi)
+    out_file = tmp_path / "token.py"
+
+    result = runner.invoke(
+        app,
+        [
+            "gen",
+            "--abi-path",
+            str(abi_file),
+            "--out-file",
+            str(out_file),
+            "--abi-embedding",
+            "sidecar",
+            "--no-daemon",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert 'ABI_FILE = Path(__file__).with_suffix(".abi.json")' in out_file.read_text()
+    assert json.loads((tmp_path / "token.abi.json").read_text()) == json.loads(
+        sample_abi
+    )
+
+
+def test_gen_with_abi_embedding_to_stdout(sample_abi):
+    result = runner.invoke(
+        app,
+        ["gen", "--abi-stdin", "--abi-embedding", "json", "--no-daemon"],
+        input=sample_abi,
+    )
+    assert result.exit_code == 0
+    assert "ABI_JSON = " in result.stdout
+
+
+def test_gen_abi_embedding_sidecar_requires_out_file(sample_abi):
+    result = runner.invoke(
+        app, ["gen", "--abi-stdin", "--abi-embedding", "sidecar"], input=sample_abi
+    )
+    assert result.exit_code == 1
+    assert "`--abi-embedding sidecar` requires `--out-file`" in result.stdout
+
+
+def test_gen_with_stub(tmp_path, sample_abi):
+    abi_file = tmp_path / "sample.abi"
+    abi_file.write_text(sample_abi)
+    out_file = tmp_path / "token.py"
+
+    result = runner.invoke(
+        app,
+        [
+            "gen",
+            "--abi-path",
+            str(abi_file),
+            "--out-file",
+            str(out_file),
+            "--stub",
+            "--no-daemon",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert "    def transfer(" not in out_file.read_text()
+    assert "    def transfer(" in (tmp_path / "token.pyi").read_text()
+
+
+def test_gen_stub_requires_out_file(sample_abi):
+    result = runner.invoke(app, ["gen", "--abi-stdin", "--stub"], input=sample_abi)
+    assert result.exit_code == 1
+    assert "`--stub` requires `--out-file`" in result.stdout
+
+
+def test_gen_with_runtime(sample_abi):
+    result = runner.invoke(
+        app,
+        ["gen", "--abi-stdin", "--runtime", "--class-name", "Token"],
+        input=sample_abi,
+    )
+
+    assert result.exit_code == 0
+    assert "from py_contract_codegen.runtime import ContractBase\n" in result.stdout
+    assert "class Token(ContractBase):" in result.stdout
+    assert "self.contract.functions" not in result.stdout
+
+
+def test_gen_with_member_filters(tmp_path, sample_abi):
+    abi_file = tmp_path / "sample.abi"
+    abi_file.write_text(sample_abi)
+    bot_file = tmp_path / "bot.py"
+    bot_file.write_text("token.balanceOf(owner)\n")
+
+    def gen(*options: str) -> str:
+        result = runner.invoke(
+            app, ["gen", "--abi-path", str(abi_file), "--no-daemon", *options]
+        )
+        assert result.exit_code == 0
+        return result.stdout
+
+    assert "def transfer(" in gen("--include", "0xa9059cbb")
+    assert "def transfer(" not in gen("--exclude", "transfer")
+    assert '"transfer"' not in gen("--used-in", str(bot_file))
+    assert "def transfer(" in gen("--used-in", str(bot_file), "--include", "transfer")
+
+
+def test_gen_multiple_target_libs_require_out_file(sample_abi):
+    result = runner.invoke(
+        app,
+        ["gen", "--abi-stdin", "--target-lib", "web3_v7", "--target-lib", "web3_v6"],
+        input=sample_abi,
+    )
+    assert result.exit_code == 1
+    assert "Multiple `--target-lib` require `--out-file`" in result.stdout
+
+
+def test_gen_batch_with_multiple_target_libs(tmp_path, sample_abi):
+    abi_dir = tmp_path / "abi"
+    abi_dir.mkdir()
+    (abi_dir / "token.json").write_text(sample_abi)
+    out_dir = tmp_path / "out"
+
+    result = runner.invoke(
+        app,
+        [
+            "gen-batch",
+            "--abi-dir",
+            str(abi_dir),
+            "--out-dir",
+            str(out_dir),
+            "--target-lib",
+            "web3_v7",
+            "--target-lib",
+            "web3_v6",
+        ],
+    )
+    assert result.exit_code == 0
+    assert sorted(p.name for p in out_dir.iterdir()) == [
+        "token_web3_v6.py",
+        "token_web3_v7.py",
+    ]
+
+
+def test_gen_batch_with_package(tmp_path, sample_abi):
+    abi_dir = tmp_path / "abis"
+    abi_dir.mkdir()
+    for name in ("usdc", "dai"):
+        (abi_dir / f"{name}.json").write_text(sample_abi)
+    out_dir = tmp_path / "contracts"
+
+    result = runner.invoke(
+        app,
+        [
+            "gen-batch",
+            "--abi-dir",
+            str(abi_dir),
+            "--out-dir",
+            str(out_dir),
+            "--package",
+            "--workers",
+            "1",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert "Generated 2/2 contracts" in result.stdout
+    assert len(list(out_dir.glob("abi_*.py"))) == 1
+    assert "import DaiContract as UsdcContract" in (out_dir / "__init__.py").read_text()
+
+
+def test_gen_watch_requires_abi_path_and_out_file(sample_abi):
+    result = runner.invoke(app, ["gen", "--abi-stdin", "--watch"], input=sample_abi)
+    assert result.exit_code == 1
+    assert "`--watch` requires `--abi-path` and `--out-file`" in result.stdout
+
+
+@patch("py_contract_codegen.modules.watch.Watcher.run")
+def test_gen_with_watch(mock_run, tmp_path, sample_abi):
+    abi_file = tmp_path / "sample.abi"
+    abi_file.write_text(sample_abi)
+    out_file = tmp_path / "output.py"
+
+    result = runner.invoke(
+        app,
+        ["gen", "--abi-path", str(abi_file), "--out-file", str(out_file), "--watch"],
+    )
+    assert result.exit_code == 0
+    assert out_file.exists()
+    assert "Watching for ABI changes" in result.stdout
+    mock_run.assert_called_once()
+
+
+@patch("py_contract_codegen.cli.is_own_socket", return_value=True)
+@patch("py_contract_codegen.cli.request_generation")
+def test_gen_forwards_to_daemon(mock_request, _, tmp_path, sample_abi):
+    socket_path = tmp_path / "codegen.sock"
+    socket_path.touch()
+    mock_request.return_value = {"ok": True, "code": "class FromDaemon: ..."}
+
+    result = runner.invoke(
+        app, ["gen", "--abi-stdin", "--socket", str(socket_path)], input=sample_abi
+    )
+    assert result.exit_code == 0
+    assert "class FromDaemon" in result.stdout
+    request = mock_request.call_args.args[1]
+    assert request["abi"] == sample_abi
+    assert request["out_file"] is None
+
+
+def test_gen_falls_back_without_daemon(tmp_path, sample_abi):
+    socket_path = tmp_path / "codegen.sock"
+    socket_path.touch()
+
+    result = runner.invoke(
+        app, ["gen", "--abi-stdin", "--socket", str(socket_path)], input=sample_abi
+    )
+    assert result.exit_code == 0
+    assert "def transfer" in result.stdout
+
+
+@patch("py_contract_codegen.cli.request_generation")
+def test_gen_ignores_socket_not_owned_by_daemon(mock_request, tmp_path, sample_abi):
+    # not a socket, so not one the daemon of this user created
+    socket_path = tmp_path / "codegen.sock"
+    socket_path.touch()
+
+    result = runner.invoke(
+        app, ["gen", "--abi-stdin", "--socket", str(socket_path)], input=sample_abi
+    )
+    assert result.exit_code == 0
+    assert "def transfer" in result.stdout
+    mock_request.assert_not_called()
+
+
+@patch("py_contract_codegen.cli.request_generation")
+def test_gen_with_no_daemon(mock_request, tmp_path, sample_abi):
+    socket_path = tmp_path / "codegen.sock"
+    socket_path.touch()
+
+    result = runner.invoke(
+        app,
+        ["gen", "--abi-stdin", "--socket", str(socket_path), "--no-daemon"],
+        input=sample_abi,
+    )
+    assert result.exit_code == 0
+    assert "def transfer" in result.stdout
+    mock_request.assert_not_called()
+
+
+def test_gen_batch_with_artifacts(tmp_path, sample_abi):
+    output_file = tmp_path / "solc-output.json"
+    output_file.write_text(
+        json.dumps(
+            {
+                "contracts": {
+                    "src/Token.sol": {"Token": {"abi": json.loads(sample_abi)}},
+                    "src/Lib.sol": {"Lib": {"abi": []}},
+                }
+            }
+        )
+    )
+    out_dir = tmp_path / "out"
+
+    result = runner.invoke(
+        app,
+        [
+            "gen-batch",
+            "--artifacts",
+            str(output_file),
+            "--artifact-format",
+            "solc",
+            "--out-dir",
+            str(out_dir),
+            "--workers",
+            "1",
+        ],
+    )
+    assert result.exit_code == 0
+    assert "Generated 1/1 contracts" in result.stdout
+    assert "class TokenContract" in (out_dir / "token.py").read_text()
+
+
+def test_gen_batch_artifacts_with_watch(tmp_path):
+    result = runner.invoke(
+        app,
+        [
+            "gen-batch",
+            "--artifacts",
+            str(tmp_path),
+            "--out-dir",
+            str(tmp_path / "out"),
+            "--watch",
+        ],
+    )
+    assert result.exit_code == 1
+    assert "`--watch` is not supported with `--artifacts`" in result.stdout
+
+
+@patch("py_contract_codegen.modules.etherscan.get_abi")
+def test_gen_with_profile(mock_get_abi, sample_abi):
+    mock_get_abi.return_value = sample_abi
+    profile_runner = CliRunner(mix_stderr=False)
+
+    result = profile_runner.invoke(
+        app,
+        ["gen", "--contract-address", "0x1234", "--profile", "--no-profile-memory"],
+    )
+
+    assert result.exit_code == 0
+    assert "class GeneratedContract" in result.stdout
+    report = json.loads(result.stderr)
+    assert {"fetch", "validate", "parse", "render", "write"} <= set(report["stages"])
+    assert report["stages"]["fetch"]["peak_memory"] is None
+    assert report["abi"]["bytes"] == len(sample_abi)
+
+
+def test_gen_batch_with_profile(tmp_path, sample_abi):
+    abi_dir = tmp_path / "abi"
+    abi_dir.mkdir()
+    (abi_dir / "token.json").write_text(sample_abi)
+    (abi_dir / "vault.json").write_text(sample_abi)
+    profile_runner = CliRunner(mix_stderr=False)
+
+    result = profile_runner.invoke(
+        app,
+        [
+            "gen-batch",
+            "--abi-dir",
+            str(abi_dir),
+            "--out-dir",
+            str(tmp_path / "out"),
+            "--workers",
+            "1",
+            "--profile",
+        ],
+    )
+
+    assert result.exit_code == 0
+    report = json.loads(result.stderr)
+    assert [c["abi_path"] for c in report["contracts"]] == [
+        str(abi_dir / "token.json"),
+        str(abi_dir / "vault.json"),
+    ]
+    assert report["total"]["stages"]["parse"]["calls"] == 2
+    assert report["total"]["abi"]["functions"] == 2
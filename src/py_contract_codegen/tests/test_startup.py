@@ -0,0 +1,43 @@
+import re
+import subprocess
+import sys
+
+# Generous enough for slow CI machines, while importing jinja2/eth_abi/httpx at startup exceeds it.
+IMPORT_TIME_BUDGET_US = 100_000
+HEAVY_MODULES = ("jinja2", "eth_abi", "eth_typing", "eth_utils", "httpx", "web3")
+IMPORT_TIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def import_times(module: str) -> list[tuple[int, int, str]]:
+    """
+    Run `python -X importtime` and return `(cumulative_us, depth, name)` per imported module.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return [
+        (int(m.group(2)), len(m.group(3)) // 2, m.group(4))
+        for m in map(IMPORT_TIME_LINE.match, result.stderr.splitlines())
+        if m
+    ]
+
+
+def test_cli_does_not_import_heavy_modules():
+    imported = {
+        name.split(".")[0] for _, _, name in import_times("py_contract_codegen.cli")
+    }
+
+    assert imported.isdisjoint(HEAVY_MODULES)
+
+
+def test_cli_import_time_budget():
+    module = "py_contract_codegen.cli"
+    times = import_times(module)
+    total = next(us for us, depth, name in times if depth == 0 and name == module)
+    # typer is required by every command, so it's outside of our budget
+    typer = next(us for us, depth, name in times if depth == 1 and name == "typer")
+
+    assert total - typer < IMPORT_TIME_BUDGET_US